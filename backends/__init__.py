@@ -0,0 +1,17 @@
+from .fake_gpio import FakeGPIO
+from .gpiochip import GpioChip
+from .gpiomem import GpioMem
+from .hc595 import HC595Chain
+from .fake_spidev import SpiDev as FakeSpiDev
+from .registry import (
+	get_backend,
+	register_backend,
+	resolve_backend,
+	set_default_backend,
+)
+from .trace import (
+	TraceRecorder,
+	diff_traces,
+	read_trace,
+	replay,
+)
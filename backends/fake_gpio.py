@@ -0,0 +1,127 @@
+import sys
+from types import ModuleType
+
+from . import registry
+
+class FakeGPIO ():
+	'''
+		An in-process stand in for the RPi.GPIO
+		module, for running components off-device.
+	'''
+	BCM = 11
+	BOARD = 10
+	OUT = 0
+	IN = 1
+	HIGH = 1
+	LOW = 0
+	PUD_OFF = 20
+	PUD_DOWN = 21
+	PUD_UP = 22
+
+	def __init__ (self, record = False):
+		'''
+			Set up the fake pin state,
+			optionally recording every call.
+		'''
+		self.record = record
+		self.calls = []
+		self.mode = None
+		self.directions = {}
+		self.levels = {}
+		self.output_calls = 0
+
+	def setmode (self, mode):
+		'''
+			Set the pin numbering mode.
+		'''
+		if self.record:
+			self.calls.append (('setmode', mode))
+		self.mode = mode
+
+	def getmode (self):
+		'''
+			Return the pin numbering mode.
+		'''
+		return self.mode
+
+	def setwarnings (self, flag):
+		'''
+			Accept and ignore warning settings.
+		'''
+		pass
+
+	def setup (
+		self,
+		channel,
+		direction,
+		pull_up_down = None,
+		initial = None,
+	):
+		'''
+			Set the direction of the given channel
+			or list of channels.
+		'''
+		if self.record:
+			self.calls.append (('setup', channel, direction, initial))
+		channels = channel if isinstance (channel, (list, tuple)) else (channel,)
+		for c in channels:
+			self.directions[c] = direction
+			if initial is not None:
+				self.levels[c] = initial
+
+	def output (self, channel, value):
+		'''
+			Set the level of the given channel or
+			channels, as RPi.GPIO.output does.
+		'''
+		self.output_calls += 1
+		if self.record:
+			self.calls.append (('output', channel, value))
+		if isinstance (channel, (list, tuple)):
+			if not isinstance (value, (list, tuple)):
+				value = [value] * len (channel)
+			for c, v in zip (channel, value):
+				self.levels[c] = v
+		else:
+			self.levels[channel] = value
+
+	def input (self, channel):
+		'''
+			Return the level of the given channel.
+		'''
+		return self.levels.get (channel, self.LOW)
+
+	def cleanup (self, channel = None):
+		'''
+			Forget the state of the given
+			channel or of all channels.
+		'''
+		if channel is None:
+			self.directions.clear ()
+			self.levels.clear ()
+		else:
+			self.directions.pop (channel, None)
+			self.levels.pop (channel, None)
+
+	def reset (self):
+		'''
+			Forget all recorded calls.
+		'''
+		self.calls = []
+		self.output_calls = 0
+
+def install (fake_gpio = None):
+	'''
+		Install a fake in place of RPi.GPIO so
+		components can run off-device, replacing
+		any rpi backend already made.
+		Return the installed fake.
+	'''
+	if fake_gpio is None:
+		fake_gpio = FakeGPIO ()
+	package = ModuleType ('RPi')
+	package.GPIO = fake_gpio
+	sys.modules['RPi'] = package
+	sys.modules['RPi.GPIO'] = fake_gpio
+	registry.BACKENDS.pop ('rpi', None)
+	return fake_gpio
@@ -0,0 +1,136 @@
+from enum import Enum
+import sys
+from types import ModuleType
+
+class Direction (Enum):
+	'''
+		A stand in for gpiod.line.Direction.
+	'''
+	AS_IS = 1
+	INPUT = 2
+	OUTPUT = 3
+
+class Value (Enum):
+	'''
+		A stand in for gpiod.line.Value.
+	'''
+	INACTIVE = 0
+	ACTIVE = 1
+
+class LineSettings ():
+	'''
+		A stand in for gpiod.LineSettings.
+	'''
+
+	def __init__ (
+		self,
+		direction = Direction.AS_IS,
+		output_value = Value.INACTIVE,
+		**kwargs
+	):
+		'''
+			Hold the given settings.
+		'''
+		self.direction = direction
+		self.output_value = output_value
+
+class LineRequest ():
+	'''
+		An in-process stand in for gpiod.LineRequest,
+		counting the calls that would each be an ioctl.
+	'''
+
+	def __init__ (self, chip, path, consumer, config):
+		'''
+			Request the given lines, failing for any
+			already held by another request.
+		'''
+		self.__chip = chip
+		self.path = path
+		self.consumer = consumer
+		self.offsets = []
+		for offsets, settings in config.items ():
+			if not isinstance (offsets, (list, tuple)):
+				offsets = (offsets,)
+			for offset in offsets:
+				if offset in chip.held:
+					raise OSError (16, 'Device or resource busy')
+				self.offsets.append (offset)
+				chip.directions[offset] = settings.direction
+				if settings.direction == Direction.OUTPUT:
+					chip.levels[offset] = settings.output_value
+		chip.held.update (self.offsets)
+		chip.requests.append (self)
+
+	def set_values (self, values):
+		'''
+			Set the given mapping of
+			offsets to values at once.
+		'''
+		self.__chip.ioctls += 1
+		for offset, value in values.items ():
+			if offset not in self.offsets:
+				raise ValueError ('Line {} not requested.'.format (offset))
+			self.__chip.levels[offset] = value
+
+	def set_value (self, offset, value):
+		'''
+			Set the value of one line.
+		'''
+		self.set_values ({offset: value})
+
+	def get_value (self, offset):
+		'''
+			Return the value of one line.
+		'''
+		self.__chip.ioctls += 1
+		return self.__chip.levels.get (offset, Value.INACTIVE)
+
+	def release (self):
+		'''
+			Give the lines back.
+		'''
+		self.__chip.held.difference_update (self.offsets)
+		self.offsets = []
+
+class FakeChip ():
+	'''
+		The state of one fake GPIO chip: the lines
+		held and their directions and levels, the
+		requests made and the ioctls those made.
+	'''
+
+	def __init__ (self):
+		'''
+			Start with every line free.
+		'''
+		self.held = set ()
+		self.directions = {}
+		self.levels = {}
+		self.requests = []
+		self.ioctls = 0
+
+def install (chip = None):
+	'''
+		Install a fake gpiod module, with every
+		request made on the given fake chip, so
+		the gpiod backend can run off-device.
+		Return the fake chip.
+	'''
+	if chip is None:
+		chip = FakeChip ()
+	line = ModuleType ('gpiod.line')
+	line.Direction = Direction
+	line.Value = Value
+	module = ModuleType ('gpiod')
+	module.line = line
+	module.LineSettings = LineSettings
+	module.request_lines = lambda path, consumer = None, config = None: LineRequest (
+		chip,
+		path,
+		consumer,
+		config,
+	)
+	sys.modules['gpiod'] = module
+	sys.modules['gpiod.line'] = line
+	return chip
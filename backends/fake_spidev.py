@@ -0,0 +1,66 @@
+import sys
+from types import ModuleType
+
+class SpiDev ():
+	'''
+		An in-process stand in for spidev.SpiDev,
+		recording every transfer made.
+	'''
+
+	def __init__ (self, bus = None, device = None):
+		'''
+			Set up the fake device, opening
+			it if given a bus and device.
+		'''
+		self.bus = self.device = None
+		self.max_speed_hz = 125000000
+		self.mode = 0
+		self.transfers = []
+		if bus is not None:
+			self.open (bus, device)
+
+	def open (self, bus, device):
+		'''
+			Open the given bus and device.
+		'''
+		self.bus = bus
+		self.device = device
+
+	def close (self):
+		'''
+			Close the device.
+		'''
+		self.bus = self.device = None
+
+	def writebytes (self, values):
+		'''
+			Record the given list of byte values.
+		'''
+		self.transfers.append (bytes (values))
+
+	def writebytes2 (self, values):
+		'''
+			Record the given buffer of bytes.
+		'''
+		self.transfers.append (bytes (values))
+
+	def xfer (self, values, *args):
+		'''
+			Record the given list of byte
+			values, reading back zeros.
+		'''
+		self.transfers.append (bytes (values))
+		return [0] * len (values)
+
+	xfer2 = xfer
+
+def install ():
+	'''
+		Install a fake spidev module so
+		SPI components can run off-device.
+		Return the installed module.
+	'''
+	module = ModuleType ('spidev')
+	module.SpiDev = SpiDev
+	sys.modules['spidev'] = module
+	return module
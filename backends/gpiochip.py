@@ -0,0 +1,163 @@
+from ..exceptions import ImproperlyConfigured
+
+class GpioChip ():
+	'''
+		A GPIO backend on the GPIO character device
+		through libgpiod's gpiod module (version 2),
+		with the subset of the RPi.GPIO API used by
+		the components. Every line set up is held in
+		one line request, so a multi-channel output
+		call sets all its lines in one ioctl.
+		Share one backend between components
+		driving lines in common.
+	'''
+	BCM = 11
+	BOARD = 10
+	OUT = 0
+	IN = 1
+	HIGH = 1
+	LOW = 0
+	PUD_OFF = 20
+	PUD_DOWN = 21
+	PUD_UP = 22
+
+	def __init__ (
+		self,
+		path = '/dev/gpiochip0',
+		consumer = 'electronics',
+	):
+		'''
+			Set up a backend for lines
+			on the given chip.
+		'''
+		try:
+			import gpiod
+			from gpiod.line import (
+				Direction,
+				Value,
+			)
+		except ImportError:
+			raise ImproperlyConfigured ('GpioChip requires the gpiod package.')
+		self.path = path
+		self.consumer = consumer
+		self.__gpiod = gpiod
+		self.__directions = {
+			self.OUT: Direction.OUTPUT,
+			self.IN: Direction.INPUT,
+		}
+		self.__values = (Value.INACTIVE, Value.ACTIVE)
+		## Lines set up, to their direction and level:
+		self.__lines = {}
+		self.__request = None
+
+	def __settings (self):
+		'''
+			Return the line config for
+			every line set up.
+		'''
+		return {
+			offset: self.__gpiod.LineSettings (
+				direction = self.__directions[direction],
+				output_value = self.__values[level],
+			)
+			for offset, (direction, level) in self.__lines.items ()
+		}
+
+	def __requested (self):
+		'''
+			Return the line request for every
+			line set up, making it if needed.
+		'''
+		if self.__request is None:
+			self.__request = self.__gpiod.request_lines (
+				self.path,
+				consumer = self.consumer,
+				config = self.__settings (),
+			)
+		return self.__request
+
+	def setmode (self, mode):
+		'''
+			Accept BCM pin numbering, which
+			is the line offsets on the Pi.
+		'''
+		if mode != self.BCM:
+			raise ImproperlyConfigured ('GpioChip only supports BCM pin numbering.')
+
+	def getmode (self):
+		'''
+			Return the pin numbering mode.
+		'''
+		return self.BCM
+
+	def setwarnings (self, flag):
+		'''
+			Accept and ignore warning settings.
+		'''
+		pass
+
+	def setup (
+		self,
+		channel,
+		direction,
+		pull_up_down = None,
+		initial = None,
+	):
+		'''
+			Set the direction and initial level of the
+			given channel or list of channels, to be
+			requested along with every other line.
+		'''
+		if pull_up_down not in (None, self.PUD_OFF):
+			raise ImproperlyConfigured ('GpioChip does not set pull up or down.')
+		channels = channel if isinstance (channel, (list, tuple)) else (channel,)
+		for c in channels:
+			self.__lines[c] = (direction, 1 if initial else 0)
+		## Lines can't be added to a request, so remake it:
+		if self.__request is not None:
+			self.__request.release ()
+			self.__request = None
+
+	def output (self, channel, value):
+		'''
+			Set the level of the given channel or
+			channels, as RPi.GPIO.output does,
+			in one ioctl.
+		'''
+		values = self.__values
+		lines = self.__lines
+		request = self.__request or self.__requested ()
+		if isinstance (channel, (list, tuple)):
+			if not isinstance (value, (list, tuple)):
+				value = [value] * len (channel)
+			request.set_values ({
+				c: values[1 if v else 0]
+				for c, v in zip (channel, value)
+			})
+			for c, v in zip (channel, value):
+				lines[c] = (lines[c][0], 1 if v else 0)
+		else:
+			level = 1 if value else 0
+			request.set_values ({channel: values[level]})
+			lines[channel] = (lines[channel][0], level)
+
+	def input (self, channel):
+		'''
+			Return the level of the given channel.
+		'''
+		return 1 if self.__requested ().get_value (channel) == self.__values[1] else 0
+
+	def cleanup (self, channel = None):
+		'''
+			Release the given channel
+			or all channels.
+		'''
+		if self.__request is not None:
+			self.__request.release ()
+			self.__request = None
+		if channel is None:
+			self.__lines.clear ()
+		else:
+			self.__lines.pop (channel, None)
+
+	close = cleanup
@@ -0,0 +1,184 @@
+import mmap
+import os
+import stat
+
+from ..exceptions import ImproperlyConfigured
+
+## Register word offsets in the BCM2835-BCM2711 GPIO block:
+GPFSEL0 = 0x00 // 4
+GPSET0 = 0x1c // 4
+GPCLR0 = 0x28 // 4
+GPLEV0 = 0x34 // 4
+BLOCK_SIZE = 4096
+NUMBER_PINS = 54
+
+class GpioMem ():
+	'''
+		A GPIO backend writing the GPIO registers
+		directly through a memory map of /dev/gpiomem,
+		with the subset of the RPi.GPIO API used by
+		the components. Any file can be mapped in place
+		of the device, for simulation and tests, in
+		which case the level registers are kept up to
+		date with what was last output.
+	'''
+	BCM = 11
+	BOARD = 10
+	OUT = 0
+	IN = 1
+	HIGH = 1
+	LOW = 0
+	PUD_OFF = 20
+	PUD_DOWN = 21
+	PUD_UP = 22
+
+	def __init__ (self, path = '/dev/gpiomem'):
+		'''
+			Map the GPIO registers from the given path,
+			creating a plain file there if there's none
+			(other than under /dev, where a missing
+			device is an error rather than a file
+			to simulate with).
+		'''
+		self.path = path
+		flags = os.O_RDWR | os.O_SYNC
+		if not os.path.abspath (path).startswith ('/dev/'):
+			flags |= os.O_CREAT
+		try:
+			self.__fd = os.open (path, flags, 0o600)
+		except OSError as e:
+			raise ImproperlyConfigured (
+				'Unable to open {} for GPIO: {}'.format (path, e)
+			)
+		mode = os.fstat (self.__fd).st_mode
+		self.__simulated = not stat.S_ISCHR (mode)
+		## A plain file needs to be big enough to map:
+		if self.__simulated and os.fstat (self.__fd).st_size < BLOCK_SIZE:
+			os.ftruncate (self.__fd, BLOCK_SIZE)
+		self.__map = mmap.mmap (self.__fd, BLOCK_SIZE)
+		## Each register is one native 32-bit word:
+		self.__words = memoryview (self.__map).cast ('I')
+		self.__pins_set_up = set ()
+
+	@property
+	def simulated (self):
+		'''
+			Return a boolean for whether a plain
+			file is mapped in place of the device.
+		'''
+		return self.__simulated
+
+	def __check (self, channel):
+		'''
+			Raise an error for an
+			unknown pin number.
+		'''
+		if not 0 <= channel < NUMBER_PINS:
+			raise ValueError ('No BCM GPIO pin {}.'.format (channel))
+
+	def setmode (self, mode):
+		'''
+			Accept BCM pin numbering,
+			the only numbering registers use.
+		'''
+		if mode != self.BCM:
+			raise ImproperlyConfigured ('GpioMem only supports BCM pin numbering.')
+
+	def getmode (self):
+		'''
+			Return the pin numbering mode.
+		'''
+		return self.BCM
+
+	def setwarnings (self, flag):
+		'''
+			Accept and ignore warning settings.
+		'''
+		pass
+
+	def setup (
+		self,
+		channel,
+		direction,
+		pull_up_down = None,
+		initial = None,
+	):
+		'''
+			Set the direction of the given channel
+			or list of channels, setting the initial
+			level before an output is driven.
+		'''
+		if pull_up_down not in (None, self.PUD_OFF):
+			raise ImproperlyConfigured ('GpioMem does not set pull up or down.')
+		channels = channel if isinstance (channel, (list, tuple)) else (channel,)
+		for c in channels:
+			self.__check (c)
+		if direction == self.OUT and initial is not None:
+			self.output (list (channels), initial)
+		words = self.__words
+		for c in channels:
+			register = GPFSEL0 + c // 10
+			shift = 3 * (c % 10)
+			function = 1 if direction == self.OUT else 0
+			words[register] = (words[register] & ~(7 << shift)) | (function << shift)
+			self.__pins_set_up.add (c)
+
+	def output (self, channel, value):
+		'''
+			Set the level of the given channel or
+			channels, as RPi.GPIO.output does, with
+			one 32-bit store clearing and one setting
+			the pins of each bank of 32.
+			Clears are stored before sets.
+		'''
+		if isinstance (channel, (list, tuple)):
+			if not isinstance (value, (list, tuple)):
+				value = [value] * len (channel)
+			pairs = zip (channel, value)
+		else:
+			pairs = ((channel, value),)
+		set_masks = [0, 0]
+		clear_masks = [0, 0]
+		for c, v in pairs:
+			self.__check (c)
+			if v:
+				set_masks[c >> 5] |= 1 << (c & 31)
+			else:
+				clear_masks[c >> 5] |= 1 << (c & 31)
+		words = self.__words
+		for bank in (0, 1):
+			if clear_masks[bank]:
+				words[GPCLR0 + bank] = clear_masks[bank]
+			if set_masks[bank]:
+				words[GPSET0 + bank] = set_masks[bank]
+			## The device updates levels itself:
+			if self.__simulated and (clear_masks[bank] or set_masks[bank]):
+				words[GPLEV0 + bank] = (words[GPLEV0 + bank] & ~clear_masks[bank]) | set_masks[bank]
+
+	def input (self, channel):
+		'''
+			Return the level of the given channel.
+		'''
+		self.__check (channel)
+		return (self.__words[GPLEV0 + (channel >> 5)] >> (channel & 31)) & 1
+
+	def cleanup (self, channel = None):
+		'''
+			Return the given channel or all channels
+			set up to being inputs.
+		'''
+		channels = list (self.__pins_set_up) if channel is None else [channel]
+		for c in channels:
+			self.setup (c, self.IN)
+			self.__pins_set_up.discard (c)
+
+	def close (self):
+		'''
+			Unmap the registers and
+			close the device.
+		'''
+		if self.__map is not None:
+			self.__words.release ()
+			self.__map.close ()
+			os.close (self.__fd)
+			self.__map = None
@@ -0,0 +1,183 @@
+from collections import namedtuple
+
+from .fake_gpio import FakeGPIO
+
+## A difference found between the simulated chain
+## and what a shift register believes it holds:
+Mismatch = namedtuple (
+	'Mismatch',
+	(
+		'stage',
+		'expected',
+		'actual',
+	),
+)
+
+class HC595Chain (FakeGPIO):
+	'''
+		A fake GPIO module wired to a simulated chain
+		of 74HC595s, modelling the shift and storage
+		stages as bit fields with bit x for output x:
+		data shifts in on each rising clock edge
+		(unless SRCLR is held active), storage takes
+		the shift stage on each rising latch edge and
+		OE decides whether the outputs are driven.
+	'''
+
+	def __init__ (
+		self,
+		number_outputs,
+		data_pin_id = 4,
+		clock_pin_id = 17,
+		latch_pin_id = 18,
+		clear_pin_id = None,
+		enable_pin_id = None,
+		clear_active_low = True,
+		enable_active_low = True,
+		record = False,
+	):
+		'''
+			Set up a chain with the given number of
+			outputs, wired to the given pins (clear and
+			enable are optional), with both stages clear.
+		'''
+		super ().__init__ (record = record)
+		self.number_outputs = number_outputs
+		self.__mask = (1 << number_outputs) - 1
+		self.__data_pin_id = data_pin_id
+		self.__clock_pin_id = clock_pin_id
+		self.__latch_pin_id = latch_pin_id
+		self.__clear_pin_id = clear_pin_id
+		self.__enable_pin_id = enable_pin_id
+		## Pin levels where the pins are active:
+		self.__clear_level = 0 if clear_active_low else 1
+		self.__enable_level = 0 if enable_active_low else 1
+		## Every pin starts low:
+		self.__data = self.__clock = self.__latch = 0
+		self.__clearing = clear_pin_id is not None and self.__clear_level == 0
+		self.__enabled = enable_pin_id is None or self.__enable_level == 0
+		self.shift = 0
+		self.storage = 0
+		self.number_clocks = 0
+		self.number_latches = 0
+		self.mismatches = []
+
+	@property
+	def enabled (self):
+		'''
+			Return a boolean for whether
+			the outputs are driven.
+		'''
+		return self.__enabled
+
+	@property
+	def outputs (self):
+		'''
+			Return the parallel outputs as an integer,
+			with bit x for output x, or None while
+			they're disabled (high impedance).
+		'''
+		return self.storage if self.__enabled else None
+
+	def __set (self, channel, value):
+		'''
+			Set the given channel to the given value,
+			stepping the chain on any edge it makes.
+		'''
+		value = 1 if value else 0
+		if channel == self.__clock_pin_id:
+			if value and not self.__clock:
+				self.number_clocks += 1
+				if not self.__clearing:
+					self.shift = ((self.shift << 1) | self.__data) & self.__mask
+			self.__clock = value
+		elif channel == self.__data_pin_id:
+			self.__data = value
+		elif channel == self.__latch_pin_id:
+			if value and not self.__latch:
+				self.number_latches += 1
+				self.storage = self.shift
+			self.__latch = value
+		elif channel == self.__clear_pin_id:
+			self.__clearing = value == self.__clear_level
+			if self.__clearing:
+				self.shift = 0
+		elif channel == self.__enable_pin_id:
+			self.__enabled = value == self.__enable_level
+		self.levels[channel] = value
+
+	def setup (
+		self,
+		channel,
+		direction,
+		pull_up_down = None,
+		initial = None,
+	):
+		'''
+			Set up the given channel or channels,
+			driving any initial level into the chain.
+		'''
+		super ().setup (channel, direction, pull_up_down = pull_up_down)
+		if initial is not None:
+			for c in channel if isinstance (channel, (list, tuple)) else (channel,):
+				self.__set (c, initial)
+
+	def output (self, channel, value):
+		'''
+			Set the level of the given channel or
+			channels, in order, as RPi.GPIO.output does.
+		'''
+		self.output_calls += 1
+		if self.record:
+			self.calls.append (('output', channel, value))
+		## Clock edges are most of the traffic,
+		## so are stepped without a further call:
+		if channel == self.__clock_pin_id:
+			if value:
+				if not self.__clock:
+					self.number_clocks += 1
+					if not self.__clearing:
+						self.shift = ((self.shift << 1) | self.__data) & self.__mask
+					self.__clock = 1
+			else:
+				self.__clock = 0
+		elif isinstance (channel, (list, tuple)):
+			if not isinstance (value, (list, tuple)):
+				value = [value] * len (channel)
+			for c, v in zip (channel, value):
+				self.__set (c, v)
+		else:
+			self.__set (channel, value)
+
+	def input (self, channel):
+		'''
+			Return the level of the given channel.
+		'''
+		if channel == self.__clock_pin_id:
+			return self.__clock
+		return super ().input (channel)
+
+	def check (self, shift_register, raise_error = False):
+		'''
+			Compare the chain with what the given shift
+			register believes it has written, output and
+			enabled, recording any mismatch, or raising it as an
+			AssertionError if requested. Return a boolean
+			for whether they matched.
+		'''
+		mask = (1 << len (shift_register.written)) - 1
+		matched = True
+		for stage, expected, actual in (
+			('shift', shift_register.to_int (written = True), self.shift & mask),
+			('storage', shift_register.to_int (), self.storage),
+		) + (
+			(('enabled', shift_register.enabled, self.__enabled),)
+			if shift_register.controlling_enable_pin else ()
+		):
+			if expected != actual:
+				mismatch = Mismatch (stage, expected, actual)
+				self.mismatches.append (mismatch)
+				if raise_error:
+					raise AssertionError (mismatch)
+				matched = False
+		return matched
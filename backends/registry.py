@@ -0,0 +1,91 @@
+from ..exceptions import ImproperlyConfigured
+
+def rpi_gpio ():
+	'''
+		Return the RPi.GPIO module,
+		set to BCM pin numbering.
+	'''
+	try:
+		from RPi import GPIO
+	except ImportError:
+		raise ImproperlyConfigured ('The rpi GPIO backend requires RPi.GPIO.')
+	GPIO.setmode (GPIO.BCM)
+	return GPIO
+
+def fake_gpio ():
+	'''
+		Return a fake GPIO module
+		for running off-device.
+	'''
+	from .fake_gpio import FakeGPIO
+	return FakeGPIO ()
+
+def gpiomem ():
+	'''
+		Return a backend on /dev/gpiomem.
+	'''
+	from .gpiomem import GpioMem
+	return GpioMem ()
+
+def gpiochip ():
+	'''
+		Return a backend on /dev/gpiochip0.
+	'''
+	from .gpiochip import GpioChip
+	return GpioChip ()
+
+## Backend names to the functions making them:
+FACTORIES = {
+	'rpi': rpi_gpio,
+	'fake': fake_gpio,
+	'gpiomem': gpiomem,
+	'gpiochip': gpiochip,
+}
+## Backends made so far, shared by every component:
+BACKENDS = {}
+DEFAULT_BACKEND = 'rpi'
+
+def register_backend (name, factory):
+	'''
+		Register a function making a GPIO
+		backend under the given name.
+	'''
+	FACTORIES[name] = factory
+	BACKENDS.pop (name, None)
+
+def set_default_backend (name):
+	'''
+		Set the backend components use
+		when not given one.
+	'''
+	global DEFAULT_BACKEND
+	if name not in FACTORIES:
+		raise ImproperlyConfigured ('No GPIO backend named {}.'.format (name))
+	DEFAULT_BACKEND = name
+
+def get_backend (name = None):
+	'''
+		Return the named backend (defaults to the
+		default backend), making it the first time
+		it's asked for.
+	'''
+	if name is None:
+		name = DEFAULT_BACKEND
+	backend = BACKENDS.get (name)
+	if backend is None:
+		try:
+			factory = FACTORIES[name]
+		except KeyError:
+			raise ImproperlyConfigured ('No GPIO backend named {}.'.format (name))
+		backend = BACKENDS[name] = factory ()
+	return backend
+
+def resolve_backend (gpio = None):
+	'''
+		Return the given backend, or the named
+		backend if given a name, or the default
+		backend if given nothing.
+	'''
+	if gpio is None or isinstance (gpio, str):
+		return get_backend (gpio)
+	return gpio
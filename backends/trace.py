@@ -0,0 +1,190 @@
+import mmap
+import os
+import struct
+from time import (
+	monotonic_ns as time_monotonic_ns,
+	perf_counter as time_perf_counter,
+)
+
+from .fake_gpio import FakeGPIO
+
+## A trace file is a header then a ring of fixed width
+## records. Each record carries a sequence number, which
+## is never 0 so unused records can be told apart, and
+## the oldest record follows the break in the sequence:
+MAGIC = b'PINTRACE'
+VERSION = 1
+HEADER = struct.Struct ('<8sIII')
+## Monotonic nanoseconds, sequence, pin and level:
+RECORD = struct.Struct ('<QIHBx')
+SEQUENCE_MODULUS = (1 << 32) - 1
+
+class TraceRecorder ():
+	'''
+		A GPIO backend wrapping another, recording
+		every pin transition it makes into a fixed
+		size, memory mapped ring file, keeping the
+		most recent transitions once full.
+	'''
+
+	def __init__ (self, gpio, path, capacity = 65536):
+		'''
+			Wrap the given GPIO backend, recording
+			up to the given number of transitions
+			into a new file at the given path.
+		'''
+		self.__gpio = gpio
+		self.__capacity = capacity
+		self.__count = 0
+		fd = os.open (path, os.O_RDWR | os.O_CREAT | os.O_TRUNC, 0o644)
+		try:
+			os.ftruncate (fd, HEADER.size + capacity * RECORD.size)
+			self.__map = mmap.mmap (fd, 0)
+		finally:
+			os.close (fd)
+		HEADER.pack_into (self.__map, 0, MAGIC, VERSION, RECORD.size, capacity)
+
+	def __getattr__ (self, name):
+		'''
+			Pass everything else on
+			to the wrapped backend.
+		'''
+		return getattr (self.__gpio, name)
+
+	@property
+	def count (self):
+		'''
+			Return the number of
+			transitions recorded.
+		'''
+		return self.__count
+
+	def __record (self, channel, value):
+		'''
+			Record the given channel or channels
+			going to the given value or values.
+		'''
+		now = time_monotonic_ns ()
+		pack_into = RECORD.pack_into
+		target = self.__map
+		capacity = self.__capacity
+		count = self.__count
+		if isinstance (channel, (list, tuple)):
+			if not isinstance (value, (list, tuple)):
+				value = [value] * len (channel)
+			for c, v in zip (channel, value):
+				pack_into (
+					target,
+					HEADER.size + (count % capacity) * RECORD.size,
+					now,
+					count % SEQUENCE_MODULUS + 1,
+					c,
+					1 if v else 0,
+				)
+				count += 1
+		else:
+			pack_into (
+				target,
+				HEADER.size + (count % capacity) * RECORD.size,
+				now,
+				count % SEQUENCE_MODULUS + 1,
+				channel,
+				1 if value else 0,
+			)
+			count += 1
+		self.__count = count
+
+	def setup (
+		self,
+		channel,
+		direction,
+		pull_up_down = None,
+		initial = None,
+	):
+		'''
+			Set up the given channel or channels,
+			recording any initial level.
+		'''
+		if initial is not None:
+			self.__record (channel, initial)
+		if pull_up_down is None:
+			self.__gpio.setup (channel, direction, initial = initial)
+		else:
+			self.__gpio.setup (channel, direction, pull_up_down = pull_up_down, initial = initial)
+
+	def output (self, channel, value):
+		'''
+			Record then make an output call.
+		'''
+		self.__record (channel, value)
+		self.__gpio.output (channel, value)
+
+	def close (self):
+		'''
+			Flush and close the trace file.
+		'''
+		if self.__map is not None:
+			self.__map.flush ()
+			self.__map.close ()
+			self.__map = None
+
+def read_trace (path):
+	'''
+		Return the transitions recorded in the trace
+		file at the given path, oldest first, as
+		(monotonic ns, pin, level) tuples.
+	'''
+	with open (path, 'rb') as f:
+		data = f.read ()
+	magic, version, record_size, capacity = HEADER.unpack_from (data)
+	if magic != MAGIC or version != VERSION or record_size != RECORD.size:
+		raise ValueError ('{} is not a version {} pin trace.'.format (path, VERSION))
+	records = list (RECORD.iter_unpack (data[HEADER.size:HEADER.size + capacity * RECORD.size]))
+	## Find the newest record, followed by an unused
+	## record or, once wrapped, the oldest:
+	start = 0
+	for i, record in enumerate (records):
+		following = records[(i + 1) % capacity][1]
+		if record[1] and following != record[1] % SEQUENCE_MODULUS + 1:
+			start = (i + 1) % capacity
+			break
+	return [
+		(ns, pin, level)
+		for ns, sequence, pin, level in records[start:] + records[:start]
+		if sequence
+	]
+
+def replay (records, gpio = None, realtime = False):
+	'''
+		Feed the given transitions back through the
+		given GPIO backend (defaults to a new recording
+		FakeGPIO), one output call each and in order,
+		as fast as possible or with their original
+		spacing if requested. Return the backend.
+	'''
+	## Imported here, as components import the backends:
+	from ..components.pulse_timing import wait_until
+	if gpio is None:
+		gpio = FakeGPIO (record = True)
+	if not records:
+		return gpio
+	start = time_perf_counter ()
+	first = records[0][0]
+	for ns, pin, level in records:
+		if realtime:
+			wait_until (start + (ns - first) / 1e9)
+		gpio.output (pin, level)
+	return gpio
+
+def diff_traces (records, other_records):
+	'''
+		Return the index of the first transition that
+		differs between the given traces, by pin and
+		level only, or None if they're the same.
+	'''
+	for i, (a, b) in enumerate (zip (records, other_records)):
+		if a[1:] != b[1:]:
+			return i
+	if len (records) != len (other_records):
+		return min (len (records), len (other_records))
+	return None
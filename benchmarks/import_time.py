@@ -0,0 +1,49 @@
+import os
+from statistics import median
+import subprocess
+import sys
+
+## The package is the directory above this one:
+PACKAGE_DIRECTORY = os.path.dirname (os.path.dirname (os.path.abspath (__file__)))
+PACKAGE = __package__.split ('.')[0] if __package__ else os.path.basename (PACKAGE_DIRECTORY)
+
+MEASURE = '''
+import sys
+from time import perf_counter
+start = perf_counter ()
+import {module}
+print (perf_counter () - start, 'RPi' in sys.modules)
+'''
+
+def import_seconds (module, repeats = 10):
+	'''
+		Return the median seconds importing the given
+		module takes in a fresh interpreter, and whether
+		any import pulled in RPi.GPIO.
+	'''
+	seconds = []
+	touched_gpio = False
+	for i in range (repeats):
+		result = subprocess.run (
+			[sys.executable, '-c', MEASURE.format (module = module)],
+			cwd = os.path.dirname (PACKAGE_DIRECTORY),
+			capture_output = True,
+			text = True,
+			check = True,
+		)
+		time_taken, imported = result.stdout.split ()
+		seconds.append (float (time_taken))
+		touched_gpio = touched_gpio or imported == 'True'
+	return median (seconds), touched_gpio
+
+if __name__ == '__main__':
+	for name in ('components', 'mixins', 'tests'):
+		module = '{}.{}'.format (PACKAGE, name)
+		seconds, touched_gpio = import_seconds (module)
+		print (
+			'import {}: {:.1f} ms{}'.format (
+				module,
+				seconds * 1000,
+				', imported RPi.GPIO' if touched_gpio else '',
+			)
+		)
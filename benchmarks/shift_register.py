@@ -0,0 +1,289 @@
+from functools import partial
+from random import getrandbits as random_getrandbits
+from threading import (
+	Lock,
+	Thread,
+)
+from time import perf_counter as time_perf_counter
+
+from ..backends import (
+	fake_gpio,
+	fake_gpiod,
+	GpioChip,
+)
+from ..components import (
+	QueuedShiftRegister,
+	ShiftRegister,
+)
+
+## Backends are resolved as each shift register is
+## made, so the fakes only need to be in place first:
+FAKE_GPIO = fake_gpio.install ()
+FAKE_CHIP = fake_gpiod.install ()
+
+def create_shift_register (number_outputs, **kwargs):
+	'''
+		Create a shift register with the given
+		number of outputs on the fake GPIO.
+	'''
+	return ShiftRegister (
+		number_outputs = number_outputs,
+		data_pin_id = 4,
+		clock_pin_id = 17,
+		latch_pin_id = 18,
+		**kwargs
+	)
+
+def random_frames (number_outputs, number_frames):
+	'''
+		Return the given number of random
+		frames for the given number of outputs.
+	'''
+	return [
+		[random_getrandbits (1) for i in range (number_outputs)]
+		for f in range (number_frames)
+	]
+
+def from_list_per_bit (shift_register, to_set, latch = True):
+	'''
+		Write the given list one next call at a time,
+		the way from_list did before it was compiled.
+	'''
+	for v in reversed (to_set):
+		shift_register.next (v)
+	if latch:
+		shift_register.latch ()
+
+def from_list_compiled (shift_register, to_set, latch = True):
+	'''
+		Write the given list with from_list,
+		without reusing previous data.
+	'''
+	shift_register.from_list (
+		to_set,
+		latch = latch,
+		reuse_previous = False,
+	)
+
+def outputs_written (write, number_outputs, frames):
+	'''
+		Return the outputs the given write function
+		leaves after each of the given frames.
+	'''
+	shift_register = create_shift_register (number_outputs)
+	outputs = []
+	for frame in frames:
+		write (shift_register, frame)
+		outputs.append (shift_register.output)
+	return outputs
+
+def frames_per_second (
+	write,
+	number_outputs,
+	frames,
+	**kwargs
+):
+	'''
+		Return the rate the given write function
+		writes the given frames at, on a shift
+		register made with the given options.
+	'''
+	shift_register = create_shift_register (number_outputs, **kwargs)
+	start = time_perf_counter ()
+	for frame in frames:
+		write (shift_register, frame)
+	return len (frames) / (time_perf_counter () - start)
+
+def benchmark_from_list (number_outputs = 64, number_frames = 500):
+	'''
+		Compare the frames per second of the
+		per-bit and compiled from_list write paths,
+		checking both leave the same outputs.
+	'''
+	frames = random_frames (number_outputs, number_frames)
+	if outputs_written (
+		from_list_per_bit,
+		number_outputs,
+		frames[:10],
+	) != outputs_written (
+		from_list_compiled,
+		number_outputs,
+		frames[:10],
+	):
+		raise AssertionError ('The write paths left different outputs.')
+	return {
+		'number_outputs': number_outputs,
+		'before': frames_per_second (from_list_per_bit, number_outputs, frames),
+		'after': frames_per_second (from_list_compiled, number_outputs, frames),
+	}
+
+def benchmark_cache (
+	number_outputs = 64,
+	number_distinct = 4,
+	number_frames = 500,
+):
+	'''
+		Compare the frames per second of from_list
+		with and without the compiled write cache,
+		cycling through a few distinct frames.
+	'''
+	frames = random_frames (number_outputs, number_distinct) * (number_frames // number_distinct)
+	return {
+		'number_outputs': number_outputs,
+		'before': frames_per_second (ShiftRegister.from_list, number_outputs, frames),
+		'after': frames_per_second (
+			ShiftRegister.from_list,
+			number_outputs,
+			frames,
+			cache_size = number_distinct,
+		),
+	}
+
+def benchmark_backends (number_outputs = 64, number_frames = 500):
+	'''
+		Compare the frames per second and GPIO calls
+		per frame of from_list on the RPi.GPIO and
+		gpiod backends, on the fakes of each.
+	'''
+	frames = random_frames (number_outputs, number_frames)
+	FAKE_GPIO.reset ()
+	before = frames_per_second (ShiftRegister.from_list, number_outputs, frames)
+	before_calls = FAKE_GPIO.output_calls
+	ioctls = FAKE_CHIP.ioctls
+	gpio = GpioChip ()
+	after = frames_per_second (
+		ShiftRegister.from_list,
+		number_outputs,
+		frames,
+		gpio = gpio,
+	)
+	gpio.cleanup ()
+	return {
+		'number_outputs': number_outputs,
+		'before': before,
+		'after': after,
+		'before_calls': before_calls / number_frames,
+		'after_calls': (FAKE_CHIP.ioctls - ioctls) / number_frames,
+	}
+
+def contended_writes (write, frames, number_threads, flush = None):
+	'''
+		Write the given frames from every one of the
+		given number of threads at once, with the given
+		write function returning once written or
+		returning a future for when written, then
+		call the given flush function if any.
+		Return the seconds taken and the latency of
+		each call, from being made until written.
+	'''
+	latencies = []
+	def done (start, future):
+		latencies.append (time_perf_counter () - start)
+	def write_frames ():
+		for frame in frames:
+			start = time_perf_counter ()
+			future = write (frame)
+			if future is None:
+				done (start, None)
+			else:
+				future.add_done_callback (partial (done, start))
+	threads = [
+		Thread (target = write_frames)
+		for t in range (number_threads)
+	]
+	start = time_perf_counter ()
+	for thread in threads:
+		thread.start ()
+	for thread in threads:
+		thread.join ()
+	if flush is not None:
+		flush ()
+	return time_perf_counter () - start, latencies
+
+def benchmark_contention (
+	number_outputs = 64,
+	number_threads = 8,
+	number_frames = 200,
+):
+	'''
+		Compare several threads writing through one
+		shift register behind a coarse lock and through
+		a queued shift register, with and without merging
+		consecutive writes. For each, give the frames
+		actually written per second and the mean and
+		worst latency of a call in milliseconds. With
+		merging, also give the calls taken per second,
+		counting merged frames, and how many merged.
+	'''
+	frames = random_frames (number_outputs, number_frames)
+	number_calls = number_threads * number_frames
+	shift_register = create_shift_register (number_outputs)
+	lock = Lock ()
+	def locked_write (frame):
+		with lock:
+			shift_register.from_list (frame)
+	result = {
+		'number_outputs': number_outputs,
+		'number_threads': number_threads,
+	}
+	def record (key, seconds, latencies, number_written):
+		result[key] = number_written / seconds
+		result[key + '_latency'] = 1000 * sum (latencies) / len (latencies)
+		result[key + '_max_latency'] = 1000 * max (latencies)
+	seconds, latencies = contended_writes (locked_write, frames, number_threads)
+	record ('before', seconds, latencies, number_calls)
+	for key, merge_writes in (('after', True), ('after_unmerged', False)):
+		queued = QueuedShiftRegister (
+			create_shift_register (number_outputs),
+			merge_writes = merge_writes,
+		)
+		seconds, latencies = contended_writes (
+			queued.write,
+			frames,
+			number_threads,
+			flush = queued.flush,
+		)
+		## Merged frames are never written,
+		## so only count the writes made:
+		record (key, seconds, latencies, queued.number_run)
+		result[key + '_calls'] = number_calls / seconds
+		result[key + '_merged'] = queued.number_merged
+		queued.close ()
+	return result
+
+if __name__ == '__main__':
+	for number_outputs in (8, 64, 512):
+		result = benchmark_from_list (number_outputs)
+		print (
+			'{number_outputs} outputs: {before:.0f} -> {after:.0f} frames/sec'.format (
+				**result
+			)
+		)
+	for number_outputs in (8, 64, 512):
+		result = benchmark_cache (number_outputs)
+		print (
+			'{number_outputs} outputs, cached: {before:.0f} -> {after:.0f} frames/sec'.format (
+				**result
+			)
+		)
+	for number_outputs in (8, 64, 512):
+		result = benchmark_backends (number_outputs)
+		print (
+			'{number_outputs} outputs, RPi.GPIO -> gpiod: {before:.0f} -> {after:.0f} frames/sec, '
+			'{before_calls:.1f} -> {after_calls:.1f} calls/frame'.format (
+				**result
+			)
+		)
+	for number_outputs in (8, 64, 512):
+		result = benchmark_contention (number_outputs)
+		print (
+			'{number_outputs} outputs, {number_threads} threads, lock -> queue: '
+			'{before:.0f} -> {after:.0f} frames written/sec, '
+			'{before_latency:.2f} -> {after_latency:.2f} ms/call '
+			'({before_max_latency:.2f} -> {after_max_latency:.2f} ms worst); '
+			'merged: {after_calls:.0f} calls/sec with {after_merged} merged; '
+			'unmerged: {after_unmerged:.0f} frames written/sec, '
+			'{after_unmerged_latency:.2f} ms/call'.format (
+				**result
+			)
+		)
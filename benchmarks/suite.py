@@ -0,0 +1,174 @@
+import json
+import sys
+import tracemalloc
+from argparse import ArgumentParser
+from random import Random
+from time import perf_counter as time_perf_counter
+
+from .shift_register import (
+	FAKE_GPIO,
+	create_shift_register,
+)
+
+NUMBER_OUTPUTS = (8, 64, 512, 4096)
+PATTERNS = ('dense', 'sparse', 'random', 'reusable')
+## Roughly how many bits to write per measurement:
+BITS_PER_MEASUREMENT = 50000
+
+def pattern_frames (pattern, number_outputs, number_frames, seed = 0):
+	'''
+		Return the given number of frames of the given
+		pattern: dense (mostly on), sparse (one output
+		on), random, or reusable (each frame the one
+		before shifted along by one).
+	'''
+	random = Random (seed)
+	if pattern == 'dense':
+		return [
+			[int (random.random () < 0.9) for i in range (number_outputs)]
+			for f in range (number_frames)
+		]
+	if pattern == 'sparse':
+		frames = [[0] * number_outputs for f in range (number_frames)]
+		for frame in frames:
+			frame[random.randrange (number_outputs)] = 1
+		return frames
+	if pattern == 'random':
+		return [
+			[random.getrandbits (1) for i in range (number_outputs)]
+			for f in range (number_frames)
+		]
+	if pattern == 'reusable':
+		frame = [random.getrandbits (1) for i in range (number_outputs)]
+		frames = []
+		for f in range (number_frames):
+			frame = [random.getrandbits (1)] + frame[:-1]
+			frames.append (frame)
+		return frames
+	raise ValueError ('Unknown pattern {}.'.format (pattern))
+
+def operations (method, pattern, shift_register, number_operations):
+	'''
+		Return a list of calls, without arguments,
+		each making one call of the given method
+		on the given shift register.
+	'''
+	number_outputs = len (shift_register)
+	if method == 'from_list':
+		return [
+			lambda frame = frame: shift_register.from_list (frame)
+			for frame in pattern_frames (pattern, number_outputs, number_operations)
+		]
+	if method == 'from_pin_list':
+		return [
+			lambda pins = [i for i, v in enumerate (frame) if v]: shift_register.from_pin_list (pins)
+			for frame in pattern_frames (pattern, number_outputs, number_operations)
+		]
+	if method == 'all':
+		return [
+			lambda on_or_off = i % 2: shift_register.all (on_or_off, latch = True)
+			for i in range (number_operations)
+		]
+	if method == 'clear':
+		return [shift_register.clear] * number_operations
+	if method == 'shift':
+		return [shift_register.shift] * number_operations
+	if method == 'next':
+		return [
+			lambda on_or_off = i % 2: shift_register.next (on_or_off, latch = True)
+			for i in range (number_operations)
+		]
+	raise ValueError ('Unknown method {}.'.format (method))
+
+def measure (method, pattern, number_outputs):
+	'''
+		Return the wall time, GPIO calls and peak
+		allocation of the given method writing the
+		given pattern to a fake shift register
+		with the given number of outputs.
+	'''
+	## Only shift and next write a single bit:
+	bits_per_operation = 1 if method in ('shift', 'next') else number_outputs
+	number_operations = max (5, min (1000, BITS_PER_MEASUREMENT // bits_per_operation))
+	shift_register = create_shift_register (number_outputs)
+	calls = operations (method, pattern, shift_register, number_operations)
+	## Time without tracing:
+	FAKE_GPIO.reset ()
+	start = time_perf_counter ()
+	for call in calls:
+		call ()
+	seconds = time_perf_counter () - start
+	gpio_calls = FAKE_GPIO.output_calls
+	## Then trace allocations on a short second pass:
+	tracemalloc.start ()
+	for call in calls[:10]:
+		call ()
+	allocated_bytes_peak = tracemalloc.get_traced_memory ()[1]
+	tracemalloc.stop ()
+	return {
+		'method': method,
+		'pattern': pattern,
+		'number_outputs': number_outputs,
+		'number_operations': number_operations,
+		'seconds_per_operation': seconds / number_operations,
+		'operations_per_second': number_operations / seconds,
+		'gpio_calls_per_operation': gpio_calls / number_operations,
+		'gpio_calls_per_bit': gpio_calls / (number_operations * bits_per_operation),
+		'allocated_bytes_peak': allocated_bytes_peak,
+	}
+
+def run_suite (
+	number_outputs_list = NUMBER_OUTPUTS,
+	patterns = PATTERNS,
+):
+	'''
+		Measure every write path of a shift register
+		on the fake GPIO for each of the given chain
+		lengths, with each of the given frame patterns
+		for the frame writing methods.
+	'''
+	results = []
+	for number_outputs in number_outputs_list:
+		for method in ('from_list', 'from_pin_list'):
+			for pattern in patterns:
+				results.append (measure (method, pattern, number_outputs))
+		for method in ('all', 'clear', 'shift', 'next'):
+			results.append (measure (method, None, number_outputs))
+	return {
+		'python': sys.version,
+		'results': results,
+	}
+
+def compare (before, after):
+	'''
+		Return the speed up of every measurement
+		in the given after suite results over the
+		matching one in the given before results.
+	'''
+	def key (result):
+		return (result['method'], result['pattern'], result['number_outputs'])
+	before_results = {key (result): result for result in before['results']}
+	return [
+		dict (
+			zip (('method', 'pattern', 'number_outputs'), key (result)),
+			speed_up = before_results[key (result)]['seconds_per_operation'] / result['seconds_per_operation'],
+		)
+		for result in after['results'] if key (result) in before_results
+	]
+
+if __name__ == '__main__':
+	parser = ArgumentParser (description = 'Benchmark shift register write paths on a fake GPIO.')
+	parser.add_argument ('--number-outputs', type = int, nargs = '+', default = NUMBER_OUTPUTS)
+	parser.add_argument ('--patterns', nargs = '+', default = PATTERNS, choices = PATTERNS)
+	parser.add_argument ('--output', help = 'Write the JSON results to this file.')
+	parser.add_argument ('--compare', help = 'Compare against the JSON results in this file.')
+	arguments = parser.parse_args ()
+	suite = run_suite (arguments.number_outputs, arguments.patterns)
+	if arguments.output:
+		with open (arguments.output, 'w') as output_file:
+			json.dump (suite, output_file, indent = 1)
+	if arguments.compare:
+		with open (arguments.compare) as compare_file:
+			json.dump (compare (json.load (compare_file), suite), sys.stdout, indent = 1)
+	else:
+		json.dump (suite, sys.stdout, indent = 1)
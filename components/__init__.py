@@ -1 +1,40 @@
+from importlib import import_module
+
 from .shift_register import ShiftRegister
+from .shift_register_bank import ShiftRegisterBank
+from .spi_shift_register import SpiShiftRegister
+from .frame_writer import FrameWriter
+from .binary_code_modulator import BinaryCodeModulator
+from .led_matrix import LedMatrix
+from .pulse_timing import PulseTiming
+from .input_register import InputRegister
+from .input_poller import InputPoller
+
+## Facades pulling in asyncio, concurrent.futures or
+## shared memory are only imported once first used,
+## keeping importing the components quick:
+_LAZY_MODULES = {
+	'AsyncShiftRegister': '.async_shift_register',
+	'QueuedShiftRegister': '.queued_shift_register',
+	'FrameClient': '.frame_daemon',
+	'FrameDaemon': '.frame_daemon',
+}
+
+def __getattr__ (name):
+	'''
+		Import the given facade on first use.
+	'''
+	if name not in _LAZY_MODULES:
+		raise AttributeError (
+			'module {!r} has no attribute {!r}'.format (__name__, name)
+		)
+	value = getattr (import_module (_LAZY_MODULES[name], __name__), name)
+	globals ()[name] = value
+	return value
+
+def __dir__ ():
+	'''
+		List the facades along with
+		everything already imported.
+	'''
+	return sorted (set (globals ()) | set (_LAZY_MODULES))
@@ -0,0 +1,142 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
+class AsyncShiftRegister ():
+	'''
+		An asyncio facade over a shift register, doing
+		the pin work on a thread of its own so writes
+		don't block the event loop. Calls are made one
+		at a time in the order awaited, holding the
+		register's lock so calls through other facades
+		over it never interleave, while facades over
+		registers on different pins update concurrently.
+	'''
+
+	def __init__ (self, shift_register):
+		'''
+			Wrap the given shift register.
+		'''
+		self.__shift_register = shift_register
+		## One worker keeps calls in order, one at a time:
+		self.__executor = ThreadPoolExecutor (
+			max_workers = 1,
+			thread_name_prefix = 'AsyncShiftRegister',
+		)
+
+	async def __aenter__ (self):
+		'''
+			Use the facade as an async context
+			manager, closing it on exit.
+		'''
+		return self
+
+	async def __aexit__ (self, *args):
+		'''
+			Close the facade.
+		'''
+		await self.close ()
+
+	@property
+	def shift_register (self):
+		'''
+			Return the shift register wrapped.
+		'''
+		return self.__shift_register
+
+	@property
+	def output (self):
+		'''
+			Return the outputs currently latched.
+		'''
+		return self.__shift_register.output
+
+	def __call (self, call):
+		'''
+			Make the given call holding
+			the shift register's lock.
+		'''
+		with self.__shift_register.lock:
+			return call ()
+
+	async def run (self, method, *args, **kwargs):
+		'''
+			Call the given shift register method (or any
+			callable) with the given arguments on the
+			worker thread, after every call awaited before
+			it, and return its result.
+		'''
+		return await asyncio.get_running_loop ().run_in_executor (
+			self.__executor,
+			partial (self.__call, partial (method, *args, **kwargs)),
+		)
+
+	async def write (
+		self,
+		to_set,
+		latch = True,
+		reuse_previous = True,
+	):
+		'''
+			Write the given list of output values
+			as from_list does, returning the plan used.
+		'''
+		return await self.run (
+			self.__shift_register.from_list,
+			to_set,
+			latch = latch,
+			reuse_previous = reuse_previous,
+		)
+
+	async def write_int (
+		self,
+		value,
+		number = None,
+		latch = True,
+		reuse_previous = True,
+	):
+		'''
+			Write the given integer as from_int
+			does, returning the plan used.
+		'''
+		return await self.run (
+			self.__shift_register.from_int,
+			value,
+			number = number,
+			latch = latch,
+			reuse_previous = reuse_previous,
+		)
+
+	async def clear (self):
+		'''
+			Turn off all outputs.
+		'''
+		await self.run (self.__shift_register.clear)
+
+	async def latch (self):
+		'''
+			Pulse the latch pin.
+		'''
+		await self.run (self.__shift_register.latch)
+
+	async def enable (self):
+		'''
+			Enable the outputs.
+		'''
+		await self.run (self.__shift_register.enable)
+
+	async def disable (self):
+		'''
+			Disable the outputs.
+		'''
+		await self.run (self.__shift_register.disable)
+
+	async def close (self):
+		'''
+			Finish any calls still
+			pending, then stop the worker.
+		'''
+		await asyncio.get_running_loop ().run_in_executor (
+			None,
+			self.__executor.shutdown,
+		)
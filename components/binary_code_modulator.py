@@ -0,0 +1,171 @@
+from threading import (
+	Event,
+	Thread,
+)
+from time import perf_counter as time_perf_counter
+
+from .pulse_timing import wait_until
+
+class BinaryCodeModulator ():
+	'''
+		A class for giving the outputs of a shift
+		register per-output brightness, using binary
+		code modulation: each bit of the intensities
+		is shown as a frame (a bit plane) for a time
+		weighted by that bit.
+	'''
+
+	def __init__ (
+		self,
+		shift_register,
+		bits = 8,
+		base_seconds = 0.00005,
+	):
+		'''
+			Set up brightness control with the given
+			number of bits for the given shift register,
+			showing the lowest bit plane for the given
+			number of seconds. All outputs start off.
+		'''
+		self.__shift_register = shift_register
+		self.__bits = bits
+		self.__base_seconds = base_seconds
+		self.__planes = (0,) * bits
+		self.__compiled_planes = self.__compile (self.__planes)
+		self.__number_refreshes = 0
+		self.__stop = Event ()
+		self.__thread = None
+
+	@property
+	def bits (self):
+		'''
+			Return the number of
+			bits of brightness.
+		'''
+		return self.__bits
+
+	@property
+	def maximum (self):
+		'''
+			Return the highest intensity.
+		'''
+		return (1 << self.__bits) - 1
+
+	@property
+	def planes (self):
+		'''
+			Return the bit plane frames as integers,
+			lowest bit first, with bit x for output x.
+		'''
+		return self.__planes
+
+	@property
+	def refresh_seconds (self):
+		'''
+			Return the time one refresh of
+			every bit plane should take.
+		'''
+		return self.__base_seconds * self.maximum
+
+	@property
+	def number_refreshes (self):
+		'''
+			Return the number of refreshes
+			completed.
+		'''
+		return self.__number_refreshes
+
+	@property
+	def running (self):
+		'''
+			Return a boolean for whether
+			the refresh loop is running.
+		'''
+		return self.__thread is not None
+
+	def __compile (self, planes):
+		'''
+			Return the writes of the given bit planes
+			compiled once, each from the plane before it
+			and the first from the last, so refreshes
+			only emit them.
+		'''
+		return tuple (
+			self.__shift_register.compile_cycle (
+				planes,
+				latch = False,
+			)
+		)
+
+	def set_intensities (self, intensities):
+		'''
+			Set each output's brightness from the given
+			list of intensities (0 up to maximum), so
+			intensities[0] is for output 0 etc. The bit
+			planes and their writes are worked out once
+			here, taking effect from the next refresh.
+		'''
+		if len (intensities) > len (self.__shift_register):
+			raise ValueError ('There are more intensities than outputs.')
+		maximum = self.maximum
+		if any (not 0 <= v <= maximum for v in intensities):
+			raise ValueError ('Intensities must be from 0 to {}.'.format (maximum))
+		## Read each plane off the intensities'
+		## binary digits, highest output first:
+		digits = ['{:0{}b}'.format (v, self.__bits) for v in reversed (intensities)]
+		planes = tuple (
+			int (''.join ([d[-1 - b] for d in digits]) or '0', 2)
+			for b in range (self.__bits)
+		)
+		self.__planes, self.__compiled_planes = planes, self.__compile (planes)
+
+	def refresh (self):
+		'''
+			Show every bit plane once, each for its
+			binary weighted time. Each plane's compiled
+			write is emitted while the one before it is
+			showing, then latched when that one's time
+			is up.
+		'''
+		shift_register = self.__shift_register
+		base_seconds = self.__base_seconds
+		deadline = time_perf_counter ()
+		for b, compiled_write in enumerate (self.__compiled_planes):
+			shift_register.write_compiled (compiled_write)
+			wait_until (deadline)
+			shift_register.latch ()
+			deadline = time_perf_counter () + (base_seconds * (1 << b))
+		wait_until (deadline)
+		self.__number_refreshes += 1
+
+	def __run (self):
+		'''
+			Refresh until stopped.
+		'''
+		while not self.__stop.is_set ():
+			self.refresh ()
+
+	def start (self):
+		'''
+			Start refreshing from a dedicated
+			thread, if not already running.
+		'''
+		if self.__thread is None:
+			self.__stop.clear ()
+			self.__thread = Thread (
+				target = self.__run,
+				name = 'BinaryCodeModulator',
+				daemon = True,
+			)
+			self.__thread.start ()
+
+	def stop (self):
+		'''
+			Stop refreshing after the current
+			refresh and turn all outputs off.
+		'''
+		if self.__thread is not None:
+			self.__stop.set ()
+			self.__thread.join ()
+			self.__thread = None
+			self.__shift_register.clear ()
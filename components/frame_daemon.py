@@ -0,0 +1,309 @@
+from contextlib import contextmanager
+import mmap
+from multiprocessing import shared_memory
+import os
+from threading import (
+	Event,
+	Thread,
+)
+from time import (
+	perf_counter as time_perf_counter,
+	sleep as time_sleep,
+)
+
+from .shift_register import list_to_int
+
+## Every shared frame buffer starts with three 64-bit
+## words: the sequence published (odd while a frame is
+## being published), the sequence last written to the
+## register and the register's number of outputs:
+SEQUENCE = 0
+WRITTEN_SEQUENCE = 1
+NUMBER_OUTPUTS = 2
+HEADER_BYTES = 24
+NAME_PREFIX = 'electronics_'
+
+## Where Linux keeps shared memory blocks:
+SHARED_MEMORY_DIRECTORY = '/dev/shm'
+
+def attach (name):
+	'''
+		Map an existing shared memory block by name.
+		Done directly, as attaching with SharedMemory
+		registers the block with the resource tracker,
+		which would unlink it when this process exits.
+	'''
+	fd = os.open (os.path.join (SHARED_MEMORY_DIRECTORY, name), os.O_RDWR)
+	try:
+		return mmap.mmap (fd, 0)
+	finally:
+		os.close (fd)
+
+class FrameDaemon ():
+	'''
+		A class owning shift registers on behalf of
+		other processes, which publish frames to them
+		through shared memory with FrameClient. Each
+		register's frame buffer is polled for a new
+		sequence and only changed registers are written.
+	'''
+
+	def __init__ (
+		self,
+		shift_registers,
+		name_prefix = NAME_PREFIX,
+		poll_seconds = 0.001,
+	):
+		'''
+			Create a shared frame buffer for each of
+			the given dictionary of names to shift
+			registers, named with the given prefix,
+			to check every given number of seconds.
+		'''
+		self.__poll_seconds = poll_seconds
+		self.__buffers = {}
+		self.__number_polls = 0
+		self.__number_written = 0
+		self.__stop = Event ()
+		self.__thread = None
+		try:
+			for name, shift_register in shift_registers.items ():
+				memory = shared_memory.SharedMemory (
+					name = name_prefix + name,
+					create = True,
+					size = HEADER_BYTES + (len (shift_register) + 7) // 8,
+				)
+				header = memory.buf[:HEADER_BYTES].cast ('Q')
+				header[SEQUENCE] = header[WRITTEN_SEQUENCE] = 0
+				header[NUMBER_OUTPUTS] = len (shift_register)
+				self.__buffers[name] = [
+					shift_register,
+					memory,
+					header,
+					memory.buf[HEADER_BYTES:],
+				]
+		except Exception:
+			self.close ()
+			raise
+
+	def __enter__ (self):
+		'''
+			Use the daemon as a context
+			manager, closing it on exit.
+		'''
+		return self
+
+	def __exit__ (self, *args):
+		'''
+			Close the daemon.
+		'''
+		self.close ()
+
+	@property
+	def number_polls (self):
+		'''
+			Return the number of times every
+			frame buffer has been checked.
+		'''
+		return self.__number_polls
+
+	@property
+	def number_written (self):
+		'''
+			Return the number of frames written.
+		'''
+		return self.__number_written
+
+	def poll (self):
+		'''
+			Write every register with a new frame
+			fully published since it was last written.
+			Return the number of registers written.
+		'''
+		number_written = 0
+		for shift_register, memory, header, frame in self.__buffers.values ():
+			sequence = header[SEQUENCE]
+			## Skip frames unchanged or being published:
+			if sequence == header[WRITTEN_SEQUENCE] or sequence & 1:
+				continue
+			data = bytes (frame)
+			## Drop a frame published over while copying:
+			if header[SEQUENCE] != sequence:
+				continue
+			shift_register.from_bytes (data)
+			header[WRITTEN_SEQUENCE] = sequence
+			number_written += 1
+		self.__number_polls += 1
+		self.__number_written += number_written
+		return number_written
+
+	def __run (self):
+		'''
+			Poll until stopped.
+		'''
+		poll_seconds = self.__poll_seconds
+		while not self.__stop.is_set ():
+			if not self.poll ():
+				time_sleep (poll_seconds)
+
+	def serve_forever (self):
+		'''
+			Poll from this thread until
+			stopped from another.
+		'''
+		self.__stop.clear ()
+		self.__run ()
+
+	def start (self):
+		'''
+			Start polling from a dedicated
+			thread, if not already running.
+		'''
+		if self.__thread is None:
+			self.__stop.clear ()
+			self.__thread = Thread (
+				target = self.__run,
+				name = 'FrameDaemon',
+				daemon = True,
+			)
+			self.__thread.start ()
+
+	def stop (self):
+		'''
+			Stop polling after the current poll.
+		'''
+		self.__stop.set ()
+		if self.__thread is not None:
+			self.__thread.join ()
+			self.__thread = None
+
+	def close (self):
+		'''
+			Stop polling and remove
+			every frame buffer.
+		'''
+		self.stop ()
+		for shift_register, memory, header, frame in self.__buffers.values ():
+			header.release ()
+			frame.release ()
+			memory.close ()
+			memory.unlink ()
+		self.__buffers.clear ()
+
+class FrameClient ():
+	'''
+		A class for publishing frames to a shift
+		register owned by a FrameDaemon, from any
+		process, without any GPIO set up. Only one
+		client should publish to a register at a time.
+	'''
+
+	def __init__ (self, name, name_prefix = NAME_PREFIX):
+		'''
+			Attach to the frame buffer of the
+			named register of a running daemon.
+		'''
+		self.__map = attach (name_prefix + name)
+		buffer = memoryview (self.__map)
+		self.__header = buffer[:HEADER_BYTES].cast ('Q')
+		self.__number_outputs = self.__header[NUMBER_OUTPUTS]
+		self.__frame = buffer[HEADER_BYTES:HEADER_BYTES + (self.__number_outputs + 7) // 8]
+		buffer.release ()
+
+	def __enter__ (self):
+		'''
+			Use the client as a context
+			manager, closing it on exit.
+		'''
+		return self
+
+	def __exit__ (self, *args):
+		'''
+			Close the client.
+		'''
+		self.close ()
+
+	def __len__ (self):
+		'''
+			Return the number of outputs
+			of the register published to.
+		'''
+		return self.__number_outputs
+
+	@property
+	def sequence (self):
+		'''
+			Return the sequence last published.
+		'''
+		return self.__header[SEQUENCE]
+
+	@property
+	def written (self):
+		'''
+			Return a boolean for whether the frame
+			last published has been written.
+		'''
+		return self.__header[WRITTEN_SEQUENCE] == self.__header[SEQUENCE]
+
+	@contextmanager
+	def editing (self):
+		'''
+			Yield the shared frame, 8 outputs a byte with
+			bit x of byte 0 for output x, to change in place,
+			then publish it. The daemon ignores the frame
+			while it's being edited.
+		'''
+		header = self.__header
+		header[SEQUENCE] += 1
+		try:
+			yield self.__frame
+		finally:
+			header[SEQUENCE] += 1
+
+	def publish_bytes (self, data):
+		'''
+			Publish the given bytes as the frame,
+			8 outputs a byte with bit x of byte 0
+			for output x.
+		'''
+		with self.editing () as frame:
+			frame[:] = data
+
+	def publish_int (self, value):
+		'''
+			Publish the given integer as the
+			frame, with bit x for output x.
+		'''
+		self.publish_bytes (
+			(value & ((1 << self.__number_outputs) - 1)).to_bytes (len (self.__frame), 'little')
+		)
+
+	def publish_list (self, to_set):
+		'''
+			Publish the given list of output values
+			as the frame, to_set[0] for output 0.
+		'''
+		self.publish_int (list_to_int (to_set))
+
+	def wait_written (self, timeout = None, poll_seconds = 0.0001):
+		'''
+			Wait until the frame last published has
+			been written. Return a boolean for whether
+			that happened within the given number of
+			seconds (defaults to waiting).
+		'''
+		deadline = None if timeout is None else time_perf_counter () + timeout
+		while not self.written:
+			if deadline is not None and time_perf_counter () > deadline:
+				return False
+			time_sleep (poll_seconds)
+		return True
+
+	def close (self):
+		'''
+			Detach from the frame buffer,
+			leaving it to the daemon.
+		'''
+		self.__header.release ()
+		self.__frame.release ()
+		self.__map.close ()
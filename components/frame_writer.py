@@ -0,0 +1,184 @@
+from threading import (
+	Condition,
+	Thread,
+)
+
+class FrameWriter ():
+	'''
+		A class for writing frames to a shift
+		register from a background thread, where
+		only the newest frame posted is written.
+	'''
+
+	def __init__ (
+		self,
+		shift_register,
+		latch = True,
+		reuse_previous = True,
+	):
+		'''
+			Start a writer thread for the given shift
+			register, writing frames with the given
+			latch and reuse_previous options.
+		'''
+		self.__shift_register = shift_register
+		self.__latch = latch
+		self.__reuse_previous = reuse_previous
+		## A one slot, latest wins mailbox:
+		self.__condition = Condition ()
+		self.__pending = None
+		self.__writing = False
+		self.__closed = False
+		self.__error = None
+		self.__number_submitted = 0
+		self.__number_written = 0
+		self.__number_coalesced = 0
+		self.__number_failed = 0
+		self.__thread = Thread (
+			target = self.__run,
+			name = 'FrameWriter',
+			daemon = True,
+		)
+		self.__thread.start ()
+
+	def __enter__ (self):
+		'''
+			Use the writer as a context
+			manager, closing it on exit.
+		'''
+		return self
+
+	def __exit__ (self, *args):
+		'''
+			Close the writer.
+		'''
+		self.close ()
+
+	@property
+	def shift_register (self):
+		'''
+			Return the shift register written to.
+		'''
+		return self.__shift_register
+
+	@property
+	def closed (self):
+		'''
+			Return a boolean for whether
+			the writer has been closed.
+		'''
+		return self.__closed
+
+	@property
+	def number_submitted (self):
+		'''
+			Return the number of frames submitted,
+			once flushed the sum of those written,
+			coalesced and failed.
+		'''
+		return self.__number_submitted
+
+	@property
+	def number_written (self):
+		'''
+			Return the number of frames written.
+		'''
+		return self.__number_written
+
+	@property
+	def number_coalesced (self):
+		'''
+			Return the number of frames dropped
+			for a newer one before being written.
+		'''
+		return self.__number_coalesced
+
+	@property
+	def number_failed (self):
+		'''
+			Return the number of frames
+			writing raised an error for.
+		'''
+		return self.__number_failed
+
+	def __raise_error (self):
+		'''
+			Re-raise any error the writer
+			thread hit, only the once.
+		'''
+		if self.__error is not None:
+			error, self.__error = self.__error, None
+			raise error
+
+	def submit (self, to_set):
+		'''
+			Post the given list of output values to be
+			written, replacing any frame not yet written.
+			The list shouldn't be changed afterwards.
+		'''
+		with self.__condition:
+			self.__raise_error ()
+			if self.__closed:
+				raise RuntimeError ('The frame writer is closed.')
+			if self.__pending is not None:
+				self.__number_coalesced += 1
+			self.__pending = to_set
+			self.__number_submitted += 1
+			self.__condition.notify_all ()
+
+	def __run (self):
+		'''
+			Write the newest frame whenever
+			there is one, until closed.
+		'''
+		while True:
+			with self.__condition:
+				while self.__pending is None and not self.__closed:
+					self.__condition.wait ()
+				if self.__pending is None:
+					return
+				to_set, self.__pending = self.__pending, None
+				self.__writing = True
+			failure = None
+			try:
+				self.__shift_register.from_list (
+					to_set,
+					latch = self.__latch,
+					reuse_previous = self.__reuse_previous,
+				)
+			except Exception as error:
+				failure = error
+			with self.__condition:
+				self.__writing = False
+				if failure is None:
+					self.__number_written += 1
+				else:
+					self.__error = failure
+					self.__number_failed += 1
+				self.__condition.notify_all ()
+
+	def flush (self, timeout = None):
+		'''
+			Wait until every frame submitted has been
+			written, dropped or failed. Return a boolean
+			for whether that happened within the given
+			number of seconds (defaults to waiting).
+		'''
+		with self.__condition:
+			flushed = self.__condition.wait_for (
+				lambda: self.__pending is None and not self.__writing,
+				timeout = timeout,
+			)
+			self.__raise_error ()
+		return flushed
+
+	def close (self):
+		'''
+			Write any frame still pending,
+			then stop the writer thread.
+		'''
+		with self.__condition:
+			self.__closed = True
+			self.__condition.notify_all ()
+		self.__thread.join ()
+		self.__raise_error ()
@@ -0,0 +1,154 @@
+from threading import (
+	Event,
+	Thread,
+)
+from time import perf_counter as time_perf_counter
+
+class InputPoller ():
+	'''
+		A class for polling an input register at a
+		steady scan rate, debouncing each input and
+		calling back on every debounced change.
+	'''
+
+	def __init__ (
+		self,
+		input_register,
+		scan_rate = 1000,
+		debounce_scans = 3,
+	):
+		'''
+			Set up polling of the given input register
+			the given number of times a second. A change
+			on an input is only taken once it has been
+			read for the given number of scans in a row,
+			given for all inputs or as a list per input.
+		'''
+		self.__input_register = input_register
+		self.__scan_seconds = 1 / scan_rate
+		if isinstance (debounce_scans, int):
+			debounce_scans = [debounce_scans] * len (input_register)
+		self.__debounce_scans = tuple (max (1, d) for d in debounce_scans)
+		## Debounced levels, and how many scans
+		## in a row each changing input has changed:
+		self.__value = input_register.read_int ()
+		self.__counts = {}
+		self.__callbacks = []
+		self.__number_scans = 0
+		self.__error = None
+		self.__stop = Event ()
+		self.__thread = None
+
+	@property
+	def input_register (self):
+		'''
+			Return the input register polled.
+		'''
+		return self.__input_register
+
+	@property
+	def number_scans (self):
+		'''
+			Return the number of scans made.
+		'''
+		return self.__number_scans
+
+	def to_int (self):
+		'''
+			Return the debounced inputs as an
+			integer, with bit x for input x.
+		'''
+		return self.__value
+
+	def add_callback (self, callback, input_number = None):
+		'''
+			Call the given callback with the input number
+			and new on or off value of every debounced
+			change, or only those of the given input.
+		'''
+		self.__callbacks.append ((callback, input_number))
+
+	def remove_callback (self, callback, input_number = None):
+		'''
+			Stop calling the given callback.
+		'''
+		self.__callbacks.remove ((callback, input_number))
+
+	def poll (self):
+		'''
+			Read the inputs once, taking any change that
+			has lasted long enough and calling back for
+			each. Return the list of (input number, value)
+			changes taken.
+		'''
+		raw = self.__input_register.read_int ()
+		changing = raw ^ self.__value
+		counts = self.__counts
+		## Inputs back at their debounced level start over:
+		for i in [i for i in counts if not (changing >> i) & 1]:
+			del counts[i]
+		changes = []
+		while changing:
+			bit = changing & -changing
+			changing ^= bit
+			i = bit.bit_length () - 1
+			counts[i] = counts.get (i, 0) + 1
+			if counts[i] >= self.__debounce_scans[i]:
+				del counts[i]
+				self.__value ^= bit
+				changes.append ((i, (raw >> i) & 1))
+		self.__number_scans += 1
+		for i, value in changes:
+			for callback, input_number in self.__callbacks:
+				if input_number is None or input_number == i:
+					callback (i, value)
+		return changes
+
+	def __run (self):
+		'''
+			Poll once a scan until stopped,
+			keeping any error to raise on stop.
+			Debouncing doesn't need accurate scans,
+			so waits sleep rather than busy wait
+			and end as soon as stopped.
+		'''
+		stop = self.__stop
+		deadline = time_perf_counter ()
+		try:
+			while not stop.is_set ():
+				self.poll ()
+				deadline += self.__scan_seconds
+				## Skip scans missed rather than catch up:
+				now = time_perf_counter ()
+				if deadline < now:
+					deadline = now
+				stop.wait (deadline - now)
+		except Exception as error:
+			self.__error = error
+
+	def start (self):
+		'''
+			Start polling from a dedicated
+			thread, if not already running.
+		'''
+		if self.__thread is None:
+			self.__stop.clear ()
+			self.__thread = Thread (
+				target = self.__run,
+				name = 'InputPoller',
+				daemon = True,
+			)
+			self.__thread.start ()
+
+	def stop (self):
+		'''
+			Stop polling after the current scan,
+			raising any error polling hit.
+		'''
+		if self.__thread is not None:
+			self.__stop.set ()
+			self.__thread.join ()
+			self.__thread = None
+		if self.__error is not None:
+			error, self.__error = self.__error, None
+			raise error
@@ -0,0 +1,103 @@
+from ..mixins import ClockInhibitMixin
+
+class InputRegister (ClockInhibitMixin):
+	'''
+		A class for reading a parallel in, serial out
+		shift register (such as a chain of 74HC165s)
+		with the clock and latch conventions of
+		ShiftRegister: data is clocked on the rising
+		edge, and the latch (SH/LD) loads the inputs
+		while low.
+	'''
+	_timed_methods = (
+		'read_int',
+		'read',
+	)
+
+	def __init__ (self, **kwargs):
+		'''
+			A manager class for reading an input
+			register through a data (serial out)
+			pin and given clock and latch pins.
+		'''
+		self.__number_inputs = kwargs.pop ('number_inputs')
+		self.__data_pin_id = kwargs.pop ('data_pin_id')
+		self.__clock_pin_id = kwargs.pop ('clock_pin_id')
+		self.__latch_pin_id = kwargs.pop ('latch_pin_id')
+		self.__value = 0
+		self.__inputs_view = None
+		super ().__init__ (**kwargs)
+		self._setup_pins ()
+
+	def _setup_pins (self):
+		'''
+			Set up the data pin as an input, with the
+			clock off and the latch on (shifting).
+		'''
+		gpio = self._gpio
+		gpio.setup (self.__data_pin_id, gpio.IN)
+		gpio.setup (self.__clock_pin_id, gpio.OUT, initial = gpio.LOW)
+		gpio.setup (self.__latch_pin_id, gpio.OUT, initial = gpio.HIGH)
+
+	def __len__ (self):
+		'''
+			Return the number of inputs
+			this instance is reading.
+		'''
+		return self.__number_inputs
+
+	@property
+	def inputs (self):
+		'''
+			Return the inputs last read,
+			starting from input 0.
+		'''
+		if self.__inputs_view is None:
+			self.__inputs_view = tuple (
+				self.ON if b == '1' else self.OFF
+				for b in reversed ('{:0{}b}'.format (self.__value, self.__number_inputs))
+			)
+		return self.__inputs_view
+
+	def to_int (self):
+		'''
+			Return the inputs last read as an
+			integer, with bit x for input x.
+		'''
+		return self.__value
+
+	def read_int (self):
+		'''
+			Load the inputs and clock them all in,
+			returning an integer with bit x for input x.
+			The input furthest along the chain comes
+			out first, as the highest bit.
+		'''
+		if self.controlling_clock_inhibit_pin:
+			self.allow_clock ()
+		gpio = self._gpio
+		output = gpio.output
+		read = gpio.input
+		high = gpio.HIGH
+		low = gpio.LOW
+		data_pin_id = self.__data_pin_id
+		clock_pin_id = self.__clock_pin_id
+		## Load the inputs, then shift:
+		output (self.__latch_pin_id, low)
+		output (self.__latch_pin_id, high)
+		value = 1 if read (data_pin_id) else 0
+		for i in range (self.__number_inputs - 1):
+			output (clock_pin_id, high)
+			output (clock_pin_id, low)
+			value = (value << 1) | (1 if read (data_pin_id) else 0)
+		self.__value = value
+		self.__inputs_view = None
+		return value
+
+	def read (self):
+		'''
+			Load the inputs and clock them all
+			in, returning them starting from input 0.
+		'''
+		self.read_int ()
+		return self.inputs
@@ -0,0 +1,247 @@
+from threading import (
+	Event,
+	Thread,
+)
+from time import perf_counter as time_perf_counter
+
+from .pulse_timing import wait_until
+
+class LedMatrix ():
+	'''
+		A class for driving a row scanned LED
+		matrix from two shift registers, one
+		selecting the row and one holding
+		that row's column data.
+	'''
+
+	def __init__ (
+		self,
+		row_register,
+		column_register,
+		number_rows = None,
+		number_columns = None,
+		refresh_rate = 100,
+		rows_active_low = False,
+		columns_active_low = False,
+	):
+		'''
+			Set up a matrix on the given row and column
+			shift registers (using all their outputs by
+			default), scanning every row the given number
+			of times a second. Active low rows or columns
+			are selected or lit by turning them off.
+		'''
+		self.__row_register = row_register
+		self.__column_register = column_register
+		self.__number_rows = len (row_register) if number_rows is None else number_rows
+		self.__number_columns = len (column_register) if number_columns is None else number_columns
+		self.__row_seconds = 1 / (refresh_rate * self.__number_rows)
+		self.__columns_active_low = columns_active_low
+		## The row selections never change:
+		row_mask = (1 << len (row_register)) - 1
+		self.__row_words = tuple (
+			(~(1 << r) & row_mask) if rows_active_low else 1 << r
+			for r in range (self.__number_rows)
+		)
+		self.__compiled_rows = tuple (
+			row_register.compile_cycle (self.__row_words, latch = False)
+		)
+		self.__frame = tuple (
+			(False,) * self.__number_columns for r in range (self.__number_rows)
+		)
+		self.__column_words = self.__words (self.__frame)
+		self.__compiled_columns = self.__compile (self.__column_words)
+		self.__number_scans = 0
+		self.__stop = Event ()
+		self.__thread = None
+
+	@property
+	def number_rows (self):
+		'''
+			Return the number of rows.
+		'''
+		return self.__number_rows
+
+	@property
+	def number_columns (self):
+		'''
+			Return the number of columns.
+		'''
+		return self.__number_columns
+
+	@property
+	def frame (self):
+		'''
+			Return the frame buffer, a tuple
+			of booleans for each row.
+		'''
+		return self.__frame
+
+	@property
+	def column_words (self):
+		'''
+			Return the column data for each row as
+			an integer, with bit x for column x.
+		'''
+		return self.__column_words
+
+	@property
+	def number_scans (self):
+		'''
+			Return the number of full
+			scans completed.
+		'''
+		return self.__number_scans
+
+	@property
+	def running (self):
+		'''
+			Return a boolean for whether
+			the scan loop is running.
+		'''
+		return self.__thread is not None
+
+	def __word (self, row):
+		'''
+			Return the column data for
+			the given row as an integer.
+		'''
+		word = int (''.join (['1' if v else '0' for v in reversed (row)]) or '0', 2)
+		if self.__columns_active_low:
+			word = ~word & ((1 << len (self.__column_register)) - 1)
+		return word
+
+	def __words (self, frame):
+		'''
+			Return the column data for
+			each row of the given frame.
+		'''
+		return tuple (self.__word (row) for row in frame)
+
+	def __compile (self, column_words):
+		'''
+			Return the writes of the given column data
+			compiled for the column register, in the
+			order they're scanned.
+		'''
+		return tuple (
+			self.__column_register.compile_cycle (column_words, latch = False)
+		)
+
+	def set_frame (self, frame):
+		'''
+			Set the frame buffer from the given list
+			of rows, each a list of on or off values
+			for the columns. The column data is worked
+			out and compiled here and swapped in whole,
+			so it shows from the next full scan without
+			stalling or tearing the scan in progress.
+		'''
+		if len (frame) != self.__number_rows:
+			raise ValueError ('The frame needs {} rows.'.format (self.__number_rows))
+		if any (len (row) != self.__number_columns for row in frame):
+			raise ValueError ('Every row needs {} columns.'.format (self.__number_columns))
+		frame = tuple (tuple (bool (v) for v in row) for row in frame)
+		column_words = self.__words (frame)
+		compiled_columns = self.__compile (column_words)
+		self.__frame, self.__column_words, self.__compiled_columns = (
+			frame,
+			column_words,
+			compiled_columns,
+		)
+
+	def set_pixel (self, row, column, on_or_off):
+		'''
+			Set the given pixel of the frame
+			buffer on or off.
+		'''
+		frame = list (self.__frame)
+		frame[row] = frame[row][:column] + (bool (on_or_off),) + frame[row][column + 1:]
+		column_words = list (self.__column_words)
+		column_words[row] = self.__word (frame[row])
+		column_words = tuple (column_words)
+		compiled_columns = self.__compile (column_words)
+		self.__frame, self.__column_words, self.__compiled_columns = (
+			tuple (frame),
+			column_words,
+			compiled_columns,
+		)
+
+	def __blank (self, registers):
+		'''
+			Disable the output of the given
+			registers that control it.
+		'''
+		for register in registers:
+			register.disable ()
+
+	def __unblank (self, registers):
+		'''
+			Enable the output of the given
+			registers that control it.
+		'''
+		for register in registers:
+			register.enable ()
+
+	def scan (self):
+		'''
+			Show every row once for its share of the
+			refresh. Each row's compiled writes are sent
+			while the one before it is showing, then both
+			registers are latched with output blanked
+			(where an output enable pin is controlled)
+			once its time is up.
+		'''
+		row_register = self.__row_register
+		column_register = self.__column_register
+		blanking = [
+			register for register in (row_register, column_register)
+			if register.controlling_enable_pin
+		]
+		row_seconds = self.__row_seconds
+		compiled_columns = self.__compiled_columns
+		deadline = time_perf_counter ()
+		for compiled_row, compiled_column in zip (self.__compiled_rows, compiled_columns):
+			column_register.write_compiled (compiled_column)
+			row_register.write_compiled (compiled_row)
+			wait_until (deadline)
+			self.__blank (blanking)
+			column_register.latch ()
+			row_register.latch ()
+			self.__unblank (blanking)
+			deadline = time_perf_counter () + row_seconds
+		wait_until (deadline)
+		self.__number_scans += 1
+
+	def __run (self):
+		'''
+			Scan until stopped.
+		'''
+		while not self.__stop.is_set ():
+			self.scan ()
+
+	def start (self):
+		'''
+			Start scanning from a dedicated
+			thread, if not already running.
+		'''
+		if self.__thread is None:
+			self.__stop.clear ()
+			self.__thread = Thread (
+				target = self.__run,
+				name = 'LedMatrix',
+				daemon = True,
+			)
+			self.__thread.start ()
+
+	def stop (self):
+		'''
+			Stop scanning after the current
+			scan and turn all outputs off.
+		'''
+		if self.__thread is not None:
+			self.__stop.set ()
+			self.__thread.join ()
+			self.__thread = None
+			self.__column_register.clear ()
+			self.__row_register.clear ()
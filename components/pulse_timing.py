@@ -0,0 +1,176 @@
+from collections import namedtuple
+from random import getrandbits as random_getrandbits
+from time import (
+	perf_counter as time_perf_counter,
+	sleep as time_sleep,
+)
+
+## Sleep for waits longer than this, busy
+## waiting only for the rest, in seconds:
+SLEEP_MARGIN_SECONDS = 0.002
+
+## The fastest timing found to work and
+## the bit rate written at with it:
+Calibration = namedtuple (
+	'Calibration',
+	(
+		'timing',
+		'bits_per_second',
+	),
+)
+
+def wait_until (deadline):
+	'''
+		Wait until the given perf_counter time,
+		sleeping while there's time to spare
+		then busy waiting for accuracy.
+	'''
+	remaining = deadline - time_perf_counter ()
+	if remaining > SLEEP_MARGIN_SECONDS:
+		time_sleep (remaining - SLEEP_MARGIN_SECONDS)
+	while time_perf_counter () < deadline:
+		pass
+
+class PulseTiming ():
+	'''
+		Minimum times for bit-banging a chain, in
+		seconds: data set up before a rising clock or
+		latch edge, data held after one, and the width
+		of every high or low pulse on the clock or latch.
+	'''
+
+	def __init__ (
+		self,
+		setup_seconds = 0,
+		hold_seconds = 0,
+		pulse_seconds = 0,
+	):
+		'''
+			Hold the given minimum times.
+		'''
+		self.__setup_seconds = setup_seconds
+		self.__hold_seconds = hold_seconds
+		self.__pulse_seconds = pulse_seconds
+
+	def __repr__ (self):
+		'''
+			Show the times held.
+		'''
+		return 'PulseTiming (setup_seconds = {}, hold_seconds = {}, pulse_seconds = {})'.format (
+			self.__setup_seconds,
+			self.__hold_seconds,
+			self.__pulse_seconds,
+		)
+
+	@property
+	def setup_seconds (self):
+		'''
+			Return the minimum time data is
+			set up before a rising edge.
+		'''
+		return self.__setup_seconds
+
+	@property
+	def hold_seconds (self):
+		'''
+			Return the minimum time data is
+			held after a rising edge.
+		'''
+		return self.__hold_seconds
+
+	@property
+	def pulse_seconds (self):
+		'''
+			Return the minimum width of a
+			clock or latch pulse.
+		'''
+		return self.__pulse_seconds
+
+	@property
+	def rise_seconds (self):
+		'''
+			Return the minimum time between the
+			change before a rising edge and the edge.
+		'''
+		return max (self.__setup_seconds, self.__pulse_seconds)
+
+	@property
+	def after_rise_seconds (self):
+		'''
+			Return the minimum time between a
+			rising edge and the change after it.
+		'''
+		return max (self.__hold_seconds, self.__pulse_seconds)
+
+	def scaled (self, factor):
+		'''
+			Return a copy with every time
+			multiplied by the given factor.
+		'''
+		return PulseTiming (
+			setup_seconds = self.__setup_seconds * factor,
+			hold_seconds = self.__hold_seconds * factor,
+			pulse_seconds = self.__pulse_seconds * factor,
+		)
+
+def measure_bit_rate (shift_register, number_frames = 100):
+	'''
+		Return the bits per second the given shift
+		register writes random whole frames at.
+	'''
+	number = len (shift_register)
+	frames = [random_getrandbits (number) for f in range (number_frames)]
+	start = time_perf_counter ()
+	for frame in frames:
+		shift_register.from_int (
+			frame,
+			reuse_previous = False,
+		)
+	return number * number_frames / (time_perf_counter () - start)
+
+def calibrate (
+	shift_register,
+	check,
+	timing = None,
+	number_frames = 100,
+	steps = 20,
+):
+	'''
+		Find the fastest timing the given shift register's
+		chain tolerates, starting from the given timing
+		(defaults to 1us pulses) and halving it while every
+		random frame written passes the given check, then
+		measure the bit rate at that timing. The check is
+		called after each frame is latched with the frame,
+		as an integer, and returns whether the chain shows it
+		(for example from an input register on its outputs).
+		Return the Calibration found, leaving the shift
+		register using that timing.
+	'''
+	if timing is None:
+		timing = PulseTiming (pulse_seconds = 0.000001)
+	number = len (shift_register)
+	def passes (candidate):
+		shift_register.timing = candidate
+		for f in range (number_frames):
+			frame = random_getrandbits (number)
+			shift_register.from_int (
+				frame,
+				reuse_previous = False,
+			)
+			if not check (frame):
+				return False
+		return True
+	if not passes (timing):
+		shift_register.timing = timing
+		raise ValueError ('The chain fails the check at the starting timing.')
+	for step in range (steps):
+		faster = timing.scaled (0.5)
+		if not passes (faster):
+			break
+		timing = faster
+	shift_register.timing = timing
+	return Calibration (
+		timing,
+		measure_bit_rate (shift_register, number_frames),
+	)
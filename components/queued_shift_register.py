@@ -0,0 +1,267 @@
+from collections import deque
+from concurrent.futures import Future
+from functools import partial
+from threading import (
+	Condition,
+	Thread,
+)
+
+from .shift_register import list_to_int
+
+class QueuedShiftRegister ():
+	'''
+		A thread-safe facade over a shift register.
+		Calls from any thread are queued and made in
+		order by one writer thread, so pin toggles
+		never interleave, each returning a future for
+		its result. A full frame write still queued
+		can be merged into by the next one, so slow
+		chains fall behind by frames not calls.
+	'''
+
+	def __init__ (self, shift_register, merge_writes = True):
+		'''
+			Start a writer thread for the given shift
+			register, merging consecutive full frame
+			writes unless requested not to.
+		'''
+		self.__shift_register = shift_register
+		self.__merge_writes = merge_writes
+		## Queued [call, futures, merge key] entries:
+		self.__queue = deque ()
+		self.__condition = Condition ()
+		self.__running = False
+		self.__closed = False
+		self.__number_submitted = 0
+		self.__number_run = 0
+		self.__number_merged = 0
+		self.__thread = Thread (
+			target = self.__run,
+			name = 'QueuedShiftRegister',
+			daemon = True,
+		)
+		self.__thread.start ()
+
+	def __enter__ (self):
+		'''
+			Use the facade as a context
+			manager, closing it on exit.
+		'''
+		return self
+
+	def __exit__ (self, *args):
+		'''
+			Close the facade.
+		'''
+		self.close ()
+
+	@property
+	def shift_register (self):
+		'''
+			Return the shift register wrapped.
+		'''
+		return self.__shift_register
+
+	@property
+	def output (self):
+		'''
+			Return the outputs currently latched.
+		'''
+		return self.__shift_register.output
+
+	@property
+	def closed (self):
+		'''
+			Return a boolean for whether
+			the facade has been closed.
+		'''
+		return self.__closed
+
+	@property
+	def number_submitted (self):
+		'''
+			Return the number of calls submitted.
+		'''
+		return self.__number_submitted
+
+	@property
+	def number_run (self):
+		'''
+			Return the number of calls made.
+		'''
+		return self.__number_run
+
+	@property
+	def number_merged (self):
+		'''
+			Return the number of writes merged into
+			a later one before being made.
+		'''
+		return self.__number_merged
+
+	def __submit (self, call, merge_key = None):
+		'''
+			Queue the given call, merging it into the
+			call queued last if both have the same
+			merge key. Return a future for its result.
+		'''
+		future = Future ()
+		with self.__condition:
+			if self.__closed:
+				raise RuntimeError ('The queued shift register is closed.')
+			self.__number_submitted += 1
+			if (
+				merge_key is not None
+				and self.__queue
+				and self.__queue[-1][2] == merge_key
+			):
+				self.__queue[-1][0] = call
+				self.__queue[-1][1].append (future)
+				self.__number_merged += 1
+			else:
+				self.__queue.append ([call, [future], merge_key])
+				self.__condition.notify_all ()
+		return future
+
+	def submit (self, method, *args, **kwargs):
+		'''
+			Queue a call of the given shift register
+			method (or any callable) with the given
+			arguments, to be made after every call
+			submitted before it. Return a future
+			for its result.
+		'''
+		return self.__submit (partial (method, *args, **kwargs))
+
+	def __run (self):
+		'''
+			Make each queued call in
+			turn, until closed.
+		'''
+		queue = self.__queue
+		while True:
+			with self.__condition:
+				while not queue and not self.__closed:
+					self.__condition.wait ()
+				if not queue:
+					return
+				call, futures, merge_key = queue.popleft ()
+				self.__running = True
+			futures = [
+				future
+				for future in futures
+				if future.set_running_or_notify_cancel ()
+			]
+			if futures:
+				try:
+					result = call ()
+				except Exception as error:
+					for future in futures:
+						future.set_exception (error)
+				else:
+					for future in futures:
+						future.set_result (result)
+			with self.__condition:
+				self.__running = False
+				self.__number_run += 1
+				self.__condition.notify_all ()
+
+	def write_int (
+		self,
+		value,
+		number = None,
+		latch = True,
+		reuse_previous = True,
+	):
+		'''
+			Queue writing the given integer as
+			from_int does. Return a future for
+			the plan used.
+		'''
+		number = len (self.__shift_register) if number is None else number
+		merge_key = None
+		## Only writes covering every output can be
+		## merged, as shorter writes shift data along:
+		if self.__merge_writes and number == len (self.__shift_register):
+			merge_key = ('write', latch, reuse_previous)
+		return self.__submit (
+			partial (
+				self.__shift_register.from_int,
+				value,
+				number = number,
+				latch = latch,
+				reuse_previous = reuse_previous,
+			),
+			merge_key,
+		)
+
+	def write (
+		self,
+		to_set,
+		latch = True,
+		reuse_previous = True,
+	):
+		'''
+			Queue writing the given list of output
+			values as from_list does. Return a
+			future for the plan used.
+		'''
+		return self.write_int (
+			list_to_int (to_set),
+			number = len (to_set),
+			latch = latch,
+			reuse_previous = reuse_previous,
+		)
+
+	def next (self, on_or_off, latch = False):
+		'''
+			Queue setting the next value.
+		'''
+		return self.submit (self.__shift_register.next, on_or_off, latch = latch)
+
+	def clear (self):
+		'''
+			Queue turning off all outputs.
+		'''
+		return self.submit (self.__shift_register.clear)
+
+	def latch (self):
+		'''
+			Queue pulsing the latch pin.
+		'''
+		return self.submit (self.__shift_register.latch)
+
+	def enable (self):
+		'''
+			Queue enabling the outputs.
+		'''
+		return self.submit (self.__shift_register.enable)
+
+	def disable (self):
+		'''
+			Queue disabling the outputs.
+		'''
+		return self.submit (self.__shift_register.disable)
+
+	def flush (self, timeout = None):
+		'''
+			Wait until every call submitted has been
+			made. Return a boolean for whether that
+			happened within the given number of
+			seconds (defaults to waiting).
+		'''
+		with self.__condition:
+			return self.__condition.wait_for (
+				lambda: not self.__queue and not self.__running,
+				timeout = timeout,
+			)
+
+	def close (self):
+		'''
+			Make any calls still queued,
+			then stop the writer thread.
+		'''
+		with self.__condition:
+			self.__closed = True
+			self.__condition.notify_all ()
+		self.__thread.join ()
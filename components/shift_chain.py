@@ -0,0 +1,454 @@
+from threading import RLock
+from time import perf_counter as time_perf_counter
+
+from ..mixins import (
+	ClearMixin,
+	OutputEnableMixin,
+)
+from .pulse_timing import wait_until
+
+def bits (value, number):
+	'''
+		Return the given number of bits of the
+		given value as a string of 0s and 1s,
+		highest bit first (the order they're written).
+	'''
+	if not number:
+		return ''
+	return '{:0{}b}'.format (value, number)
+
+def unpack (value, number):
+	'''
+		Return the given number of bits of
+		the given value as on (1) or off (0)
+		values, starting from output 0.
+	'''
+	return tuple (
+		1 if b == '1' else 0
+		for b in reversed (bits (value, number))
+	)
+
+class ShiftChain (
+	ClearMixin,
+	OutputEnableMixin,
+):
+	'''
+		A base class for shift register chains side
+		by side, each on its own data pin but all
+		sharing one clock and one latch pin, holding
+		the pin state and compiling writes to every
+		chain into one list of pin transitions.
+		A single shift register is the one chain case.
+	'''
+	ON = 1
+	OFF = 0
+	_timed_methods = (
+		'clock',
+		'latch',
+	)
+
+	def __init__ (self, **kwargs):
+		'''
+			Set up equally long chains on the given
+			data pins and shared clock and latch pins,
+			held to the given PulseTiming if any.
+		'''
+		self._number_outputs = kwargs.pop ('number_outputs')
+		self._data_pin_ids = tuple (kwargs.pop ('data_pin_ids'))
+		self._clock_pin_id = kwargs.pop ('clock_pin_id')
+		self._latch_pin_id = kwargs.pop ('latch_pin_id')
+		self._mask = (1 << self._number_outputs) - 1
+		self._number_unlatched = 0
+		## Optionally hold pulses to minimum times, timed
+		## from when the last transition was made:
+		self._timing = kwargs.pop ('timing', None)
+		self._last_transition_time = 0
+		self._last_transition_rising = False
+		## Held by facades calling in from other threads,
+		## so calls through different facades never interleave:
+		self._lock = RLock ()
+		super ().__init__ (**kwargs)
+		## Control is all set up initially off:
+		self._data_values = [self.OFF] * len (self._data_pin_ids)
+		self._clock_value = self._latch_value = self.OFF
+		self._setup_pins ()
+
+	def _setup_pins (self):
+		'''
+			Set up the data, clock and latch
+			pins, with control all initially off.
+		'''
+		self._gpio.setup (
+			list (self._data_pin_ids) + [
+				self._clock_pin_id,
+				self._latch_pin_id,
+			],
+			self._gpio.OUT,
+			initial = self._gpio.LOW,
+		)
+
+	def __len__ (self):
+		'''
+			Return the number of outputs
+			each chain is controlling.
+		'''
+		return self._number_outputs
+
+	@property
+	def clock_pin_on (self):
+		'''
+			Return a boolean for whether
+			the clock pin is currently on.
+		'''
+		return self._clock_value == self.ON
+
+	@property
+	def latch_pin_on (self):
+		'''
+			Return a boolean for whether
+			the latch pin is currently on.
+		'''
+		return self._latch_value == self.ON
+
+	@property
+	def latched (self):
+		'''
+			Return a boolean for whether
+			all data written has been latched.
+		'''
+		return not self._number_unlatched
+
+	@property
+	def number_unlatched (self):
+		'''
+			Return the number of pieces of data
+			written to each chain but not yet output.
+		'''
+		return self._number_unlatched
+
+	@property
+	def lock (self):
+		'''
+			Return the lock held while a facade
+			makes a call on the chain.
+		'''
+		return self._lock
+
+	@property
+	def timing (self):
+		'''
+			Return the PulseTiming writes are held
+			to, or None if running flat out.
+		'''
+		return self._timing
+
+	@timing.setter
+	def timing (self, timing):
+		'''
+			Hold writes to the given PulseTiming,
+			or run flat out given None.
+		'''
+		self._timing = timing
+
+	def _pin_state (self):
+		'''
+			Return the data pin values, clock
+			value and latch value, as compiled
+			writes start from.
+		'''
+		return (
+			tuple (self._data_values),
+			self._clock_value,
+			self._latch_value,
+		)
+
+	def _latch_written (self):
+		'''
+			Record the written data as output.
+			Done by each kind of chain.
+		'''
+		self._number_unlatched = 0
+
+	def _set_data (self, chain, on_or_off):
+		'''
+			Set the given chain's data pin to the
+			given on or off value if it's not already.
+		'''
+		value = self.ON if on_or_off else self.OFF
+		if self._data_values[chain] != value:
+			self._transition (
+				self._data_pin_ids[chain],
+				self._gpio.HIGH if value else self._gpio.LOW,
+			)
+			self._data_values[chain] = value
+		else:
+			self._count_stat ('redundant_writes_avoided')
+
+	def clock_off (self):
+		'''
+			Turn the clock pin off
+			if it's not already.
+		'''
+		if self.clock_pin_on:
+			self._transition (self._clock_pin_id, self._gpio.LOW)
+			self._clock_value = self.OFF
+		else:
+			self._count_stat ('redundant_writes_avoided')
+
+	def latch_off (self):
+		'''
+			Turn the latch pin off
+			if it's not already.
+		'''
+		if self.latch_pin_on:
+			self._transition (self._latch_pin_id, self._gpio.LOW)
+			self._latch_value = self.OFF
+		else:
+			self._count_stat ('redundant_writes_avoided')
+
+	def clock_on (self):
+		'''
+			Turn the clock pin on
+			if it's not already.
+		'''
+		if not self.clock_pin_on:
+			self._transition (self._clock_pin_id, self._gpio.HIGH)
+			self._clock_value = self.ON
+			## A rising clock line commits data
+			## so all data is no longer latched:
+			self._number_unlatched += 1
+		else:
+			self._count_stat ('redundant_writes_avoided')
+
+	def latch_on (self):
+		'''
+			Turn the latch pin on
+			if it's not already.
+		'''
+		if not self.latch_pin_on:
+			self._transition (self._latch_pin_id, self._gpio.HIGH)
+			self._latch_value = self.ON
+			## All data is latched again:
+			self._latch_written ()
+		else:
+			self._count_stat ('redundant_writes_avoided')
+
+	def clock (self):
+		'''
+			Pulse the shared clock pin.
+		'''
+		if self.clock_pin_on:
+			self.clock_off ()
+			self.clock_on ()
+		else:
+			self.clock_on ()
+			self.clock_off ()
+
+	def latch (self):
+		'''
+			Pulse the shared latch pin.
+		'''
+		if self.latch_pin_on:
+			self.latch_off ()
+			self.latch_on ()
+		else:
+			self.latch_on ()
+			self.latch_off ()
+
+	def _compile_values (
+		self,
+		values,
+		number,
+		latch = False,
+		pin_state = None,
+	):
+		'''
+			Return the flat list of (pin, level) transitions
+			for writing the given number of bits of each
+			chain's value, setting every data pin for a
+			bit then pulsing the shared clock once, then
+			latching if requested, starting from the given
+			pin state (defaults to the current one).
+			Each clock fall is grouped with the data
+			changes for the next bit (and the last with
+			any latch rise) into one multi-channel
+			transition, in the order they must change.
+			Bits are written from the highest down
+			so bit 0 ends up on output 0.
+		'''
+		data_values, clock_value, latch_value = pin_state or self._pin_state ()
+		clock_pin_id = self._clock_pin_id
+		latch_pin_id = self._latch_pin_id
+		high = self._gpio.HIGH
+		low = self._gpio.LOW
+		transitions = []
+		append = transitions.append
+		## Pins waiting to change together:
+		pins = []
+		levels = []
+		## Ensure clock ready:
+		if clock_value and number:
+			pins.append (clock_pin_id)
+			levels.append (low)
+		data_on = [v == self.ON for v in data_values]
+		chains = [
+			(i, data_pin_id, bits (v, number))
+			for i, (data_pin_id, v) in enumerate (zip (self._data_pin_ids, values))
+		]
+		for b in range (number):
+			## Ensure every chain's data is ready:
+			for i, data_pin_id, chain_bits in chains:
+				if (chain_bits[b] == '1') != data_on[i]:
+					data_on[i] = not data_on[i]
+					pins.append (data_pin_id)
+					levels.append (high if data_on[i] else low)
+			if len (pins) == 1:
+				append ((pins[0], levels[0]))
+			elif pins:
+				append ((pins, levels))
+			## Commit the data to every chain at once:
+			append ((clock_pin_id, high))
+			pins = [clock_pin_id]
+			levels = [low]
+		if latch:
+			pins.append (latch_pin_id)
+			if latch_value:
+				levels.append (low)
+				append ((pins, levels) if len (pins) > 1 else (pins[0], levels[0]))
+				append ((latch_pin_id, high))
+			else:
+				levels.append (high)
+				append ((pins, levels) if len (pins) > 1 else (pins[0], levels[0]))
+				append ((latch_pin_id, low))
+		elif pins:
+			append ((pins[0], levels[0]))
+		return transitions
+
+	def _emit (self, compiled):
+		'''
+			Send the given compiled write to the chain,
+			without recording any state, from one loop,
+			held to the timing if there is one.
+		'''
+		if self._timing is not None:
+			self.__emit_timed (compiled)
+			return
+		output = self._gpio.output
+		for pin, level in compiled:
+			output (pin, level)
+
+	def __emit_timed (self, compiled):
+		'''
+			Send the given compiled transitions to the
+			chain, busy waiting before any (single or
+			grouped) transition with a rising clock or
+			latch edge for the data to set up, and after
+			one for it to be held, timed from the last
+			transition made on any write path. Either
+			edge of a clear pulse is held the same, so
+			the pulse is wide enough and the chain has
+			recovered before it's clocked.
+		'''
+		output = self._gpio.output
+		rise_seconds = self._timing.rise_seconds
+		after_rise_seconds = self._timing.after_rise_seconds
+		high = self._gpio.HIGH
+		edge_pin_ids = (self._clock_pin_id, self._latch_pin_id)
+		clear_pin_id = self._clear_pin_id
+		last = self._last_transition_time
+		rose = self._last_transition_rising
+		for pin, level in compiled:
+			if isinstance (pin, list):
+				rises = any (
+					(l == high and p in edge_pin_ids) or p == clear_pin_id
+					for p, l in zip (pin, level)
+				)
+			else:
+				rises = (level == high and pin in edge_pin_ids) or pin == clear_pin_id
+			## A group can both follow a rise and hold one,
+			## such as the last clock fall with the latch rise:
+			wait_seconds = 0
+			if rises:
+				wait_seconds = rise_seconds
+			if rose:
+				wait_seconds = max (wait_seconds, after_rise_seconds)
+			wait_until (last + wait_seconds)
+			output (pin, level)
+			last = time_perf_counter ()
+			rose = rises
+		self._last_transition_time = last
+		self._last_transition_rising = rose
+
+	def _transition (self, pin, level):
+		'''
+			Set the given pin to the given level on its
+			own, held to the timing if there is one.
+		'''
+		if self._timing is None:
+			self._gpio.output (pin, level)
+		else:
+			self.__emit_timed (((pin, level),))
+
+	def _count_compiled (self, compiled, number):
+		'''
+			Count the writes the given compiled write
+			of the given number of bits avoided, where
+			setting every data pin and turning the clock
+			off for each bit would have set some pins to
+			the level they were already.
+		'''
+		latch_pin_id = self._latch_pin_id
+		pin_writes = 0
+		for pins, levels in compiled:
+			if isinstance (pins, list):
+				pin_writes += sum (1 for pin in pins if pin != latch_pin_id)
+			else:
+				pin_writes += pins != latch_pin_id
+		self._count_stat (
+			'redundant_writes_avoided',
+			(2 + 2 * len (self._data_pin_ids)) * number - pin_writes,
+		)
+
+	def _write_compiled (
+		self,
+		values,
+		number,
+		compiled,
+		latch = False,
+	):
+		'''
+			Emit the given compiled write of the given
+			number of bits of each chain's value, then
+			update the pin state and record the data
+			shifted in once, at the end.
+		'''
+		self._emit (compiled)
+		if self._stats is not None:
+			self._count_compiled (compiled, number)
+		if number:
+			self._data_values = [v & 1 for v in values]
+			self._clock_value = self.OFF
+			self._shift_in_values (values, number)
+			self._number_unlatched += number
+		## A latch pulse leaves the pin as it was:
+		if latch:
+			self._latch_written ()
+
+	def _shift_in_values (self, values, number):
+		'''
+			Record the given number of bits of each
+			chain's value as written. Done by each
+			kind of chain.
+		'''
+		raise NotImplementedError
+
+	def stats (self):
+		'''
+			Return a copy of the stats collected,
+			with the clock pulses and latches made.
+		'''
+		stats = super ().stats ()
+		if stats is not None:
+			stats['clock_pulses'] = stats['rising_edges'].get (self._clock_pin_id, 0)
+			stats['latches'] = stats['rising_edges'].get (self._latch_pin_id, 0)
+		return stats
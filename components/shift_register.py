@@ -1,24 +1,179 @@
-from collections import deque
-from RPi import GPIO
+from collections import (
+	OrderedDict,
+	namedtuple,
+)
+from contextlib import contextmanager
+import sys
+from time import perf_counter as time_perf_counter
+
+from .pulse_timing import wait_until
+from .shift_chain import (
+	ShiftChain,
+	bits,
+	unpack,
+)
 
-from ..mixins import (
-	ClearMixin,
-	OutputEnableMixin,
+## Each byte value with its bit order reversed:
+REVERSED_BITS = bytes (
+	int ('{:08b}'.format (i)[::-1], 2) for i in range (256)
 )
 
-## Set the pin mode:
-GPIO.setmode (GPIO.BCM)
+## Each byte value as the digit for
+## the output value it sets:
+OUTPUT_DIGITS = bytes (
+	ord ('1') if i else ord ('0') for i in range (256)
+)
 
-class ShiftRegister (
-	ClearMixin,
-	OutputEnableMixin,
-):
+## A way of writing a frame, the number of bits
+## it clocks in and its cost in GPIO operations:
+WritePlan = namedtuple (
+	'WritePlan',
+	(
+		'strategy',
+		'number',
+		'cost',
+	),
+)
+
+## A write compiled ahead of time by compile_writes,
+## with the register state it starts from and leaves:
+CompiledWrite = namedtuple (
+	'CompiledWrite',
+	(
+		'value',
+		'number',
+		'latch',
+		'reuse_previous',
+		'plan',
+		'compiled',
+		'state',
+		'next_state',
+	),
+)
+
+## How well the compiled write cache is doing:
+CacheInfo = namedtuple (
+	'CacheInfo',
+	(
+		'hits',
+		'misses',
+		'evictions',
+		'size',
+		'maximum_size',
+	),
+)
+
+def list_to_int (to_set):
+	'''
+		Return the given output values as an integer,
+		with bit x set if to_set[x] is on, without
+		changing them. NumPy arrays (of any dtype) are
+		packed by NumPy, and other bytes like values (bytes,
+		bytearray and memoryview) with one translate,
+		rather than value by value.
+	'''
+	## An array can only be given once NumPy is imported,
+	## so never import it here for anything else:
+	numpy = sys.modules.get ('numpy')
+	if numpy is not None and isinstance (to_set, numpy.ndarray):
+		return int.from_bytes (
+			numpy.packbits (
+				numpy.asarray (to_set, dtype = bool).ravel (),
+				bitorder = 'little',
+			).tobytes (),
+			'little',
+		)
+	if isinstance (to_set, (bytes, bytearray, memoryview)):
+		if isinstance (to_set, memoryview) and to_set.itemsize != 1:
+			to_set = bytes (bool (v) for v in to_set.tolist ())
+		return int (bytes (to_set)[::-1].translate (OUTPUT_DIGITS) or b'0', 2)
+	return int (''.join (['1' if v else '0' for v in reversed (to_set)]) or '0', 2)
+
+def frames_to_ints (frames):
+	'''
+		Return the given frames of output values
+		as integers, packing a 2D NumPy array
+		of frames all at once.
+	'''
+	numpy = sys.modules.get ('numpy')
+	if numpy is not None and isinstance (frames, numpy.ndarray) and frames.ndim == 2:
+		packed = numpy.packbits (
+			numpy.asarray (frames, dtype = bool),
+			axis = 1,
+			bitorder = 'little',
+		)
+		return [int.from_bytes (row.tobytes (), 'little') for row in packed]
+	return [list_to_int (to_set) for to_set in frames]
+
+def overlaps (previous, target):
+	'''
+		Return the length of every suffix of the target
+		sequence that is also a prefix of the previous
+		one, longest first and ending with 0. Runs in
+		linear time by matching the target against the
+		previous sequence's prefix function (as in
+		Knuth-Morris-Pratt).
+	'''
+	number_previous = len (previous)
+	if not number_previous:
+		return [0]
+	## Find the prefix function of the previous sequence:
+	prefix_function = [0] * number_previous
+	k = 0
+	for i in range (1, number_previous):
+		v = previous[i]
+		while k and v != previous[k]:
+			k = prefix_function[k - 1]
+		if v == previous[k]:
+			k += 1
+		prefix_function[i] = k
+	## Match the target against it, so k ends
+	## as the longest suffix that's a prefix:
+	k = 0
+	for v in target:
+		if k == number_previous:
+			k = prefix_function[k - 1]
+		while k and v != previous[k]:
+			k = prefix_function[k - 1]
+		if v == previous[k]:
+			k += 1
+	## Every shorter one is a border of that:
+	found = [k]
+	while k:
+		k = prefix_function[k - 1]
+		found.append (k)
+	return found
+
+def longest_overlap (previous, target):
+	'''
+		Return the length of the longest suffix of the
+		target sequence that is also a prefix of the
+		previous one, in linear time.
+	'''
+	return overlaps (previous, target)[0]
+
+class ShiftRegister (ShiftChain):
 	'''
 		A class for handling a shift register
 		using only three inputs.
 	'''
-	ON = 1
-	OFF = 0
+	REUSE = 'reuse'
+	CLEAR = 'clear'
+	FULL = 'full'
+	_timed_methods = (
+		'from_list',
+		'from_pin_list',
+		'from_int',
+		'from_bytes',
+		'write_frames',
+		'plan',
+		'all',
+		'clear',
+		'shift',
+		'next',
+		'clock',
+		'latch',
+	)
 
 	def __init__ (self, **kwargs):
 		'''
@@ -26,145 +181,168 @@ class ShiftRegister (
 			a shift register on three
 			given GPIO pins.
 		'''
-		self.__number_outputs = kwargs.pop ('number_outputs')
-		self.__data_pin_id = kwargs.pop ('data_pin_id')
-		self.__clock_pin_id = kwargs.pop ('clock_pin_id')
-		self.__latch_pin_id = kwargs.pop ('latch_pin_id')
-		self.__number_unlatched = 0
-		self.__written = deque (maxlen = len (self))
-		self.__output = ()
+		## The one chain case of ShiftChain:
+		kwargs['data_pin_ids'] = [kwargs.pop ('data_pin_id')]
+		## Data is held as integer bit fields, with bit
+		## x for output x, plus how many bits are known:
+		self.__written = self.__number_written = 0
+		self.__output = self.__number_output = 0
+		self.__written_view = self.__output_view = ()
+		self.__last_plan = None
+		## The written data, number known and whether to
+		## latch, pending the end of the outermost batch:
+		self.__pending = None
+		## Optionally cache compiled writes by
+		## the state they start from and the target:
+		self.__cache_size = kwargs.pop ('cache_size', 0)
+		self.__cache = OrderedDict ()
+		self.__cache_hits = self.__cache_misses = self.__cache_evictions = 0
 		super ().__init__ (**kwargs)
-		GPIO.setup (self.__data_pin_id, GPIO.OUT)
-		GPIO.setup (self.__clock_pin_id, GPIO.OUT)
-		GPIO.setup (self.__latch_pin_id, GPIO.OUT)
-		## Ensure control is all initially off:
-		self.__data_value = self.__clock_value = self.__latch_value = self.ON
-		self.data_off ()
-		self.clock_off ()
-		self.latch_off ()
 		## Ensure the output is clear:
 		self.clear ()
 
-	def __len__ (self):
-		'''
-			Return the number of outputs
-			this instance is controlling.
-		'''
-		return self.__number_outputs
-
 	@property
 	def data_pin_on (self):
 		'''
 			Return a boolean for whether
 			the data pin is currently on.
 		'''
-		return self.__data_value == self.ON
+		return self._data_values[0] == self.ON
 
 	@property
-	def clock_pin_on (self):
+	def last_plan (self):
 		'''
-			Return a boolean for whether
-			the clock pin is currently on.
+			Return the plan used for
+			the last frame written.
 		'''
-		return self.__clock_value == self.ON
+		return self.__last_plan
 
 	@property
-	def latch_pin_on (self):
+	def output (self):
 		'''
-			Return a boolean for whether
-			the latch pin is currently on.
+			Return the currently output data.
+			Built from the bit field when needed.
 		'''
-		return self.__latch_value == self.ON
+		if self.__output_view is None:
+			self.__output_view = unpack (
+				self.__output,
+				self.__number_output,
+			)
+		return self.__output_view
 
 	@property
-	def latched (self):
+	def written (self):
 		'''
-			Return a boolean for whether
-			all data written has been latched.
+			Return the currently written data,
+			including any pending in a batch.
+			Built from the bit field when needed.
 		'''
-		return not self.__number_unlatched
+		if self.__pending is not None:
+			return unpack (*self.__pending[:2])
+		if self.__written_view is None:
+			self.__written_view = unpack (
+				self.__written,
+				self.__number_written,
+			)
+		return self.__written_view
 
-	@property
-	def number_unlatched (self):
+	def __shift_in (self, value, number):
 		'''
-			Return the number of pieces of
-			data written but not yet output.
+			Record the given number of bits of the given
+			value as written, the last bit written
+			(bit 0) ending up on output 0.
 		'''
-		return self.__number_unlatched
+		self.__written = ((self.__written << number) | value) & self._mask
+		self.__number_written = min (
+			self.__number_written + number,
+			self._number_outputs,
+		)
+		self.__written_view = None
 
-	@property
-	def output (self):
+	def __shift_cleared (self):
 		'''
-			Return the currently output data.
+			Record the written data as all
+			off after pulsing the clear pin.
 		'''
-		return self.__output
+		self.__written = 0
+		self.__number_written = self._number_outputs
+		self.__written_view = None
 
-	@property
-	def written (self):
+	def _shift_in_values (self, values, number):
 		'''
-			Return the currently written data.
+			Record the given number of bits of
+			the one chain's value as written.
 		'''
-		return tuple (self.__written)
+		self.__shift_in (values[0], number)
 
-	def data_off (self):
+	def _latch_written (self):
 		'''
-			Turn the data pin off
-			if it's not already.
+			Record the written data as output.
 		'''
-		if self.data_pin_on:
-			GPIO.output (self.__data_pin_id, GPIO.LOW)
-			self.__data_value = self.OFF
+		self.__output = self.__written
+		self.__number_output = self.__number_written
+		self.__output_view = self.__written_view
+		super ()._latch_written ()
 
-	def clock_off (self):
+	def to_int (self, written = False):
 		'''
-			Turn the clock pin off
-			if it's not already.
+			Return the currently output data as an
+			integer, with bit x for output x. Return
+			the written data instead if requested,
+			including any pending in a batch.
 		'''
-		if self.clock_pin_on:
-			GPIO.output (self.__clock_pin_id, GPIO.LOW)
-			self.__clock_value = self.OFF
+		if written:
+			if self.__pending is not None:
+				return self.__pending[0]
+			return self.__written
+		return self.__output
 
-	def latch_off (self):
-		'''
-			Turn the latch pin off
-			if it's not already.
-		'''
-		if self.latch_pin_on:
-			GPIO.output (self.__latch_pin_id, GPIO.LOW)
-			self.__latch_value = self.OFF
+	def _state (self):
+		'''
+			Return the written data, number of bits
+			known, and data, clock and latch values,
+			which writes are planned and compiled from.
+		'''
+		return (
+			self.__written,
+			self.__number_written,
+			self._data_values[0],
+			self._clock_value,
+			self._latch_value,
+		)
 
-	def data_on (self):
-		'''
-			Turn the data pin on
-			if it's not already.
-		'''
-		if not self.data_pin_on:
-			GPIO.output (self.__data_pin_id, GPIO.HIGH)
-			self.__data_value = self.ON
+	def __state_after (self, state, value, write_plan):
+		'''
+			Return the state the given write plan
+			for the given value leaves, starting
+			from the given state.
+		'''
+		written, number_written, data_value, clock_value, latch_value = state
+		if write_plan.strategy == self.CLEAR:
+			written, number_written = 0, self._number_outputs
+		number = write_plan.number
+		if number:
+			value &= (1 << number) - 1
+			written = ((written << number) | value) & self._mask
+			number_written = min (number_written + number, self._number_outputs)
+			data_value = value & 1
+			clock_value = self.OFF
+		## A latch pulse leaves the pin as it was:
+		return (written, number_written, data_value, clock_value, latch_value)
 
-	def clock_on (self):
+	def data_off (self):
 		'''
-			Turn the clock pin on
+			Turn the data pin off
 			if it's not already.
 		'''
-		if not self.clock_pin_on:
-			GPIO.output (self.__clock_pin_id, GPIO.HIGH)
-			self.__clock_value = self.ON
-			## A rising clock line commits data
-			## so all data is no longer latched:
-			self.__number_unlatched += 1
+		self._set_data (0, self.OFF)
 
-	def latch_on (self):
+	def data_on (self):
 		'''
-			Turn the latch pin on
+			Turn the data pin on
 			if it's not already.
 		'''
-		if not self.latch_pin_on:
-			GPIO.output (self.__latch_pin_id, GPIO.HIGH)
-			self.__latch_value = self.ON
-			## All data is latched again:
-			self.__output = self.written
-			self.__number_unlatched = 0
+		self._set_data (0, self.ON)
 
 	def data (self):
 		'''
@@ -177,37 +355,28 @@ class ShiftRegister (
 			self.data_on ()
 			self.data_off ()
 
-	def clock (self):
-		'''
-			Pule the clock pin.
-		'''
-		if self.clock_pin_on:
-			self.clock_off ()
-			self.clock_on ()
-		else:
-			self.clock_on ()
-			self.clock_off ()
-
 	def latch (self):
 		'''
-			Pule the latch pin.
+			Pule the latch pin, or latch at
+			the end of the batch if in one.
 		'''
-		if self.latch_pin_on:
-			self.latch_off ()
-			self.latch_on ()
+		if self.__pending is not None:
+			self.__pending[2] = True
 		else:
-			self.latch_on ()
-			self.latch_off ()
+			super ().latch ()
 
 	def shift (self):
 		'''
 			Shift the current data along,
 			ensuring no data is added.
 		'''
+		if self.__pending is not None:
+			self.__pend (self.OFF, 1, latch = True)
+			return
 		## Make sure data isn't added:
 		self.data_off ()
 		self.clock ()
-		self.__written.appendleft (self.OFF)
+		self.__shift_in (self.OFF, 1)
 		self.latch ()
 
 	def next (self, on_or_off, latch = False):
@@ -215,6 +384,9 @@ class ShiftRegister (
 			Set the next value to the given
 			on or off value and latch if requested.
 		'''
+		if self.__pending is not None:
+			self.__pend (self.ON if on_or_off else self.OFF, 1, latch = latch)
+			return
 		## Ensure data is ready:
 		if on_or_off:
 			self.data_on ()
@@ -224,45 +396,473 @@ class ShiftRegister (
 		self.clock_off ()
 		## Commit the data:
 		self.clock ()
-		self.__written.appendleft (on_or_off)
+		self.__shift_in (self.ON if on_or_off else self.OFF, 1)
 		## Latch if requested:
 		if latch:
 			self.latch ()
 
+	def _compile (
+		self,
+		value,
+		number,
+		latch = False,
+		state = None,
+	):
+		'''
+			Return the flat list of (pin, level)
+			transitions for writing the given number
+			of bits of the given value, then latching
+			if requested, from the given register state
+			(defaults to the current one).
+			Pins that can change together are grouped
+			into one multi-channel transition.
+		'''
+		return self._compile_values (
+			[value],
+			number,
+			latch = latch,
+			pin_state = None if state is None else ((state[2],), state[3], state[4]),
+		)
+
+	def __write (
+		self,
+		value,
+		number,
+		latch = False,
+		compiled = None,
+	):
+		'''
+			Write the given number of bits of the given
+			value and latch if requested, updating the
+			state once at the end. The write is compiled
+			up front unless already given compiled.
+		'''
+		value &= (1 << number) - 1
+		if compiled is None:
+			compiled = self._compile (value, number, latch = latch)
+		self._write_compiled (
+			[value],
+			number,
+			compiled,
+			latch = latch,
+		)
+
 	def all (self, on_or_off, latch = False):
 		'''
 			Write all data to the given on
 			or off value and latch if requested.
 			Doesn't use next for efficiency.
 		'''
-		## Ensure data is ready:
-		if on_or_off:
-			self.data_on ()
-		else:
-			self.data_off ()
-		## Ensure clock ready:
-		self.clock_off ()
-		## Commit the data:
-		for i in range (len (self)):
-			self.clock ()
-			self.__written.appendleft (on_or_off)
-		## Latch if requested:
-		if latch:
-			self.latch ()
+		if self.__pending is not None:
+			self.__pend (self._mask if on_or_off else 0, len (self), latch = latch)
+			return
+		self.__write (
+			self._mask if on_or_off else 0,
+			len (self),
+			latch = latch,
+		)
 
 	def clear (self):
 		'''
-			Turn off all outputs.
+			Turn off all outputs, using the
+			ClearMixin pin if it's cheapest.
 		'''
-		## Use ClearMixin if possible for speed:
-		if self.controlling_clear_pin:
-			super ().clear ()
-			self.latch ()
+		self.from_int (
+			0,
+			latch = True,
+		)
+
+	def __cost (self, value, number, state):
+		'''
+			Return the number of GPIO operations
+			writing the given number of bits of
+			the given value would take from the
+			given state.
+		'''
+		if not number:
+			return 0
+		## Data changes after the first go out with the clock
+		## falling, as does the first if the clock is on:
+		first_change = (value >> (number - 1)) & 1 != state[2]
+		return 2 * number + (first_change or state[3])
+
+	def plan (
+		self,
+		value,
+		number = None,
+		reuse_previous = True,
+	):
+		'''
+			Return the cheapest plan for writing the
+			given integer over the given number of outputs
+			(defaults to all of them), out of reusing the
+			written data, pulsing clear and writing up to
+			the highest bit set, or a full write.
+			Costs don't include latching.
+		'''
+		if number is None:
+			number = len (self)
+		return self._plan (
+			value & ((1 << number) - 1),
+			number,
+			reuse_previous,
+			self._state (),
+		)
+
+	def _plan (self, value, number, reuse_previous, state):
+		'''
+			Return the cheapest plan for writing the
+			given number of bits of the given value,
+			starting from the given state.
+		'''
+		written, number_written = state[:2]
+		plans = [
+			WritePlan (
+				self.FULL,
+				number,
+				self.__cost (value, number, state),
+			),
+		]
+		if reuse_previous:
+			## Only shift in as much as is needed for the
+			## currently written data to make up the rest:
+			number_previous = min (number, number_written)
+			to_write = number - longest_overlap (
+				bits (
+					written & ((1 << number_previous) - 1),
+					number_previous,
+				)[::-1],
+				bits (value, number)[::-1],
+			)
+			if to_write < number:
+				plans.insert (
+					0,
+					WritePlan (
+						self.REUSE,
+						to_write,
+						self.__cost (value, to_write, state),
+					),
+				)
+		## Clearing only leaves the rest of
+		## the outputs right for whole frames:
+		if self.controlling_clear_pin and number == len (self):
+			to_write = value.bit_length ()
+			plans.append (
+				WritePlan (
+					self.CLEAR,
+					to_write,
+					2 + self.__cost (value, to_write, state),
+				),
+			)
+		return min (plans, key = lambda p: p.cost)
+
+	def __prepare (
+		self,
+		value,
+		number,
+		latch,
+		reuse_previous,
+		state,
+	):
+		'''
+			Return the cheapest plan for writing the
+			given number of bits of the given value
+			from the given state, and its compiled
+			transitions, latching if requested.
+		'''
+		write_plan = self._plan (value, number, reuse_previous, state)
+		## Clearing doesn't change what's compiled:
+		compiled = self._compile (
+			value & ((1 << write_plan.number) - 1),
+			write_plan.number,
+			latch = latch,
+			state = state,
+		)
+		return write_plan, compiled
+
+	def from_int (
+		self,
+		value,
+		number = None,
+		latch = True,
+		reuse_previous = True,
+	):
+		'''
+			Write the given integer to outputs 0-x,
+			with bit x setting output x, over the given
+			number of outputs (defaults to all of them).
+			Latch the result by default.
+			Try reusing the previously written data by default.
+			Return the cheapest plan, which is used.
+			With a cache_size given, compiled writes
+			are cached by the state they start from
+			and the target, skipping all planning.
+			In a batch, nothing is written until it
+			ends and None is returned.
+		'''
+		if number is None:
+			number = len (self)
+		value &= (1 << number) - 1
+		if self.__pending is not None:
+			self.__pend (value, number, latch = latch)
+			return None
+		state = self._state ()
+		cached = None
+		if self.__cache_size:
+			key = state + (
+				value,
+				number,
+				latch,
+				reuse_previous,
+			)
+			cached = self.__cache.get (key)
+			if cached is None:
+				self.__cache_misses += 1
+			else:
+				self.__cache_hits += 1
+				self.__cache.move_to_end (key)
+		if cached is None:
+			write_plan, compiled = self.__prepare (
+				value,
+				number,
+				latch,
+				reuse_previous,
+				state,
+			)
+			if self.__cache_size:
+				self.__cache[key] = (write_plan, compiled)
+				if len (self.__cache) > self.__cache_size:
+					self.__cache.popitem (last = False)
+					self.__cache_evictions += 1
 		else:
-			self.all (
-				self.OFF,
-				latch = True,
+			write_plan, compiled = cached
+		return self.__apply (
+			value,
+			number,
+			write_plan,
+			compiled,
+			latch = latch,
+		)
+
+	def __apply (
+		self,
+		value,
+		number,
+		write_plan,
+		compiled,
+		latch = False,
+	):
+		'''
+			Write the given number of bits of the given
+			value with the given plan and its compiled
+			transitions. Return the plan.
+		'''
+		if write_plan.strategy == self.CLEAR:
+			super ().clear ()
+			self.__shift_cleared ()
+		elif write_plan.strategy == self.REUSE:
+			self._count_stat ('bits_reused', number - write_plan.number)
+		self.__write (
+			value,
+			write_plan.number,
+			latch = latch,
+			compiled = compiled,
+		)
+		self.__last_plan = write_plan
+		return write_plan
+
+	def compile_writes (
+		self,
+		values,
+		number = None,
+		latch = True,
+		reuse_previous = True,
+		state = None,
+	):
+		'''
+			Return each of the given integers compiled
+			ahead of time as a CompiledWrite, for writing
+			in turn with write_compiled. Each is planned
+			and compiled as from_int would, against the
+			state the one before leaves, starting from
+			the given state (defaults to the current one).
+			Nothing is written.
+		'''
+		if number is None:
+			number = len (self)
+		if state is None:
+			state = self._state ()
+		mask = (1 << number) - 1
+		compiled_writes = []
+		for value in values:
+			value &= mask
+			write_plan, compiled = self.__prepare (
+				value,
+				number,
+				latch,
+				reuse_previous,
+				state,
+			)
+			next_state = self.__state_after (state, value, write_plan)
+			compiled_writes.append (
+				CompiledWrite (
+					value,
+					number,
+					latch,
+					reuse_previous,
+					write_plan,
+					compiled,
+					state,
+					next_state,
+				),
+			)
+			state = next_state
+		return compiled_writes
+
+	def compile_cycle (
+		self,
+		values,
+		number = None,
+		latch = True,
+		reuse_previous = True,
+	):
+		'''
+			Return the given integers compiled as by
+			compile_writes, for writing in turn over
+			and over: the first is compiled against
+			the state the last leaves.
+		'''
+		compiled_writes = self.compile_writes (
+			values,
+			number = number,
+			latch = latch,
+			reuse_previous = reuse_previous,
+		)
+		if compiled_writes:
+			compiled_writes = self.compile_writes (
+				values,
+				number = number,
+				latch = latch,
+				reuse_previous = reuse_previous,
+				state = compiled_writes[-1].next_state,
+			)
+		return compiled_writes
+
+	def write_compiled (self, compiled_write):
+		'''
+			Write the given CompiledWrite, emitting its
+			transitions without planning or compiling.
+			Where the register isn't in the state it was
+			compiled against (or is in a batch), it's
+			written with from_int instead.
+			Return the plan used.
+		'''
+		if self.__pending is not None or compiled_write.state != self._state ():
+			return self.from_int (
+				compiled_write.value,
+				number = compiled_write.number,
+				latch = compiled_write.latch,
+				reuse_previous = compiled_write.reuse_previous,
 			)
+		return self.__apply (
+			compiled_write.value,
+			compiled_write.number,
+			compiled_write.plan,
+			compiled_write.compiled,
+			latch = compiled_write.latch,
+		)
+
+	def __pend (self, value, number, latch = False):
+		'''
+			Record the given number of bits of the given
+			value as written in the batch, as a full write
+			would leave them, and whether to latch.
+		'''
+		pending = self.__pending
+		pending[0] = ((pending[0] << number) | value) & self._mask
+		pending[1] = min (pending[1] + number, self._number_outputs)
+		pending[2] = pending[2] or latch
+
+	@contextmanager
+	def batch (self):
+		'''
+			Hold back every write and latch made in the
+			context, only recording the data written,
+			then write the result in one cheapest write
+			with at most one latch on leaving the
+			outermost batch. Writes in a batch leave
+			the same data as full writes would.
+			Batches can be nested, and an error in one
+			drops the writes made in it.
+		'''
+		outermost = self.__pending is None
+		if outermost:
+			self.__pending = [self.__written, self.__number_written, False]
+		## What to go back to on an error:
+		rollback = list (self.__pending)
+		try:
+			yield self
+		except BaseException:
+			self.__pending[:] = rollback
+			raise
+		finally:
+			if outermost:
+				pending, self.__pending = self.__pending, None
+		if outermost:
+			value, number, latch = pending
+			if latch or (value, number) != (self.__written, self.__number_written):
+				self.from_int (
+					value,
+					number = number,
+					latch = latch,
+				)
+
+	def cache_info (self):
+		'''
+			Return the hits, misses, evictions and
+			size of the compiled write cache.
+		'''
+		return CacheInfo (
+			self.__cache_hits,
+			self.__cache_misses,
+			self.__cache_evictions,
+			len (self.__cache),
+			self.__cache_size,
+		)
+
+	def clear_cache (self):
+		'''
+			Empty the compiled write cache
+			and reset its counters.
+		'''
+		self.__cache.clear ()
+		self.__cache_hits = self.__cache_misses = self.__cache_evictions = 0
+
+	def from_bytes (
+		self,
+		data,
+		byte_order = 'little',
+		bit_order = 'little',
+		latch = True,
+		reuse_previous = True,
+	):
+		'''
+			Write the given bytes to the outputs, 8 per byte.
+			With little byte order the first byte sets outputs
+			0-7, and with little bit order its lowest bit
+			sets output 0. Latch the result by default.
+			Try reusing the previously written data by default.
+		'''
+		if bit_order not in ('little', 'big'):
+			raise ValueError ("bit_order must be either 'little' or 'big'.")
+		if bit_order == 'big':
+			data = bytes (data).translate (REVERSED_BITS)
+		return self.from_int (
+			int.from_bytes (data, byte_order),
+			number = min (8 * len (data), len (self)),
+			latch = latch,
+			reuse_previous = reuse_previous,
+		)
 
 	def from_list (
 		self,
@@ -271,29 +871,58 @@ class ShiftRegister (
 		reuse_previous = True,
 	):
 		'''
-			Write values for outputs 1-x to from the given list.
-			Data written in reverse so to_set[0] is
+			Write values for outputs 1-x to from the given list,
+			or any sequence including bytes, bytearray,
+			memoryview and NumPy arrays, which are left as
+			they are. Data written in reverse so to_set[0] is
 			set on pin 0 etc. Latch the result by default.
 			Try reusing the previously written data by default.
 		'''
-		if reuse_previous:
-			## Check if any of the currently
-			## written data is of any use:
-			already_written = list (self.__written)
-			len_to_set = len (to_set)
-			for i in range (len_to_set): ## to_set used in case shorter.
-				if already_written[:len_to_set - i] == to_set[i:]:
-					to_set = to_set[:i]
-		## Reverse the list so order is
-		## maintained once written:
-		to_set.reverse ()
-		## Iterate through the list:
-		for v in to_set:
-			self.next (v)
-		## Only latch at the end for
-		## efficiency, if requested:
-		if latch:
-			self.latch ()
+		return self.from_int (
+			list_to_int (to_set),
+			number = len (to_set),
+			latch = latch,
+			reuse_previous = reuse_previous,
+		)
+
+	def write_frames (
+		self,
+		frames,
+		interval = 0,
+		latch = True,
+		reuse_previous = True,
+	):
+		'''
+			Write each of the given frames of output values
+			(such as the rows of a 2D NumPy array) in turn,
+			starting one every given number of seconds.
+			Every frame is packed, planned and compiled up
+			front, against the state the one before leaves,
+			so streaming only waits and emits, skipping
+			frames the same as the one before.
+			Return the number of frames written.
+		'''
+		values = frames_to_ints (frames)
+		if not values:
+			return 0
+		changed = [True] + [a != b for a, b in zip (values, values[1:])]
+		compiled_writes = iter (
+			self.compile_writes (
+				[value for value, is_changed in zip (values, changed) if is_changed],
+				number = len (frames[0]),
+				latch = latch,
+				reuse_previous = reuse_previous,
+			)
+		)
+		number_written = 0
+		deadline = time_perf_counter ()
+		for is_changed in changed:
+			wait_until (deadline)
+			deadline += interval
+			if is_changed:
+				self.write_compiled (next (compiled_writes))
+				number_written += 1
+		return number_written
 
 	def from_pin_list (
 		self,
@@ -308,10 +937,11 @@ class ShiftRegister (
 			Latch the result by default.
 			Try reusing the current data by default.
 		'''
-		to_write = [
-			self.ON if pin in pin_list else self.OFF for pin in range (len (self))
-		]
-		self.from_list (
+		to_write = 0
+		for pin in pin_list:
+			if 0 <= pin < len (self):
+				to_write |= 1 << pin
+		return self.from_int (
 			to_write,
 			latch = latch,
 			reuse_previous = reuse_previous,
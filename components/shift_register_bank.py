@@ -0,0 +1,256 @@
+from .shift_chain import (
+	ShiftChain,
+	bits,
+	unpack,
+)
+from .shift_register import (
+	list_to_int,
+	overlaps,
+)
+
+class ShiftRegisterBank (ShiftChain):
+	'''
+		A class for handling several shift register
+		chains side by side, each on its own data pin
+		but all sharing one clock and one latch pin.
+	'''
+	_timed_methods = (
+		'from_lists',
+		'from_ints',
+		'all',
+		'clear',
+		'shift',
+		'next',
+		'clock',
+		'latch',
+	)
+
+	def __init__ (self, **kwargs):
+		'''
+			A manager class for running equally
+			long shift register chains on the given
+			data pins and shared clock and latch pins.
+		'''
+		## Data is held as an integer bit field per chain,
+		## with bit x for output x. Every chain is clocked
+		## together so share how many bits are known:
+		self.__written = [0] * len (kwargs['data_pin_ids'])
+		self.__output = tuple (self.__written)
+		self.__number_written = self.__number_output = 0
+		super ().__init__ (**kwargs)
+		## Ensure the output is clear:
+		self.clear ()
+
+	@property
+	def number_chains (self):
+		'''
+			Return the number of chains
+			this instance is controlling.
+		'''
+		return len (self._data_pin_ids)
+
+	@property
+	def output (self):
+		'''
+			Return the currently output
+			data of each chain.
+		'''
+		return tuple (
+			unpack (v, self.__number_output) for v in self.__output
+		)
+
+	@property
+	def written (self):
+		'''
+			Return the currently written
+			data of each chain.
+		'''
+		return tuple (
+			unpack (v, self.__number_written) for v in self.__written
+		)
+
+	def to_ints (self, written = False):
+		'''
+			Return the currently output data of each
+			chain as an integer, with bit x for output x.
+			Return the written data instead if requested.
+		'''
+		if written:
+			return tuple (self.__written)
+		return self.__output
+
+	def data_pin_on (self, chain):
+		'''
+			Return a boolean for whether the given
+			chain's data pin is currently on.
+		'''
+		return self._data_values[chain] == self.ON
+
+	def data_off (self, chain):
+		'''
+			Turn the given chain's data
+			pin off if it's not already.
+		'''
+		self._set_data (chain, self.OFF)
+
+	def data_on (self, chain):
+		'''
+			Turn the given chain's data
+			pin on if it's not already.
+		'''
+		self._set_data (chain, self.ON)
+
+	def _shift_in_values (self, values, number):
+		'''
+			Record the given number of bits of each
+			chain's value as written, the last bit
+			written (bit 0) ending up on output 0.
+		'''
+		mask = self._mask
+		self.__written = [
+			((w << number) | v) & mask for w, v in zip (self.__written, values)
+		]
+		self.__number_written = min (
+			self.__number_written + number,
+			self._number_outputs,
+		)
+
+	def _latch_written (self):
+		'''
+			Record the written data as output.
+		'''
+		self.__output = tuple (self.__written)
+		self.__number_output = self.__number_written
+		super ()._latch_written ()
+
+	def __write (self, values, number, latch = False):
+		'''
+			Write the given number of bits of each chain's
+			value and latch if requested. The pin transitions
+			are compiled up front and emitted from one
+			loop, with the state updated once at the end.
+		'''
+		mask = (1 << number) - 1
+		values = [v & mask for v in values]
+		self._write_compiled (
+			values,
+			number,
+			self._compile_values (values, number, latch = latch),
+			latch = latch,
+		)
+
+	def shift (self):
+		'''
+			Shift every chain's data along,
+			ensuring no data is added.
+		'''
+		self.__write (
+			[self.OFF] * self.number_chains,
+			1,
+			latch = True,
+		)
+
+	def next (self, on_or_off_values, latch = False):
+		'''
+			Set the next value of each chain to the
+			given on or off values and latch if requested.
+		'''
+		self.__write (
+			[self.ON if v else self.OFF for v in on_or_off_values],
+			1,
+			latch = latch,
+		)
+
+	def all (self, on_or_off, latch = False):
+		'''
+			Write all data of every chain to the given
+			on or off value and latch if requested.
+		'''
+		self.__write (
+			[self._mask if on_or_off else 0] * self.number_chains,
+			len (self),
+			latch = latch,
+		)
+
+	def clear (self):
+		'''
+			Turn off all outputs.
+		'''
+		## Use ClearMixin if possible for speed:
+		if self.controlling_clear_pin:
+			super ().clear ()
+			self.__written = [0] * self.number_chains
+			self.__number_written = self._number_outputs
+			self.latch ()
+		else:
+			self.all (
+				self.OFF,
+				latch = True,
+			)
+
+	def from_ints (
+		self,
+		values,
+		number = None,
+		latch = True,
+		reuse_previous = True,
+	):
+		'''
+			Write the given integers to outputs 0-x of each
+			chain, with bit x setting output x, over the given
+			number of outputs (defaults to all of them).
+			Latch the result by default.
+			Try reusing the previously written data by default,
+			shifting in only as much as every chain needs.
+		'''
+		if number is None:
+			number = len (self)
+		mask = (1 << number) - 1
+		values = [v & mask for v in values]
+		if len (values) != self.number_chains:
+			raise ValueError ('A value is needed for every chain.')
+		to_write = number
+		if reuse_previous:
+			## The shared clock shifts every chain the
+			## same amount, so find the longest overlap
+			## every chain's written data allows:
+			number_previous = min (number, self.__number_written)
+			previous_mask = (1 << number_previous) - 1
+			common = None
+			for w, v in zip (self.__written, values):
+				found = set (
+					overlaps (
+						bits (w & previous_mask, number_previous)[::-1],
+						bits (v, number)[::-1],
+					)
+				)
+				common = found if common is None else common & found
+			to_write -= max (common)
+		self.__write (
+			values,
+			to_write,
+			latch = latch,
+		)
+
+	def from_lists (
+		self,
+		to_set_lists,
+		latch = True,
+		reuse_previous = True,
+	):
+		'''
+			Write values for outputs 0-x of each chain from
+			the given equally long lists, one per chain, so
+			to_set_lists[c][0] is set on pin 0 of chain c.
+			Latch the result by default.
+			Try reusing the previously written data by default.
+		'''
+		number = len (to_set_lists[0]) if to_set_lists else 0
+		if any (len (to_set) != number for to_set in to_set_lists):
+			raise ValueError ('Every chain needs the same number of values.')
+		self.from_ints (
+			[list_to_int (to_set) for to_set in to_set_lists],
+			number = number,
+			latch = latch,
+			reuse_previous = reuse_previous,
+		)
@@ -0,0 +1,203 @@
+try:
+	import spidev
+except ImportError:
+	spidev = None
+
+from ..exceptions import (
+	ImproperlyConfigured,
+	NoDataClockControl,
+)
+from .shift_register import (
+	ShiftRegister,
+	WritePlan,
+)
+
+class SpiShiftRegister (ShiftRegister):
+	'''
+		A class for handling a shift register
+		with its data and clock driven by the
+		SPI peripheral and only the latch
+		(plus clear and output enable) on GPIO.
+	'''
+	## SPI0's MOSI and SCLK pins:
+	SPI_DATA_PIN_ID = 10
+	SPI_CLOCK_PIN_ID = 11
+
+	def __init__ (self, **kwargs):
+		'''
+			A manager class for running a shift register
+			on the given SPI bus and device (or an already
+			opened spidev.SpiDev given as spi) and a
+			given GPIO latch pin.
+		'''
+		self.__latch_pin_id = kwargs['latch_pin_id']
+		self.__spi = kwargs.pop ('spi', None)
+		spi_bus = kwargs.pop ('spi_bus', 0)
+		spi_device = kwargs.pop ('spi_device', 0)
+		spi_max_speed_hz = kwargs.pop ('spi_max_speed_hz', 8000000)
+		if self.__spi is None:
+			if spidev is None:
+				raise ImproperlyConfigured ('spidev is needed to use SPI.')
+			self.__spi = spidev.SpiDev ()
+			self.__spi.open (spi_bus, spi_device)
+			self.__spi.max_speed_hz = spi_max_speed_hz
+			## Data is sampled on the rising clock edge:
+			self.__spi.mode = 0
+		## The data and clock pins are only for reference:
+		kwargs.setdefault ('data_pin_id', self.SPI_DATA_PIN_ID)
+		kwargs.setdefault ('clock_pin_id', self.SPI_CLOCK_PIN_ID)
+		super ().__init__ (**kwargs)
+
+	@property
+	def spi (self):
+		'''
+			Return the SPI device in use.
+		'''
+		return self.__spi
+
+	def _setup_pins (self):
+		'''
+			Set up only the latch pin, leaving
+			data and clock to the SPI peripheral.
+		'''
+		self._gpio.setup (
+			self.__latch_pin_id,
+			self._gpio.OUT,
+			initial = self._gpio.LOW,
+		)
+
+	def _compile (
+		self,
+		value,
+		number,
+		latch = False,
+		state = None,
+	):
+		'''
+			Return the bytes of the whole frame the given
+			bits leave written (or None if there are none)
+			and the latch pin transitions requested, from
+			the given state (defaults to the current one).
+			Leading padding bits are shifted out
+			past the end of the chain.
+		'''
+		if state is None:
+			state = self._state ()
+		data = None
+		if number:
+			frame = ((state[0] << number) | value) & ((1 << len (self)) - 1)
+			## The first bit sent ends up furthest along:
+			data = frame.to_bytes ((len (self) + 7) // 8, 'big')
+		transitions = []
+		if latch:
+			if state[4]:
+				transitions.append ((self.__latch_pin_id, self._gpio.LOW))
+				transitions.append ((self.__latch_pin_id, self._gpio.HIGH))
+			else:
+				transitions.append ((self.__latch_pin_id, self._gpio.HIGH))
+				transitions.append ((self.__latch_pin_id, self._gpio.LOW))
+		return data, transitions
+
+	def _emit (self, compiled):
+		'''
+			Send the given compiled frame in one
+			SPI transfer, then make its latch
+			pin transitions.
+		'''
+		data, transitions = compiled
+		if data is not None:
+			if hasattr (self.__spi, 'writebytes2'):
+				self.__spi.writebytes2 (data)
+			else:
+				self.__spi.writebytes (list (data))
+		for pin, level in transitions:
+			self._gpio.output (pin, level)
+
+	def _count_compiled (self, compiled, number):
+		'''
+			Count nothing for SPI transfers, as
+			there are no pin writes to avoid.
+		'''
+		pass
+
+	def _plan (self, value, number, reuse_previous, state):
+		'''
+			Return a plan for writing the given integer.
+			Every write is one whole frame transfer,
+			so there's nothing to gain from reuse.
+		'''
+		return WritePlan (
+			self.FULL,
+			number,
+			1,
+		)
+
+	def data_off (self):
+		'''
+			Refuse to set the data pin,
+			as it's driven by SPI.
+		'''
+		raise NoDataClockControl
+
+	def data_on (self):
+		'''
+			Refuse to set the data pin,
+			as it's driven by SPI.
+		'''
+		raise NoDataClockControl
+
+	def data (self):
+		'''
+			Refuse to pulse the data pin,
+			as it's driven by SPI.
+		'''
+		raise NoDataClockControl
+
+	def clock_off (self):
+		'''
+			Refuse to set the clock pin,
+			as it's driven by SPI.
+		'''
+		raise NoDataClockControl
+
+	def clock_on (self):
+		'''
+			Refuse to set the clock pin,
+			as it's driven by SPI.
+		'''
+		raise NoDataClockControl
+
+	def clock (self):
+		'''
+			Refuse to pulse the clock pin,
+			as it's driven by SPI.
+		'''
+		raise NoDataClockControl
+
+	def shift (self):
+		'''
+			Shift the current data along,
+			ensuring no data is added.
+		'''
+		self.next (
+			self.OFF,
+			latch = True,
+		)
+
+	def next (self, on_or_off, latch = False):
+		'''
+			Set the next value to the given
+			on or off value and latch if requested,
+			by sending the whole shifted frame.
+		'''
+		self.from_int (
+			self.to_int (written = True) << 1 | (self.ON if on_or_off else self.OFF),
+			latch = latch,
+			reuse_previous = False,
+		)
+
+	def close (self):
+		'''
+			Close the SPI device.
+		'''
+		self.__spi.close ()
@@ -1,3 +1,5 @@
 from .improperly_configured import ImproperlyConfigured
 from .no_clear_control import NoClearControl
 from .no_enable_control import NoEnableControl
+from .no_clock_inhibit_control import NoClockInhibitControl
+from .no_data_clock_control import NoDataClockControl
@@ -0,0 +1,14 @@
+class NoClockInhibitControl (Exception):
+    '''
+        An exception for trying to use
+        an uncontrolled clock inhibit.
+    '''
+
+    def __init__ (self, message = None):
+        '''
+            Use a standard message if
+            not given one.
+        '''
+        if not message:
+            message = 'The clock inhibit pin is not being controlled.'
+        super ().__init__ (self, message)
@@ -0,0 +1,14 @@
+class NoDataClockControl (Exception):
+    '''
+        An exception for trying to use data
+        and clock pins driven by SPI.
+    '''
+
+    def __init__ (self, message = None):
+        '''
+            Use a standard message if
+            not given one.
+        '''
+        if not message:
+            message = 'The data and clock pins are driven by the SPI peripheral.'
+        super ().__init__ (self, message)
@@ -1,2 +1,4 @@
+from .gpio_mixin import GpioMixin
 from .clear_mixin import ClearMixin
 from .output_enable_mixin import OutputEnableMixin
+from .clock_inhibit_mixin import ClockInhibitMixin
@@ -1,11 +1,7 @@
-from RPi import GPIO
-
 from ..exceptions import NoClearControl
+from .gpio_mixin import GpioMixin
 
-## Set the pin mode:
-GPIO.setmode (GPIO.BCM)
-
-class ClearMixin ():
+class ClearMixin (GpioMixin):
 	'''
 		A mixin for adding clear control
 		to an electrical component.
@@ -13,18 +9,25 @@ class ClearMixin ():
 	ON = 1
 	OFF = 0
 	clear_active_low = True
+	_timed_methods = (
+		'no_clear',
+	)
 
 	def __init__ (self, **kwargs):
 		'''
 			Set up clear control.
 		'''
 		self._clear_pin_id = kwargs.pop ('clear_pin_id', None)
+		## The GPIO handle is set up further along:
+		super ().__init__ (**kwargs)
 		## Ensure clear is disabled if clear pin used:
 		if self.controlling_clear_pin:
-			GPIO.setup (self._clear_pin_id, GPIO.OUT)
-			self._clear_value = self.OFF if self.clear_active_low else self.ON
-			self.no_clear ()
-		super ().__init__ (**kwargs)
+			self._clear_value = self.ON if self.clear_active_low else self.OFF
+			self._gpio.setup (
+				self._clear_pin_id,
+				self._gpio.OUT,
+				initial = self._gpio.HIGH if self._clear_value else self._gpio.LOW,
+			)
 
 	@property
 	def controlling_clear_pin (self):
@@ -50,8 +53,10 @@ class ClearMixin ():
 			if it's not already.
 		'''
 		if self.clear_pin_on:
-			GPIO.output (self._clear_pin_id, GPIO.LOW)
+			self._transition (self._clear_pin_id, self._gpio.LOW)
 			self._clear_value = self.OFF
+		else:
+			self._count_stat ('redundant_writes_avoided')
 
 	def clear_on (self):
 		'''
@@ -59,8 +64,10 @@ class ClearMixin ():
 			if it's not already.
 		'''
 		if not self.clear_pin_on:
-			GPIO.output (self._clear_pin_id, GPIO.HIGH)
+			self._transition (self._clear_pin_id, self._gpio.HIGH)
 			self._clear_value = self.ON
+		else:
+			self._count_stat ('redundant_writes_avoided')
 
 	def no_clear (self):
 		'''
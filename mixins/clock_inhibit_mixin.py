@@ -0,0 +1,101 @@
+from ..exceptions import NoClockInhibitControl
+from .gpio_mixin import GpioMixin
+
+class ClockInhibitMixin (GpioMixin):
+	'''
+		A mixin for adding clock inhibit
+		control to an electrical component.
+	'''
+	ON = 1
+	OFF = 0
+	clock_inhibit_active_low = False
+	_timed_methods = (
+		'allow_clock',
+		'inhibit_clock',
+	)
+
+	def __init__ (self, **kwargs):
+		'''
+			Set up clock inhibit control.
+		'''
+		self._clock_inhibit_pin_id = kwargs.pop ('clock_inhibit_pin_id', None)
+		## The GPIO handle is set up further along:
+		super ().__init__ (**kwargs)
+		## Ensure the clock is allowed if inhibit pin used:
+		if self.controlling_clock_inhibit_pin:
+			self._clock_inhibit_value = self.ON if self.clock_inhibit_active_low else self.OFF
+			self._gpio.setup (
+				self._clock_inhibit_pin_id,
+				self._gpio.OUT,
+				initial = self._gpio.HIGH if self._clock_inhibit_value else self._gpio.LOW,
+			)
+
+	@property
+	def controlling_clock_inhibit_pin (self):
+		'''
+			Return a boolean for whether the
+			clock inhibit pin is controlled.
+		'''
+		return bool (self._clock_inhibit_pin_id)
+
+	@property
+	def clock_inhibit_pin_on (self):
+		'''
+			Return a boolean for whether the
+			clock inhibit pin is currently on.
+		'''
+		if not self.controlling_clock_inhibit_pin:
+			raise NoClockInhibitControl
+		return self._clock_inhibit_value == self.ON
+
+	@property
+	def clock_inhibited (self):
+		'''
+			Return a boolean for whether
+			the clock is currently inhibited.
+		'''
+		if self.clock_inhibit_active_low:
+			return not self.clock_inhibit_pin_on
+		return self.clock_inhibit_pin_on
+
+	def clock_inhibit_off (self):
+		'''
+			Turn the clock inhibit pin
+			off if it's not already.
+		'''
+		if self.clock_inhibit_pin_on:
+			self._gpio.output (self._clock_inhibit_pin_id, self._gpio.LOW)
+			self._clock_inhibit_value = self.OFF
+		else:
+			self._count_stat ('redundant_writes_avoided')
+
+	def clock_inhibit_on (self):
+		'''
+			Turn the clock inhibit pin
+			on if it's not already.
+		'''
+		if not self.clock_inhibit_pin_on:
+			self._gpio.output (self._clock_inhibit_pin_id, self._gpio.HIGH)
+			self._clock_inhibit_value = self.ON
+		else:
+			self._count_stat ('redundant_writes_avoided')
+
+	def allow_clock (self):
+		'''
+			Make sure the clock
+			is not inhibited.
+		'''
+		if self.clock_inhibit_active_low:
+			self.clock_inhibit_on ()
+		else:
+			self.clock_inhibit_off ()
+
+	def inhibit_clock (self):
+		'''
+			Make sure the clock
+			is inhibited.
+		'''
+		if self.clock_inhibit_active_low:
+			self.clock_inhibit_off ()
+		else:
+			self.clock_inhibit_on ()
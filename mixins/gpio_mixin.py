@@ -0,0 +1,171 @@
+from functools import wraps
+from time import perf_counter as time_perf_counter
+
+from ..backends.registry import resolve_backend
+
+class CountingGPIO ():
+	'''
+		A wrapper around a GPIO module counting
+		the output calls and rising edges
+		made on each pin.
+	'''
+
+	def __init__ (self, gpio, stats):
+		'''
+			Wrap the given GPIO module, counting
+			into the given stats dictionary.
+		'''
+		self.__gpio = gpio
+		self.__outputs = stats['outputs']
+		self.__rising_edges = stats['rising_edges']
+
+	def __getattr__ (self, name):
+		'''
+			Pass everything else
+			on to the GPIO module.
+		'''
+		return getattr (self.__gpio, name)
+
+	def output (self, channel, value):
+		'''
+			Count then make an output call.
+		'''
+		if isinstance (channel, (list, tuple)):
+			pairs = zip (
+				channel,
+				value if isinstance (value, (list, tuple)) else [value] * len (channel),
+			)
+		else:
+			pairs = ((channel, value),)
+		for c, v in pairs:
+			self.__outputs[c] = self.__outputs.get (c, 0) + 1
+			## Components only write changes, so
+			## setting a pin high is a rising edge:
+			if v:
+				self.__rising_edges[c] = self.__rising_edges.get (c, 0) + 1
+		self.__gpio.output (channel, value)
+
+class GpioMixin ():
+	'''
+		A mixin giving an electrical component
+		its GPIO handle, with opt-in counting
+		of GPIO operations and timing of
+		public methods.
+	'''
+	## Public methods to time, added to by each class:
+	_timed_methods = ()
+
+	def __init__ (self, **kwargs):
+		'''
+			Set up the GPIO handle, the default backend
+			unless another backend or backend name is
+			given as gpio, collecting stats if requested.
+		'''
+		self._gpio = self.__gpio = resolve_backend (kwargs.pop ('gpio', None))
+		self._stats = None
+		if kwargs.pop ('stats', False):
+			self.enable_stats ()
+		super ().__init__ (**kwargs)
+
+	@property
+	def collecting_stats (self):
+		'''
+			Return a boolean for whether
+			stats are being collected.
+		'''
+		return self._stats is not None
+
+	def _count_stat (self, name, number = 1):
+		'''
+			Add the given number to the named
+			counter if collecting stats.
+		'''
+		if self._stats is not None:
+			self._stats[name] += number
+
+	def __timed (self, name, method):
+		'''
+			Return the given bound method wrapped
+			to add up the calls and time it takes.
+		'''
+		seconds = self._stats['seconds']
+		calls = self._stats['calls']
+		@wraps (method)
+		def timed (*args, **kwargs):
+			start = time_perf_counter ()
+			try:
+				return method (*args, **kwargs)
+			finally:
+				seconds[name] = seconds.get (name, 0) + time_perf_counter () - start
+				calls[name] = calls.get (name, 0) + 1
+		return timed
+
+	def _transition (self, pin, level):
+		'''
+			Set the given pin to the given level.
+			Components holding their pins to a
+			timing make it wait here.
+		'''
+		self._gpio.output (pin, level)
+
+	def enable_stats (self):
+		'''
+			Start collecting stats, from zero.
+			Costs almost nothing while disabled
+			as nothing is wrapped.
+		'''
+		self.reset_stats ()
+		self._gpio = CountingGPIO (self.__gpio, self._stats)
+		for cls in type (self).__mro__:
+			for name in cls.__dict__.get ('_timed_methods', ()):
+				if name not in self.__dict__:
+					setattr (self, name, self.__timed (name, getattr (self, name)))
+
+	def disable_stats (self):
+		'''
+			Stop collecting stats,
+			removing any wrapping.
+		'''
+		if self._stats is not None:
+			for cls in type (self).__mro__:
+				for name in cls.__dict__.get ('_timed_methods', ()):
+					self.__dict__.pop (name, None)
+			self._gpio = self.__gpio
+			self._stats = None
+
+	def reset_stats (self):
+		'''
+			Reset every stat to zero.
+		'''
+		stats = {
+			'outputs': {},
+			'rising_edges': {},
+			'redundant_writes_avoided': 0,
+			'bits_reused': 0,
+			'seconds': {},
+			'calls': {},
+		}
+		if self._stats is None:
+			self._stats = stats
+		else:
+			## Keep the same dictionaries in use:
+			for name, value in stats.items ():
+				if isinstance (value, dict):
+					self._stats[name].clear ()
+				else:
+					self._stats[name] = value
+
+	def stats (self):
+		'''
+			Return a copy of the stats collected:
+			output calls and rising edges per pin,
+			redundant writes avoided, bits reused and
+			the calls to and cumulative seconds in
+			each public method.
+		'''
+		if self._stats is None:
+			return None
+		return {
+			name: dict (value) if isinstance (value, dict) else value
+			for name, value in self._stats.items ()
+		}
@@ -1,11 +1,7 @@
-from RPi import GPIO
-
 from ..exceptions import NoEnableControl
+from .gpio_mixin import GpioMixin
 
-## Set the pin mode:
-GPIO.setmode (GPIO.BCM)
-
-class OutputEnableMixin ():
+class OutputEnableMixin (GpioMixin):
 	'''
 		A mixin for adding output enable
 		control to an electrical component.
@@ -13,18 +9,26 @@ class OutputEnableMixin ():
 	ON = 1
 	OFF = 0
 	enable_active_low = True
+	_timed_methods = (
+		'enable',
+		'disable',
+	)
 
 	def __init__ (self, **kwargs):
 		'''
 			Set up output enable control.
 		'''
 		self._enable_pin_id = kwargs.pop ('enable_pin_id', None)
+		## The GPIO handle is set up further along:
+		super ().__init__ (**kwargs)
 		## Ensure output is enabled if enable pin used:
 		if self.controlling_enable_pin:
-			GPIO.setup (self._enable_pin_id, GPIO.OUT)
-			self._enable_value = self.ON if self.enable_active_low else self.OFF
-			self.enable ()
-		super ().__init__ (**kwargs)
+			self._enable_value = self.OFF if self.enable_active_low else self.ON
+			self._gpio.setup (
+				self._enable_pin_id,
+				self._gpio.OUT,
+				initial = self._gpio.HIGH if self._enable_value else self._gpio.LOW,
+			)
 
 	@property
 	def controlling_enable_pin (self):
@@ -60,8 +64,10 @@ class OutputEnableMixin ():
 			if it's not already.
 		'''
 		if self.enable_pin_on:
-			GPIO.output (self._enable_pin_id, GPIO.LOW)
+			self._gpio.output (self._enable_pin_id, self._gpio.LOW)
 			self._enable_value = self.OFF
+		else:
+			self._count_stat ('redundant_writes_avoided')
 
 	def enable_on (self):
 		'''
@@ -69,8 +75,10 @@ class OutputEnableMixin ():
 			if it's not already.
 		'''
 		if not self.enable_pin_on:
-			GPIO.output (self._enable_pin_id, GPIO.HIGH)
+			self._gpio.output (self._enable_pin_id, self._gpio.HIGH)
 			self._enable_value = self.ON
+		else:
+			self._count_stat ('redundant_writes_avoided')
 
 	def enable (self):
 		'''
@@ -82,6 +90,8 @@ class OutputEnableMixin ():
 				self.enable_off ()
 			else:
 				self.enable_on ()
+		else:
+			self._count_stat ('redundant_writes_avoided')
 
 	def disable (self):
 		'''
@@ -93,3 +103,5 @@ class OutputEnableMixin ():
 				self.enable_on ()
 			else:
 				self.enable_off ()
+		else:
+			self._count_stat ('redundant_writes_avoided')
@@ -1 +1 @@
-from .shift_register import test_shift_register
+from .shift_register import create_test_shift_register
@@ -0,0 +1,127 @@
+import asyncio
+from random import getrandbits as random_getrandbits
+from time import perf_counter as time_perf_counter
+
+from ..backends import HC595Chain
+from ..components import (
+	AsyncShiftRegister,
+	ShiftRegister,
+)
+
+def create_long_shift_register (number_outputs = 4096, **kwargs):
+	'''
+		Create a shift register long enough for
+		each write to be slow, on pins 4, 17 and
+		18, with any other options given.
+	'''
+	return ShiftRegister (
+		number_outputs = number_outputs,
+		data_pin_id = 4,
+		clock_pin_id = 17,
+		latch_pin_id = 18,
+		**kwargs
+	)
+
+async def longest_stall (coroutine, tick_seconds = 0.001):
+	'''
+		Await the given coroutine while ticking, and
+		return the longest any tick ran late by: how
+		long the event loop was stalled.
+	'''
+	stalls = []
+	done = False
+	async def tick ():
+		while not done:
+			start = time_perf_counter ()
+			await asyncio.sleep (tick_seconds)
+			stalls.append (time_perf_counter () - start - tick_seconds)
+	ticker = asyncio.ensure_future (tick ())
+	## Let the ticker start first:
+	await asyncio.sleep (0)
+	try:
+		await coroutine
+	finally:
+		done = True
+		await ticker
+	return max (stalls)
+
+def test_event_loop_stall (iterations = 20):
+	'''
+		Check writing random frames through the async
+		facade stalls the event loop for less time than
+		writing them directly from a coroutine does,
+		and leaves the last frame output, on a long
+		shift register so each write is slow.
+	'''
+	shift_register = create_long_shift_register ()
+	frames = [
+		[random_getrandbits (1) for a in range (len (shift_register))]
+		for i in range (iterations)
+	]
+	async def write_directly ():
+		for to_set in frames:
+			shift_register.from_list (to_set)
+	async def write_async (async_shift_register):
+		for to_set in frames:
+			await async_shift_register.write (to_set)
+	async def compare ():
+		direct = await longest_stall (write_directly ())
+		async with AsyncShiftRegister (shift_register) as async_shift_register:
+			stall = await longest_stall (write_async (async_shift_register))
+		return direct, stall
+	direct, stall = asyncio.run (compare ())
+	assert stall < direct
+	assert shift_register.output == tuple (frames[-1])
+
+def test_concurrent (shift_registers, iterations = 20):
+	'''
+		Check the given shift registers, on different
+		pins, can all be written at once through their
+		async facades, each keeping its writes in order.
+	'''
+	async def write (shift_register):
+		async with AsyncShiftRegister (shift_register) as async_shift_register:
+			writes = []
+			for i in range (iterations):
+				to_set = [random_getrandbits (1) for a in range (len (shift_register))]
+				writes.append (async_shift_register.write (to_set))
+			await asyncio.gather (*writes)
+			assert async_shift_register.output == tuple (to_set)
+			await async_shift_register.clear ()
+			assert not any (async_shift_register.output)
+	async def write_all ():
+		await asyncio.gather (*(
+			write (shift_register)
+			for shift_register in shift_registers
+		))
+	asyncio.run (write_all ())
+
+def test_shared (number_facades = 2, iterations = 20):
+	'''
+		Check several async facades over one shift
+		register, written at once, never interleave
+		their writes on a simulated chain, and that
+		calls wait while the register's lock is held.
+	'''
+	chain = HC595Chain (4096)
+	shift_register = create_long_shift_register (gpio = chain)
+	def write_checked (to_set):
+		shift_register.from_list (to_set, reuse_previous = False)
+		chain.check (shift_register, raise_error = True)
+	async def write (async_shift_register):
+		for i in range (iterations):
+			to_set = [random_getrandbits (1) for a in range (len (shift_register))]
+			await async_shift_register.run (write_checked, to_set)
+	async def write_all ():
+		facades = [AsyncShiftRegister (shift_register) for f in range (number_facades)]
+		await asyncio.gather (*(write (facade) for facade in facades))
+		to_set = [random_getrandbits (1) for a in range (len (shift_register))]
+		with shift_register.lock:
+			blocked = asyncio.ensure_future (facades[0].write (to_set))
+			await asyncio.sleep (0.01)
+			assert not blocked.done ()
+		await blocked
+		assert shift_register.output == tuple (to_set)
+		for facade in facades:
+			await facade.close ()
+	asyncio.run (write_all ())
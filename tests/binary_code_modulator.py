@@ -0,0 +1,49 @@
+from random import randint as random_randint
+from time import sleep as time_sleep
+
+from ..components import BinaryCodeModulator
+
+def test_planes (shift_register, iterations = 100, bits = 8):
+	'''
+		Check the bit planes worked out from random
+		intensities add back up to those intensities.
+	'''
+	modulator = BinaryCodeModulator (
+		shift_register,
+		bits = bits,
+	)
+	for i in range (iterations):
+		intensities = [random_randint (0, modulator.maximum) for a in range (len (shift_register))]
+		modulator.set_intensities (intensities)
+		assert intensities == [
+			sum (((plane >> x) & 1) << b for b, plane in enumerate (modulator.planes))
+			for x in range (len (shift_register))
+		]
+
+def test_refresh (shift_register, bits = 4):
+	'''
+		Check a refresh leaves the highest bit
+		plane showing, and once running only
+		emits the planes' compiled writes.
+	'''
+	modulator = BinaryCodeModulator (
+		shift_register,
+		bits = bits,
+		base_seconds = 0.001,
+	)
+	intensities = [random_randint (0, modulator.maximum) for a in range (len (shift_register))]
+	modulator.set_intensities (intensities)
+	modulator.start ()
+	while modulator.number_refreshes < 3:
+		time_sleep (0.01)
+	modulator.stop ()
+	assert not any (shift_register.output)
+	modulator.refresh ()
+	assert shift_register.to_int () == modulator.planes[-1]
+	## Once running, refreshes only emit compiled writes:
+	shift_register.enable_stats ()
+	modulator.refresh ()
+	assert 'from_int' not in shift_register.stats ()['calls']
+	assert shift_register.stats ()['calls']['latch'] == bits
+	shift_register.disable_stats ()
+	assert shift_register.to_int () == modulator.planes[-1]
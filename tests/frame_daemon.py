@@ -0,0 +1,59 @@
+from multiprocessing import Process
+from random import getrandbits as random_getrandbits
+from time import perf_counter as time_perf_counter
+
+from ..components import (
+	FrameClient,
+	FrameDaemon,
+)
+from .shift_register import create_test_shift_register
+
+def publish_frames (name, name_prefix, number_frames, seed):
+	'''
+		Publish the given number of frames to the named
+		register, each waiting for the last to be written,
+		ending on a frame made from the given seed.
+	'''
+	with FrameClient (name, name_prefix = name_prefix) as frame_client:
+		for i in range (number_frames - 1):
+			frame_client.publish_int (random_getrandbits (len (frame_client)))
+			frame_client.wait_written ()
+		frame_client.publish_int (seed)
+		frame_client.wait_written ()
+
+def test_throughput (
+	number_clients = 8,
+	number_frames = 200,
+	name_prefix = 'electronics_test_',
+):
+	'''
+		Check the given number of client processes, each
+		publishing to their own register of a daemon, get
+		every frame written, ending on their last frame.
+		Return the frames written a second.
+	'''
+	shift_registers = {
+		'register_{}'.format (c): create_test_shift_register ()
+		for c in range (number_clients)
+	}
+	with FrameDaemon (shift_registers, name_prefix = name_prefix) as frame_daemon:
+		frame_daemon.start ()
+		start = time_perf_counter ()
+		clients = [
+			Process (
+				target = publish_frames,
+				args = (name, name_prefix, number_frames, c + 1),
+			)
+			for c, name in enumerate (shift_registers)
+		]
+		for client in clients:
+			client.start ()
+		for client in clients:
+			client.join ()
+			assert client.exitcode == 0
+		seconds = time_perf_counter () - start
+		frame_daemon.stop ()
+		assert frame_daemon.number_written == number_clients * number_frames
+		for c, shift_register in enumerate (shift_registers.values ()):
+			assert shift_register.to_int () == c + 1
+	return frame_daemon.number_written / seconds
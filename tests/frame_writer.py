@@ -0,0 +1,39 @@
+from random import getrandbits as random_getrandbits
+
+from ..components import FrameWriter
+
+def test_latest_wins (shift_register, iterations = 1000):
+	'''
+		Check posting frames faster than they can be
+		written drops stale ones, accounts for every
+		frame and leaves the newest one output.
+	'''
+	with FrameWriter (shift_register) as frame_writer:
+		for i in range (iterations):
+			to_set = [random_getrandbits (1) for a in range (len (shift_register))]
+			frame_writer.submit (to_set)
+		frame_writer.flush ()
+		assert shift_register.output == tuple (to_set)
+		assert frame_writer.number_submitted == iterations
+		assert frame_writer.number_written + frame_writer.number_coalesced == iterations
+	assert frame_writer.closed
+
+def test_error (shift_register):
+	'''
+		Check a frame that fails to write is counted
+		as failed and its error raised on flush.
+	'''
+	with FrameWriter (shift_register) as frame_writer:
+		frame_writer.submit (1)
+		try:
+			frame_writer.flush ()
+		except TypeError:
+			pass
+		else:
+			raise AssertionError ('A failed write was not reported.')
+		assert frame_writer.number_failed == 1
+		assert frame_writer.number_submitted == (
+			frame_writer.number_written
+			+ frame_writer.number_coalesced
+			+ frame_writer.number_failed
+		)
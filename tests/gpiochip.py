@@ -0,0 +1,43 @@
+from random import getrandbits as random_getrandbits
+
+from ..backends import (
+	fake_gpiod,
+	GpioChip,
+)
+from ..components import ShiftRegister
+
+def test_line_request (iterations = 100):
+	'''
+		Check a shift register on the gpiod backend,
+		over a fake gpiod module, holds all its lines
+		in one request and sets each group of lines
+		changing together in one ioctl.
+	'''
+	chip = fake_gpiod.install ()
+	gpio = GpioChip ()
+	shift_register = ShiftRegister (
+		number_outputs = 8,
+		data_pin_id = 4,
+		clock_pin_id = 17,
+		latch_pin_id = 18,
+		clear_pin_id = 22,
+		enable_pin_id = 23,
+		gpio = gpio,
+		stats = True,
+	)
+	assert len (chip.requests) == 1
+	assert sorted (chip.requests[0].offsets) == [4, 17, 18, 22, 23]
+	## Clear and enable are active low, so idle high:
+	assert gpio.input (22) == 1
+	assert gpio.input (23) == 0
+	for i in range (iterations):
+		to_set = [random_getrandbits (1) for a in range (8)]
+		ioctls = chip.ioctls
+		calls = sum (shift_register.stats ()['outputs'].values ())
+		write_plan = shift_register.from_list (to_set)
+		assert chip.ioctls - ioctls == write_plan.cost + (1 if write_plan.number else 2)
+		assert chip.ioctls - ioctls <= sum (shift_register.stats ()['outputs'].values ()) - calls
+		assert gpio.input (18) == shift_register.latch_pin_on
+		assert shift_register.output == tuple (to_set)
+	gpio.cleanup ()
+	assert not chip.held
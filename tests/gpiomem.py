@@ -0,0 +1,57 @@
+import os
+from random import getrandbits as random_getrandbits
+import struct
+from tempfile import TemporaryDirectory
+
+from ..backends import GpioMem
+from ..backends.gpiomem import BLOCK_SIZE
+from ..components import ShiftRegister
+
+def test_registers (path, iterations = 100):
+	'''
+		Check a shift register runs on the GPIO
+		registers mapped from the given file, setting
+		its pins as outputs and leaving the levels
+		from each write in the level registers.
+	'''
+	gpio = GpioMem (path)
+	shift_register = ShiftRegister (
+		number_outputs = 8,
+		data_pin_id = 4,
+		clock_pin_id = 17,
+		latch_pin_id = 18,
+		clear_pin_id = 22,
+		enable_pin_id = 35,
+		gpio = gpio,
+	)
+	with open (path, 'rb') as f:
+		registers = f.read (0x18)
+	select = struct.unpack ('6I', registers)
+	for pin in (4, 17, 18, 22, 35):
+		assert (select[pin // 10] >> (3 * (pin % 10))) & 7 == 1
+	## Clear and enable are active low, so idle high:
+	assert gpio.input (22) == 1
+	assert gpio.input (35) == 0
+	for i in range (iterations):
+		to_set = [random_getrandbits (1) for a in range (8)]
+		shift_register.from_list (to_set)
+		assert gpio.input (4) == shift_register.data_pin_on
+		assert gpio.input (17) == shift_register.clock_pin_on
+		assert gpio.input (18) == shift_register.latch_pin_on
+		shift_register.disable ()
+		assert gpio.input (35) == 1
+		shift_register.enable ()
+	gpio.cleanup ()
+	gpio.close ()
+
+def test_create ():
+	'''
+		Check mapping a path with no file there
+		creates one big enough for the registers.
+	'''
+	with TemporaryDirectory () as directory:
+		path = os.path.join (directory, 'gpiomem')
+		gpio = GpioMem (path)
+		assert gpio.simulated
+		assert os.path.getsize (path) == BLOCK_SIZE
+		gpio.close ()
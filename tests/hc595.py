@@ -0,0 +1,54 @@
+from random import getrandbits as random_getrandbits
+from time import perf_counter as time_perf_counter
+
+from ..backends import HC595Chain
+from .shift_register import create_test_shift_register
+
+def test_chain (iterations = 200):
+	'''
+		Check a simulated chain driven by a shift
+		register through random writes, clears and
+		enable changes always holds what the register
+		believes, and that a stray clock is flagged.
+	'''
+	chain = HC595Chain (16, clear_pin_id = 27, enable_pin_id = 22)
+	shift_register = create_test_shift_register (
+		gpio = chain,
+		clear_pin_id = 27,
+		enable_pin_id = 22,
+	)
+	for i in range (iterations):
+		choice = random_getrandbits (3)
+		if choice == 0:
+			shift_register.clear ()
+		elif choice == 1:
+			shift_register.disable ()
+		elif choice == 2:
+			shift_register.enable ()
+		else:
+			shift_register.from_int (random_getrandbits (len (shift_register)))
+		chain.check (shift_register, raise_error = True)
+		assert chain.outputs == (shift_register.to_int () if shift_register.enabled else None)
+	assert not chain.mismatches
+	## A clock the register doesn't know about:
+	shift_register.enable ()
+	shift_register.from_int (1)
+	chain.output (17, chain.LOW)
+	chain.output (17, chain.HIGH)
+	assert not chain.check (shift_register)
+	assert chain.mismatches[0].stage == 'shift'
+
+def test_clock_rate (number_clocks = 100000):
+	'''
+		Return the clocks a second the
+		simulated chain can be driven at.
+	'''
+	chain = HC595Chain (64)
+	output = chain.output
+	start = time_perf_counter ()
+	for i in range (number_clocks):
+		output (17, 1)
+		output (17, 0)
+	seconds = time_perf_counter () - start
+	assert chain.number_clocks == number_clocks
+	return number_clocks / seconds
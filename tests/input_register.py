@@ -0,0 +1,109 @@
+from random import getrandbits as random_getrandbits
+
+from ..backends import FakeGPIO
+from ..components import (
+	InputPoller,
+	InputRegister,
+)
+
+class FakeInputChain (FakeGPIO):
+	'''
+		A fake GPIO module wired to a chain of
+		74HC165s, with the given inputs loaded
+		while the latch is low and shifted
+		towards the data pin on each rising clock.
+	'''
+
+	def __init__ (
+		self,
+		number_inputs,
+		data_pin_id = 4,
+		clock_pin_id = 17,
+		latch_pin_id = 18,
+	):
+		'''
+			Set up the chain with all inputs off.
+		'''
+		super ().__init__ ()
+		self.number_inputs = number_inputs
+		self.data_pin_id = data_pin_id
+		self.clock_pin_id = clock_pin_id
+		self.latch_pin_id = latch_pin_id
+		self.inputs = 0
+		self.__shifting = 0
+
+	def output (self, channel, value):
+		'''
+			Load or shift the chain on the latch
+			going low or the clock rising.
+		'''
+		rising = value and not self.levels.get (channel)
+		super ().output (channel, value)
+		if channel == self.latch_pin_id and not value:
+			self.__shifting = self.inputs
+		elif channel == self.clock_pin_id and rising and self.levels.get (self.latch_pin_id):
+			self.__shifting = (self.__shifting << 1) & ((1 << self.number_inputs) - 1)
+
+	def input (self, channel):
+		'''
+			Return the level of the given channel,
+			the last input in the chain for data.
+		'''
+		if channel == self.data_pin_id:
+			return (self.__shifting >> (self.number_inputs - 1)) & 1
+		return super ().input (channel)
+
+def create_test_input_register (number_inputs = 24, **kwargs):
+	'''
+		Create a test input register on pins 4, 17 and
+		18 of a fake chain, with any other options given.
+	'''
+	return InputRegister (
+		number_inputs = number_inputs,
+		data_pin_id = 4,
+		clock_pin_id = 17,
+		latch_pin_id = 18,
+		gpio = FakeInputChain (number_inputs),
+		**kwargs
+	)
+
+def test_read (input_register, iterations = 100):
+	'''
+		Check reading the given input register, on a
+		fake chain, returns the inputs set each time.
+	'''
+	chain = input_register._gpio
+	for i in range (iterations):
+		chain.inputs = random_getrandbits (len (input_register))
+		assert input_register.read_int () == chain.inputs
+		assert input_register.inputs == tuple (
+			(chain.inputs >> x) & 1 for x in range (len (input_register))
+		)
+
+def test_debounce (input_register, debounce_scans = 3):
+	'''
+		Check polling the given input register, on a
+		fake chain, ignores an input bouncing for fewer
+		than the given number of scans and calls back
+		once it has held its new level for that long.
+	'''
+	chain = input_register._gpio
+	chain.inputs = 0
+	poller = InputPoller (
+		input_register,
+		debounce_scans = debounce_scans,
+	)
+	changes = []
+	poller.add_callback (lambda i, value: changes.append ((i, value)), input_number = 5)
+	for i in range (debounce_scans - 1):
+		chain.inputs = 1 << 5
+		poller.poll ()
+	chain.inputs = 0
+	poller.poll ()
+	assert not changes
+	chain.inputs = (1 << 5) | (1 << 7)
+	for i in range (debounce_scans):
+		poller.poll ()
+	assert changes == [(5, 1)]
+	assert poller.to_int () == chain.inputs
+	assert poller.number_scans == 2 * debounce_scans
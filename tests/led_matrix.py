@@ -0,0 +1,36 @@
+from random import getrandbits as random_getrandbits
+
+from ..components import LedMatrix
+
+def test_scan (row_register, column_register, iterations = 10):
+	'''
+		Check each scan of a random frame leaves the
+		last row selected showing its column data,
+		and once running only emits compiled writes.
+	'''
+	led_matrix = LedMatrix (
+		row_register,
+		column_register,
+		refresh_rate = 1000,
+	)
+	for i in range (iterations):
+		frame = [
+			[random_getrandbits (1) for c in range (led_matrix.number_columns)]
+			for r in range (led_matrix.number_rows)
+		]
+		led_matrix.set_frame (frame)
+		led_matrix.scan ()
+		assert row_register.to_int () == 1 << (led_matrix.number_rows - 1)
+		assert column_register.output == tuple (frame[-1])
+	column_word = led_matrix.column_words[0]
+	led_matrix.set_pixel (0, 0, not frame[0][0])
+	assert led_matrix.column_words[0] == column_word ^ 1
+	## Scans of an unchanged frame only emit compiled writes:
+	led_matrix.scan ()
+	column_register.enable_stats ()
+	row_register.enable_stats ()
+	led_matrix.scan ()
+	for register in (column_register, row_register):
+		assert 'from_int' not in register.stats ()['calls']
+		register.disable_stats ()
+	assert column_register.output == tuple (led_matrix.frame[-1])
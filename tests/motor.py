@@ -1,9 +1,7 @@
 import time
-import RPi.GPIO as GPIO
 from random import random as random_random
 
-## Set the pin mode:
-GPIO.setmode(GPIO.BCM)
+from ..backends import resolve_backend
 
 class TestMotor():
 	'''
@@ -12,14 +10,18 @@ class TestMotor():
 	STATUS_OFF = 0
 	STATUS_ON = 1
 
-	def __init__ (self, pin_id):
+	def __init__ (self, pin_id, gpio = None):
 		'''
 			A manager class for running
-			a motor on a given GPIO pin.
+			a motor on a given GPIO pin,
+			on the given GPIO backend or
+			backend name (defaults to the
+			default backend).
 		'''
 		self.__pin_id = pin_id
+		self.__gpio = resolve_backend (gpio)
 		self.status = None
-		GPIO.setup (self.__pin_id, GPIO.OUT)
+		self.__gpio.setup (self.__pin_id, self.__gpio.OUT)
 		## Ensure it's initially turned off:
 		self.off
 
@@ -28,7 +30,7 @@ class TestMotor():
 		'''
 			Turn the motor off.
 		'''
-		GPIO.output (self.__pin_id, GPIO.LOW)
+		self.__gpio.output (self.__pin_id, self.__gpio.LOW)
 		self.status = self.STATUS_OFF
 
 	@property
@@ -36,7 +38,7 @@ class TestMotor():
 		'''
 			Turn the motor on.
 		'''
-		GPIO.output (self.__pin_id, GPIO.HIGH)
+		self.__gpio.output (self.__pin_id, self.__gpio.HIGH)
 		self.status = self.STATUS_ON
 
 	def pulse (self, seconds=1):
@@ -55,6 +57,11 @@ class TestMotor():
 			self.pulse (random_random ())
 			time.sleep (random_random ())
 
-## Create a test motor on pin 18:
-TM1 = TestMotor (18)
-TM2 = TestMotor (4)
+def create_test_motors (**kwargs):
+	'''
+		Create test motors on pins 18 and 4.
+	'''
+	return (
+		TestMotor (18, **kwargs),
+		TestMotor (4, **kwargs),
+	)
@@ -0,0 +1,121 @@
+from random import getrandbits as random_getrandbits
+from time import perf_counter as time_perf_counter
+
+from ..backends import FakeGPIO
+from ..components import PulseTiming
+from ..components.pulse_timing import calibrate
+from .shift_register import create_test_shift_register
+
+class TimedFakeGPIO (FakeGPIO):
+	'''
+		A fake GPIO module recording when
+		each output call was made.
+	'''
+
+	def __init__ (self):
+		'''
+			Start with no output calls timed.
+		'''
+		super ().__init__ ()
+		self.timed_calls = []
+
+	def output (self, channel, value):
+		'''
+			Time then make an output call.
+		'''
+		super ().output (channel, value)
+		self.timed_calls.append ((time_perf_counter (), channel, value))
+
+def rises (
+	channel,
+	value,
+	edge_pin_ids = (17, 18),
+	clear_pin_id = 27,
+):
+	'''
+		Return a boolean for whether the given output
+		call, on one channel or a list of them, raises
+		a clock or latch pin or moves the clear pin.
+	'''
+	if not isinstance (channel, (list, tuple)):
+		channel, value = [channel], [value]
+	elif not isinstance (value, (list, tuple)):
+		value = [value] * len (channel)
+	return any (
+		(v == FakeGPIO.HIGH and c in edge_pin_ids) or c == clear_pin_id
+		for c, v in zip (channel, value)
+	)
+
+def test_timing (iterations = 20, pulse_seconds = 0.00002):
+	'''
+		Check random frames, single bits and shifts
+		written with a timing set leave at least the
+		minimum times around each rising clock and
+		latch edge, including edges grouped with
+		other pins in one output call, and around
+		both edges of a clear pulse.
+	'''
+	gpio = TimedFakeGPIO ()
+	timing = PulseTiming (
+		setup_seconds = pulse_seconds * 2,
+		hold_seconds = pulse_seconds / 4,
+		pulse_seconds = pulse_seconds,
+	)
+	shift_register = create_test_shift_register (
+		gpio = gpio,
+		timing = timing,
+		clear_pin_id = 27,
+	)
+	number_cleared = 0
+	for i in range (iterations):
+		to_set = [random_getrandbits (1) for a in range (len (shift_register))]
+		shift_register.from_list (to_set)
+		assert shift_register.output == tuple (to_set)
+		shift_register.next (random_getrandbits (1), latch = bool (random_getrandbits (1)))
+		shift_register.shift ()
+		## Clearing is cheapest after all on:
+		shift_register.all (shift_register.ON)
+		write_plan = shift_register.from_int (1)
+		number_cleared += write_plan.strategy == shift_register.CLEAR
+		assert shift_register.to_int () == 1
+	## Calls are timed as they return, so gaps between
+	## them only undercount the time between edges:
+	timed_calls = gpio.timed_calls
+	for (last, last_channel, last_value), (now, channel, value) in zip (timed_calls, timed_calls[1:]):
+		if rises (channel, value):
+			assert now - last >= timing.rise_seconds
+		if rises (last_channel, last_value):
+			assert now - last >= timing.after_rise_seconds
+	assert number_cleared == iterations
+	shift_register.timing = None
+
+def test_calibrate (number_frames = 10):
+	'''
+		Check calibrating against a chain that always
+		shows what was written speeds up from the
+		starting timing, and that a failing chain
+		is reported.
+	'''
+	shift_register = create_test_shift_register ()
+	start = PulseTiming (pulse_seconds = 0.0001)
+	calibration = calibrate (
+		shift_register,
+		lambda frame: shift_register.to_int () == frame,
+		timing = start,
+		number_frames = number_frames,
+		steps = 4,
+	)
+	assert calibration.timing.pulse_seconds == start.pulse_seconds / 16
+	assert shift_register.timing is calibration.timing
+	assert calibration.bits_per_second > 0
+	try:
+		calibrate (
+			shift_register,
+			lambda frame: False,
+			number_frames = number_frames,
+		)
+	except ValueError:
+		pass
+	else:
+		raise AssertionError ('A failing chain was not reported.')
+	shift_register.timing = None
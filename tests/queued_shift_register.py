@@ -0,0 +1,76 @@
+from random import getrandbits as random_getrandbits
+from threading import (
+	Event,
+	Thread,
+)
+
+from ..backends import HC595Chain
+from ..components import QueuedShiftRegister
+from .shift_register import create_test_shift_register
+
+def test_contention (number_threads = 8, number_frames = 200):
+	'''
+		Check the given number of threads writing random
+		frames, latches and clears through one queued
+		shift register leave a simulated chain holding
+		exactly what the register believes, with every
+		call completed or merged.
+	'''
+	chain = HC595Chain (16)
+	shift_register = create_test_shift_register (gpio = chain)
+	futures = []
+	def produce ():
+		for i in range (number_frames):
+			choice = random_getrandbits (4)
+			if choice == 0:
+				futures.append (queued.clear ())
+			elif choice == 1:
+				futures.append (queued.next (1, latch = True))
+			else:
+				futures.append (queued.write_int (random_getrandbits (len (shift_register))))
+	with QueuedShiftRegister (shift_register) as queued:
+		threads = [Thread (target = produce) for t in range (number_threads)]
+		for thread in threads:
+			thread.start ()
+		for thread in threads:
+			thread.join ()
+		assert queued.flush (timeout = 10)
+		chain.check (shift_register, raise_error = True)
+		queued.write_int (1).result ()
+		assert shift_register.to_int () == chain.outputs == 1
+		assert queued.number_submitted == number_threads * number_frames + 1
+		assert queued.number_run + queued.number_merged == queued.number_submitted
+	for future in futures:
+		assert future.done () and future.exception () is None
+
+def test_merge ():
+	'''
+		Check full frame writes queued back to back are
+		merged into the last, with every future given
+		its plan, but not across other calls or partial
+		writes, and that errors reach their future.
+	'''
+	shift_register = create_test_shift_register ()
+	with QueuedShiftRegister (shift_register) as queued:
+		## Hold the writer thread so calls queue up:
+		release = Event ()
+		held = queued.submit (release.wait)
+		writes = [queued.write_int (value) for value in (1, 2, 3)]
+		latch = queued.latch ()
+		partials = [queued.write_int (0, number = 1) for i in range (2)]
+		failed = queued.submit (shift_register.from_list, None)
+		release.set ()
+		assert queued.flush (timeout = 10)
+		assert queued.number_merged == 2
+		assert held.result () is True
+		assert writes[0].result () is writes[2].result ()
+		assert latch.done () and all (future.done () for future in partials)
+		assert isinstance (failed.exception (), TypeError)
+		assert shift_register.to_int () == 0b110
+	assert queued.closed
+	try:
+		queued.clear ()
+	except RuntimeError:
+		pass
+	else:
+		raise AssertionError ('A closed queued shift register took a call.')
@@ -4,15 +4,22 @@ from time import (
 	time as time_time,
 )
 
+from ..backends import FakeGPIO
 from ..components import ShiftRegister
+from ..components.shift_register import longest_overlap
 
-## Create a test shift register on pin 4 and 18:
-test_shift_register = ShiftRegister (
-	number_outputs = 16,
-	data_pin_id = 4,
-	clock_pin_id = 17,
-	latch_pin_id = 18,
-)
+def create_test_shift_register (**kwargs):
+	'''
+		Create a test shift register on pins 4, 17
+		and 18, with any other options given.
+	'''
+	return ShiftRegister (
+		number_outputs = 16,
+		data_pin_id = 4,
+		clock_pin_id = 17,
+		latch_pin_id = 18,
+		**kwargs
+	)
 
 def flash_random (shift_register, iterations, pause_seconds):
 	'''
@@ -55,5 +62,225 @@ def test_average_time (shift_register, iterations, clear = False):
 			[0 for i in range (len (shift_register) - 1)] + [1],
 		)
 		return time_time () - a
-	test_results = [test () for i in range (iterations)]
+	test_results = [test (shift_register, clear = clear) for i in range (iterations)]
 	return sum (test_results) / len (test_results)
+
+def brute_force_overlap (previous, target):
+	'''
+		Return the length of the longest suffix of the
+		target that is a prefix of the previous sequence,
+		by comparing every possible shift.
+	'''
+	for i in range (len (target) + 1):
+		if list (previous[:len (target) - i]) == list (target[i:]):
+			return len (target) - i
+
+def test_longest_overlap (iterations = 1000, max_length = 20):
+	'''
+		Check the linear overlap search against brute
+		force over the given number of random pairs.
+		Short, low entropy sequences are used so
+		overlaps of every length turn up.
+	'''
+	for i in range (iterations):
+		previous = [random_getrandbits (1) for a in range (random_getrandbits (5) % max_length)]
+		target = [random_getrandbits (1) for a in range (random_getrandbits (5) % max_length)]
+		## Make some targets overlap on purpose:
+		if random_getrandbits (1):
+			target = target[:random_getrandbits (3)] + previous[:len (target)]
+		assert longest_overlap (previous, target) == brute_force_overlap (previous, target), (
+			previous,
+			target,
+		)
+
+def test_reuse_previous (shift_register, iterations = 100):
+	'''
+		Check from_list clocks in the fewest bits the
+		brute force search says are needed to move from
+		the written data to each random frame.
+	'''
+	for i in range (iterations):
+		written = shift_register.written
+		shift = random_getrandbits (4) % (len (shift_register) + 1)
+		to_set = [random_getrandbits (1) for a in range (shift)] + list (written[:len (shift_register) - shift])
+		shift_register.latch ()
+		write_plan = shift_register.from_list (
+			to_set,
+			latch = False,
+		)
+		## Pulsing clear may have been cheaper still:
+		if write_plan.strategy != shift_register.CLEAR:
+			assert shift_register.number_unlatched == len (to_set) - brute_force_overlap (written, to_set)
+		assert shift_register.written == tuple (to_set)
+
+def test_plan (iterations = 100):
+	'''
+		Check each random frame is written with a
+		plan no costlier than a full write, and that
+		the plan's cost matches the output calls made,
+		on a shift register with a clear pin so
+		every strategy can be picked.
+	'''
+	gpio = FakeGPIO ()
+	shift_register = create_test_shift_register (
+		gpio = gpio,
+		clear_pin_id = 27,
+	)
+	strategies = set ()
+	for i in range (iterations):
+		## Shorten some frames to make them sparse:
+		to_write = random_getrandbits (len (shift_register)) >> random_getrandbits (4) % len (shift_register)
+		full_plan = shift_register.plan (
+			to_write,
+			reuse_previous = False,
+		)
+		shift_register.latch ()
+		output_calls = gpio.output_calls
+		write_plan = shift_register.from_int (
+			to_write,
+			latch = False,
+		)
+		strategies.add (write_plan.strategy)
+		assert write_plan.cost <= full_plan.cost
+		assert gpio.output_calls - output_calls == write_plan.cost
+		assert shift_register.number_unlatched == write_plan.number
+		assert shift_register.to_int (written = True) == to_write
+	assert len (strategies) > 1
+
+def test_cache (shift_register, number_frames = 4, iterations = 10):
+	'''
+		Check cycling through a few frames on the given
+		shift register (made with a cache_size of at least
+		number_frames) only misses the cache on the first
+		cycle, and still writes every frame.
+	'''
+	frames = [
+		[random_getrandbits (1) for a in range (len (shift_register))]
+		for f in range (number_frames)
+	]
+	## Settle into the cycle before counting:
+	for to_set in frames:
+		shift_register.from_list (to_set)
+	shift_register.clear_cache ()
+	for i in range (iterations):
+		for to_set in frames:
+			shift_register.from_list (to_set)
+			assert shift_register.output == tuple (to_set)
+	cache_info = shift_register.cache_info ()
+	assert cache_info.misses <= number_frames
+	assert cache_info.hits >= number_frames * (iterations - 1)
+
+def test_stats (shift_register, iterations = 100):
+	'''
+		Check the stats collected for random frames
+		count a clock pulse for every bit written and
+		a latch for every frame, then turn off.
+	'''
+	shift_register.enable_stats ()
+	bits_written = 0
+	for i in range (iterations):
+		to_set = [random_getrandbits (1) for a in range (len (shift_register))]
+		bits_written += shift_register.from_list (to_set).number
+	stats = shift_register.stats ()
+	assert stats['clock_pulses'] == bits_written
+	assert stats['latches'] == iterations
+	assert stats['calls']['from_list'] == iterations
+	shift_register.disable_stats ()
+	assert shift_register.stats () is None
+
+def test_batch (shift_register, iterations = 100):
+	'''
+		Check random writes in a batch on the given shift
+		register change nothing until it ends, then leave
+		the data full writes would with one latch, and
+		that an error in a nested batch drops only the
+		writes made in it.
+	'''
+	shift_register.enable_stats ()
+	number = len (shift_register)
+	mask = (1 << number) - 1
+	output = shift_register.output
+	expected = shift_register.to_int (written = True)
+	with shift_register.batch ():
+		for i in range (iterations):
+			choice = random_getrandbits (2)
+			if choice == 0:
+				v = random_getrandbits (1)
+				shift_register.next (v)
+				expected = ((expected << 1) | v) & mask
+			elif choice == 1:
+				pin_list = [random_getrandbits (4) % number for a in range (3)]
+				shift_register.from_pin_list (pin_list)
+				expected = sum (1 << pin for pin in set (pin_list))
+			else:
+				to_write = random_getrandbits (4) % number + 1
+				v = random_getrandbits (to_write)
+				shift_register.from_int (
+					v,
+					number = to_write,
+					latch = False,
+				)
+				expected = ((expected << to_write) | v) & mask
+			if random_getrandbits (3) == 0:
+				try:
+					with shift_register.batch ():
+						shift_register.all (shift_register.ON)
+						raise ValueError
+				except ValueError:
+					pass
+			assert shift_register.to_int (written = True) == expected
+		assert shift_register.output == output
+		assert shift_register.stats ()['latches'] == 0
+	assert shift_register.to_int () == expected
+	assert shift_register.stats ()['latches'] == 1
+	shift_register.disable_stats ()
+
+def test_sequence_types (shift_register, iterations = 20):
+	'''
+		Check writing random frames as bytes, bytearrays,
+		memoryviews and (where NumPy is installed) arrays
+		outputs the same as lists, leaving them unchanged.
+	'''
+	try:
+		import numpy
+	except ImportError:
+		numpy = None
+	for i in range (iterations):
+		to_set = [random_getrandbits (1) for a in range (len (shift_register))]
+		sequences = [
+			bytes (to_set),
+			bytearray (to_set),
+			memoryview (bytes (to_set)),
+		]
+		if numpy is not None:
+			sequences.append (numpy.array (to_set, dtype = bool))
+			sequences.append (numpy.array (to_set, dtype = numpy.uint8))
+		for sequence in sequences:
+			shift_register.clear ()
+			shift_register.from_list (sequence)
+			assert shift_register.output == tuple (to_set)
+			assert list (sequence) == to_set
+
+def test_write_frames (shift_register, number_frames = 20):
+	'''
+		Check streaming random frames, with repeats,
+		writes each change once and ends on the last,
+		emitting writes compiled up front rather than
+		planning each frame, and that a compiled write
+		from a stale state is still written right.
+	'''
+	frames = []
+	for f in range (number_frames):
+		to_set = [random_getrandbits (1) for a in range (len (shift_register))]
+		frames.extend ([to_set] * (1 + random_getrandbits (1)))
+	number_changes = 1 + sum (a != b for a, b in zip (frames, frames[1:]))
+	shift_register.enable_stats ()
+	assert shift_register.write_frames (frames, interval = 0.0001) == number_changes
+	assert shift_register.output == tuple (frames[-1])
+	assert 'from_int' not in shift_register.stats ()['calls']
+	compiled_write = shift_register.compile_writes ([1])[0]
+	shift_register.from_int (2)
+	shift_register.write_compiled (compiled_write)
+	assert shift_register.to_int () == 1
+	assert shift_register.stats ()['calls']['from_int'] == 2
+	shift_register.disable_stats ()
@@ -0,0 +1,39 @@
+from random import getrandbits as random_getrandbits
+
+from .shift_register import brute_force_overlap
+
+def common_shift (written, to_set_lists):
+	'''
+		Return the fewest bits that need shifting into
+		every chain at once, by trying every shift.
+	'''
+	number = len (to_set_lists[0])
+	for i in range (number + 1):
+		if all (
+			list (w[:number - i]) == list (to_set[i:])
+			for w, to_set in zip (written, to_set_lists)
+		):
+			return i
+
+def test_from_lists (bank, iterations = 100):
+	'''
+		Check writing random frames to every chain of
+		the given bank clocks in the fewest shared bits,
+		and leaves each chain with its own frame.
+	'''
+	for i in range (iterations):
+		written = bank.written
+		shift = random_getrandbits (4) % (len (bank) + 1)
+		to_set_lists = [
+			[random_getrandbits (1) for a in range (shift)] + list (w[:len (bank) - shift])
+			for w in written
+		]
+		bank.latch ()
+		bank.from_lists (
+			to_set_lists,
+			latch = False,
+		)
+		assert bank.number_unlatched == common_shift (written, to_set_lists)
+		for w, to_set in zip (written, to_set_lists):
+			assert bank.number_unlatched >= len (to_set) - brute_force_overlap (w, to_set)
+		assert bank.written == tuple (tuple (to_set) for to_set in to_set_lists)
@@ -0,0 +1,47 @@
+from random import getrandbits as random_getrandbits
+
+from ..backends.fake_spidev import SpiDev as FakeSpiDev
+from ..exceptions import NoDataClockControl
+from ..components import SpiShiftRegister
+
+def test_transfers (number_outputs = 20, iterations = 100):
+	'''
+		Check every write to an SPI shift register on
+		a fake device sends the whole written frame
+		in one transfer, and keeps the public state
+		the same as bit-banging would, while the
+		data and clock pins can't be bit-banged.
+	'''
+	spi = FakeSpiDev (0, 0)
+	shift_register = SpiShiftRegister (
+		number_outputs = number_outputs,
+		latch_pin_id = 18,
+		spi = spi,
+	)
+	for i in range (iterations):
+		to_set = [random_getrandbits (1) for a in range (number_outputs)]
+		number_transfers = len (spi.transfers)
+		if random_getrandbits (1):
+			shift_register.from_list (to_set)
+		else:
+			shift_register.next (to_set[0], latch = True)
+			to_set = [to_set[0]] + list (shift_register.written[1:])
+		assert len (spi.transfers) == number_transfers + 1
+		assert len (spi.transfers[-1]) == (number_outputs + 7) // 8
+		assert int.from_bytes (spi.transfers[-1], 'big') == shift_register.to_int ()
+		assert shift_register.output == tuple (to_set)
+	## The data and clock pins belong to SPI:
+	for method in (
+		shift_register.data_off,
+		shift_register.data_on,
+		shift_register.data,
+		shift_register.clock_off,
+		shift_register.clock_on,
+		shift_register.clock,
+	):
+		try:
+			method ()
+		except NoDataClockControl:
+			pass
+		else:
+			raise AssertionError ('{} drove an SPI pin.'.format (method.__name__))
@@ -0,0 +1,43 @@
+from random import getrandbits as random_getrandbits
+
+from ..backends import (
+	FakeGPIO,
+	TraceRecorder,
+	diff_traces,
+	read_trace,
+	replay,
+)
+from .shift_register import create_test_shift_register
+
+def test_record_replay (path, iterations = 50, capacity = 1024):
+	'''
+		Check a trace recorded to the given path while
+		writing random frames keeps the latest transitions
+		in order, and replays to the same pin levels.
+	'''
+	gpio = FakeGPIO (record = True)
+	trace_recorder = TraceRecorder (gpio, path, capacity = capacity)
+	shift_register = create_test_shift_register (
+		gpio = trace_recorder,
+		clear_pin_id = 22,
+	)
+	for i in range (iterations):
+		to_set = [random_getrandbits (1) for a in range (len (shift_register))]
+		shift_register.from_list (to_set)
+	trace_recorder.close ()
+	records = read_trace (path)
+	assert len (records) == min (trace_recorder.count, capacity)
+	assert all (a[0] <= b[0] for a, b in zip (records, records[1:]))
+	## Every output call made ends the trace:
+	number_outputs = sum (
+		len (call[1]) if isinstance (call[1], list) else 1
+		for call in gpio.calls if call[0] == 'output'
+	)
+	assert trace_recorder.count >= number_outputs
+	replayed = replay (records)
+	for pin, level in replayed.levels.items ():
+		assert gpio.levels[pin] == level
+	assert diff_traces (records, records) is None
+	changed = list (records)
+	changed[-1] = changed[-1][:2] + (1 - changed[-1][2],)
+	assert diff_traces (records, changed) == len (records) - 1